@@ -0,0 +1,157 @@
+#    Copyright 2017 - 2020 Alexey Stepanov aka penguinolog
+##
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+
+#         http://www.apache.org/licenses/LICENSE-2.0
+
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Per-call overhead of decorators used without braces.
+
+Compares wrapper rebuilt on every call (previous behaviour) with cached wrapper.
+Run against pure python and cython builds to compare them:
+
+    python benchmarks/bench_call_overhead.py --calls 100000
+"""
+
+from __future__ import annotations
+
+# Standard Library
+import argparse
+import asyncio
+import concurrent.futures
+import time
+import typing
+
+# Threaded Implementation
+import threaded
+from threaded import class_decorator
+
+
+def build_name() -> str:
+    """Get loaded build flavour.
+
+    :return: "cython" if compiled extensions are imported, else "python"
+    :rtype: str
+    """
+    if class_decorator.__file__.endswith((".so", ".pyd")):
+        return "cython"
+    return "python"
+
+
+def measure(call: typing.Callable[[], typing.Any], calls: int) -> float:
+    """Measure average call time.
+
+    :param call: callable to measure
+    :type call: typing.Callable[[], typing.Any]
+    :param calls: amount of calls
+    :type calls: int
+    :return: nanoseconds per call
+    :rtype: float
+    """
+    start = time.perf_counter_ns()
+    for _ in range(calls):
+        call()
+    return (time.perf_counter_ns() - start) / calls
+
+
+def bench_threadpooled(calls: int) -> tuple[float, float]:
+    """Measure ThreadPooled submit overhead.
+
+    :return: rebuilt wrapper and cached wrapper time per call in ns
+    :rtype: tuple[float, float]
+    """
+
+    def func() -> None:
+        """Do nothing."""
+
+    decorated = threaded.ThreadPooled(func)
+    futures: list[concurrent.futures.Future[typing.Any]] = []
+
+    def rebuild() -> None:
+        futures.append(decorated._get_function_wrapper(func)())
+
+    def cached() -> None:
+        futures.append(decorated())
+
+    before = measure(rebuild, calls)
+    concurrent.futures.wait(futures)
+    futures.clear()
+    after = measure(cached, calls)
+    concurrent.futures.wait(futures)
+    threaded.ThreadPooled.shutdown()
+    return before, after
+
+
+def bench_threaded(calls: int) -> tuple[float, float]:
+    """Measure Threaded thread object construction overhead.
+
+    :return: rebuilt wrapper and cached wrapper time per call in ns
+    :rtype: tuple[float, float]
+    """
+
+    def func() -> None:
+        """Do nothing."""
+
+    decorated = threaded.Threaded(func)
+
+    def rebuild() -> None:
+        decorated._get_function_wrapper(func)()
+
+    return measure(rebuild, calls), measure(decorated, calls)
+
+
+def bench_asynciotask(calls: int) -> tuple[float, float]:
+    """Measure AsyncIOTask task creation overhead.
+
+    :return: rebuilt wrapper and cached wrapper time per call in ns
+    :rtype: tuple[float, float]
+    """
+
+    async def func() -> None:
+        """Do nothing."""
+
+    loop = asyncio.new_event_loop()
+    decorated = threaded.AsyncIOTask(func, loop_getter=loop)
+    tasks: list[asyncio.Task[typing.Any]] = []
+
+    def rebuild() -> None:
+        tasks.append(decorated._get_function_wrapper(func)())
+
+    def cached() -> None:
+        tasks.append(decorated())
+
+    before = measure(rebuild, calls)
+    loop.run_until_complete(asyncio.gather(*tasks))
+    tasks.clear()
+    after = measure(cached, calls)
+    loop.run_until_complete(asyncio.gather(*tasks))
+    loop.close()
+    return before, after
+
+
+def main() -> None:
+    """Run benchmark and print results."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=20000, help="calls per measurement")
+    args = parser.parse_args()
+
+    print(f"build: {build_name()}, calls: {args.calls}")
+    print(f"{'decorator':<14}{'rebuilt, ns':>14}{'cached, ns':>14}{'saved, %':>10}")
+    for name, bench in (
+        ("ThreadPooled", bench_threadpooled),
+        ("Threaded", bench_threaded),
+        ("AsyncIOTask", bench_asynciotask),
+    ):
+        before, after = bench(args.calls)
+        print(f"{name:<14}{before:>14.0f}{after:>14.0f}{(before - after) / before * 100:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+#    Copyright 2017 - 2020 Alexey Stepanov aka penguinolog
+##
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+
+#         http://www.apache.org/licenses/LICENSE-2.0
+
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Memory of outstanding futures and submit/complete latency: concurrent.futures.Future against CompactFuture.
+
+Memory is measured by tracemalloc for the calls queued behind blocked worker (work items and futures):
+
+    python benchmarks/bench_compact_future.py --futures 1000000 --calls 100000
+"""
+
+from __future__ import annotations
+
+# Standard Library
+import argparse
+import threading
+import time
+import tracemalloc
+
+# Threaded Implementation
+import threaded
+
+
+def noop(value: int) -> int:
+    """Call without work: submit and complete overhead only.
+
+    :param value: value to return
+    :type value: int
+    :return: value
+    :rtype: int
+    """
+    return value
+
+
+def measure_memory(pool: str, futures: int) -> float:
+    """Measure memory of the outstanding calls.
+
+    :param pool: pool name
+    :type pool: str
+    :param futures: amount of outstanding calls
+    :type futures: int
+    :return: bytes per call
+    :rtype: float
+    """
+    executor = threaded.ThreadPooled.pools()[pool]
+    release = threading.Event()
+    blocker = executor.submit(release.wait, 60)
+    tracemalloc.start()
+    outstanding = [executor.submit(noop, value) for value in range(futures)]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    release.set()
+    blocker.result()
+    outstanding[-1].result()
+    return size / futures
+
+
+def measure_latency(pool: str, calls: int) -> tuple[float, float]:
+    """Measure round trip latency and throughput of the calls.
+
+    :param pool: pool name
+    :type pool: str
+    :param calls: amount of calls
+    :type calls: int
+    :return: round trip (submit and wait for result) microseconds and calls per second
+    :rtype: tuple[float, float]
+    """
+    executor = threaded.ThreadPooled.pools()[pool]
+    start = time.perf_counter()
+    for value in range(calls):
+        executor.submit(noop, value).result()
+    latency = (time.perf_counter() - start) / calls * 1e6
+
+    start = time.perf_counter()
+    for future in [executor.submit(noop, value) for value in range(calls)]:
+        future.result()
+    return latency, calls / (time.perf_counter() - start)
+
+
+def main() -> None:
+    """Run benchmark and print results."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--futures", type=int, default=1000000, help="outstanding futures for memory measurement")
+    parser.add_argument("--calls", type=int, default=100000, help="calls for latency measurement")
+    args = parser.parse_args()
+
+    print(f"futures: {args.futures}, calls: {args.calls}")
+    print(f"{'future':<16}{'bytes/call':>12}{'total MiB':>12}{'latency us':>12}{'calls/s':>10}")
+    for name, compact_futures in (("Future", False), ("CompactFuture", True)):
+        threaded.ThreadPooled.configure(max_workers=1, pool=name, compact_futures=compact_futures)
+        size = measure_memory(name, args.futures)
+        latency, throughput = measure_latency(name, args.calls)
+        total = size * args.futures / (1 << 20)
+        print(f"{name:<16}{size:>12.0f}{total:>12.1f}{latency:>12.1f}{throughput:>10.0f}")
+        threaded.ThreadPooled.shutdown(pool=name)
+
+
+if __name__ == "__main__":
+    main()
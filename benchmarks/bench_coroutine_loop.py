@@ -0,0 +1,74 @@
+#    Copyright 2017 - 2020 Alexey Stepanov aka penguinolog
+##
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+
+#         http://www.apache.org/licenses/LICENSE-2.0
+
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Throughput of coroutine functions executed by ThreadPooled.
+
+Compares new event loop per call (default) with event loop persistent for the worker thread:
+
+    python benchmarks/bench_coroutine_loop.py --calls 10000 --workers 4
+"""
+
+from __future__ import annotations
+
+# Standard Library
+import argparse
+import concurrent.futures
+import time
+
+# Threaded Implementation
+import threaded
+
+
+async def coroutine() -> None:
+    """Do nothing."""
+
+
+def measure(reuse_loop: bool, calls: int, workers: int) -> float:
+    """Measure coroutine calls throughput.
+
+    :param reuse_loop: use event loop persistent for the worker thread
+    :type reuse_loop: bool
+    :param calls: amount of calls
+    :type calls: int
+    :param workers: pool size
+    :type workers: int
+    :return: calls per second
+    :rtype: float
+    """
+    threaded.ThreadPooled.configure(max_workers=workers)
+    decorated = threaded.threadpooled(coroutine, reuse_loop=reuse_loop)
+    start = time.perf_counter()
+    concurrent.futures.wait([decorated() for _ in range(calls)])
+    elapsed = time.perf_counter() - start
+    threaded.ThreadPooled.shutdown()
+    return calls / elapsed
+
+
+def main() -> None:
+    """Run benchmark and print results."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=5000, help="calls per measurement")
+    parser.add_argument("--workers", type=int, default=4, help="pool size")
+    args = parser.parse_args()
+
+    new_loop = measure(False, args.calls, args.workers)
+    reused_loop = measure(True, args.calls, args.workers)
+    print(f"calls: {args.calls}, workers: {args.workers}")
+    print(f"{'new loop per call, calls/s':<32}{new_loop:>12.0f}")
+    print(f"{'loop per thread, calls/s':<32}{reused_loop:>12.0f}")
+    print(f"{'speedup':<32}{reused_loop / new_loop:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+#    Copyright 2017 - 2020 Alexey Stepanov aka penguinolog
+##
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+
+#         http://www.apache.org/licenses/LICENSE-2.0
+
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Throughput of CPU-bound calls in threads, processes and subinterpreters.
+
+InterpreterPooled uses threads if subinterpreters are not available (see "executor" column):
+
+    python benchmarks/bench_cpu_bound.py --workers 4 --calls 64 --size 200000
+"""
+
+from __future__ import annotations
+
+# Standard Library
+import argparse
+import time
+import typing
+
+# Threaded Implementation
+import threaded
+
+if typing.TYPE_CHECKING:
+    import concurrent.futures
+
+
+def checksum(size: int) -> int:
+    """CPU-bound function: pure python loop holding GIL.
+
+    :param size: amount of iterations
+    :type size: int
+    :return: checksum
+    :rtype: int
+    """
+    result = 0
+    for value in range(size):
+        result = (result * 31 + value) % 1000003
+    return result
+
+
+thread_checksum = threaded.threadpooled(checksum, pool="bench")
+process_checksum = threaded.processpooled(checksum, pool="bench")
+interpreter_checksum = threaded.interpreterpooled(checksum, pool="bench")
+
+
+def measure(call: typing.Callable[[int], concurrent.futures.Future[int]], calls: int, size: int) -> float:
+    """Measure throughput of the calls.
+
+    :param call: decorated function
+    :type call: typing.Callable[[int], concurrent.futures.Future[int]]
+    :param calls: amount of calls
+    :type calls: int
+    :param size: iterations per call
+    :type size: int
+    :return: calls per second
+    :rtype: float
+    """
+    call(1).result()  # Start workers
+    start = time.perf_counter()
+    for future in [call(size) for _ in range(calls)]:
+        future.result()
+    return calls / (time.perf_counter() - start)
+
+
+def main() -> None:
+    """Run benchmark and print results."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", type=int, default=4, help="pool size")
+    parser.add_argument("--calls", type=int, default=64, help="calls per decorator")
+    parser.add_argument("--size", type=int, default=200000, help="iterations per call")
+    args = parser.parse_args()
+
+    threaded.ThreadPooled.configure(max_workers=args.workers, pool="bench")
+    threaded.ProcessPooled.configure(max_workers=args.workers, pool="bench")
+    threaded.InterpreterPooled.configure(max_workers=args.workers, pool="bench")
+
+    start = time.perf_counter()
+    for _ in range(args.calls):
+        checksum(args.size)
+    serial = args.calls / (time.perf_counter() - start)
+
+    print(f"workers: {args.workers}, calls: {args.calls}, size: {args.size}")
+    print(f"{'decorator':<20}{'executor':<26}{'calls/s':>10}{'speedup':>10}")
+    print(f"{'none':<20}{'-':<26}{serial:>10.1f}{1:>10.2f}")
+    for name, call, pools in (
+        ("ThreadPooled", thread_checksum, threaded.ThreadPooled.pools),
+        ("ProcessPooled", process_checksum, threaded.ProcessPooled.pools),
+        ("InterpreterPooled", interpreter_checksum, threaded.InterpreterPooled.pools),
+    ):
+        throughput = measure(call, args.calls, args.size)
+        executor = type(pools()["bench"]).__name__
+        print(f"{name:<20}{executor:<26}{throughput:>10.1f}{throughput / serial:>10.2f}")
+
+    threaded.ThreadPooled.shutdown(pool="bench")
+    threaded.ProcessPooled.shutdown(pool="bench")
+    threaded.InterpreterPooled.shutdown(pool="bench")
+
+
+if __name__ == "__main__":
+    main()
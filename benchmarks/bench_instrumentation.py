@@ -0,0 +1,135 @@
+#    Copyright 2017 - 2020 Alexey Stepanov aka penguinolog
+##
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+
+#         http://www.apache.org/licenses/LICENSE-2.0
+
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Per-call cost of instrumentation: disabled against enabled, compared with the disabled instrumentation check.
+
+Disabled instrumentation costs single flag check per call (`check %` of the call):
+
+    python benchmarks/bench_instrumentation.py --calls 100000
+"""
+
+from __future__ import annotations
+
+# Standard Library
+import argparse
+import asyncio
+import time
+import timeit
+
+# Threaded Implementation
+import threaded
+
+
+def noop(value: int) -> int:
+    """Call without work: decorator overhead only.
+
+    :param value: value to return
+    :type value: int
+    :return: value
+    :rtype: int
+    """
+    return value
+
+
+async def async_noop(value: int) -> int:
+    """Coroutine without work: decorator overhead only.
+
+    :param value: value to return
+    :type value: int
+    :return: value
+    :rtype: int
+    """
+    return value
+
+
+def measure_check(calls: int) -> float:
+    """Measure cost of the disabled instrumentation check, as done by decorators.
+
+    :param calls: amount of checks
+    :type calls: int
+    :return: nanoseconds per check
+    :rtype: float
+    """
+    instrumentation = threaded.instrumentation
+    statement = "noop if instrumentation.enabled else noop"
+    elapsed = timeit.timeit(statement, globals={"instrumentation": instrumentation, "noop": noop}, number=calls)
+    return elapsed / calls * 1e9
+
+
+def measure_threadpooled(calls: int) -> float:
+    """Measure ThreadPooled submit and wait for results.
+
+    :param calls: amount of calls
+    :type calls: int
+    :return: nanoseconds per call
+    :rtype: float
+    """
+    func = threaded.threadpooled(noop, pool="instrumentation")
+    start = time.perf_counter()
+    for future in [func(value) for value in range(calls)]:
+        future.result()
+    return (time.perf_counter() - start) / calls * 1e9
+
+
+def measure_asynciotask(calls: int) -> float:
+    """Measure AsyncIOTask task creation and completion.
+
+    :param calls: amount of calls
+    :type calls: int
+    :return: nanoseconds per call
+    :rtype: float
+    """
+    loop = asyncio.new_event_loop()
+    func = threaded.asynciotask(async_noop, loop_getter=loop)
+
+    async def run() -> float:
+        """Create tasks and wait for completion.
+
+        :return: elapsed seconds
+        :rtype: float
+        """
+        start = time.perf_counter()
+        await asyncio.gather(*(func(value) for value in range(calls)))
+        return time.perf_counter() - start
+
+    try:
+        return loop.run_until_complete(run()) / calls * 1e9
+    finally:
+        loop.close()
+
+
+def main() -> None:
+    """Run benchmark and print results."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=100000, help="calls per measurement")
+    parser.add_argument("--repeat", type=int, default=3, help="measurements, best is reported")
+    args = parser.parse_args()
+
+    threaded.ThreadPooled.configure(max_workers=1, pool="instrumentation")
+    check = measure_check(args.calls * 10)
+    print(f"calls: {args.calls}, disabled instrumentation check: {check:.1f} ns/call")
+    print(f"{'decorator':<14}{'disabled ns':>14}{'check %':>10}{'enabled ns':>14}{'enabled +%':>12}")
+    for name, measure in (("ThreadPooled", measure_threadpooled), ("AsyncIOTask", measure_asynciotask)):
+        threaded.instrumentation.disable()
+        disabled = min(measure(args.calls) for _ in range(args.repeat))
+        threaded.instrumentation.enable()
+        enabled = min(measure(args.calls) for _ in range(args.repeat))
+        threaded.instrumentation.disable()
+        overhead = (enabled / disabled - 1) * 100
+        print(f"{name:<14}{disabled:>14.0f}{check / disabled * 100:>10.2f}{enabled:>14.0f}{overhead:>12.1f}")
+    threaded.ThreadPooled.shutdown(pool="instrumentation")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+#    Copyright 2017 - 2020 Alexey Stepanov aka penguinolog
+##
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+
+#         http://www.apache.org/licenses/LICENSE-2.0
+
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Per-call allocations and throughput of asyncio bridge: run_in_executor against submit_to_loop.
+
+Allocations are measured by tracemalloc for the calls queued behind blocked worker,
+peak includes completion of the calls:
+
+    python benchmarks/bench_loop_bridge.py --calls 10000
+"""
+
+from __future__ import annotations
+
+# Standard Library
+import argparse
+import asyncio
+import functools
+import threading
+import time
+import tracemalloc
+import typing
+
+# Threaded Implementation
+import threaded
+
+if typing.TYPE_CHECKING:
+    from collections.abc import Awaitable
+    from collections.abc import Callable
+
+    Submit = Callable[..., Awaitable[typing.Any]]
+
+
+def noop(value: int) -> int:
+    """Call without work: bridge overhead only.
+
+    :param value: value to return
+    :type value: int
+    :return: value
+    :rtype: int
+    """
+    return value
+
+
+def traced_blocks() -> int:
+    """Amount of memory blocks allocated since tracing start and still alive.
+
+    :rtype: int
+    """
+    snapshot = tracemalloc.take_snapshot().filter_traces((tracemalloc.Filter(False, tracemalloc.__file__),))
+    return sum(stat.count for stat in snapshot.statistics("filename"))
+
+
+async def measure_allocations(submit: Submit, calls: int) -> tuple[float, float, float]:
+    """Measure allocations of the queued calls.
+
+    :param submit: submit function
+    :type submit: Submit
+    :param calls: amount of calls
+    :type calls: int
+    :return: blocks, bytes and peak bytes per call
+    :rtype: tuple[float, float, float]
+    """
+    release = threading.Event()
+    blocker = submit(release.wait, 30)
+    await asyncio.sleep(0.1)
+
+    tracemalloc.start()
+    blocks: int = traced_blocks()
+    size, _ = tracemalloc.get_traced_memory()
+    futures = [submit(noop, value) for value in range(calls)]
+    blocks = traced_blocks() - blocks
+    size = tracemalloc.get_traced_memory()[0] - size
+    release.set()
+    await blocker
+    await asyncio.gather(*futures)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return blocks / calls, size / calls, peak / calls
+
+
+async def measure_throughput(submit: Submit, calls: int) -> float:
+    """Measure throughput of the calls.
+
+    :param submit: submit function
+    :type submit: Submit
+    :param calls: amount of calls
+    :type calls: int
+    :return: calls per second
+    :rtype: float
+    """
+    start = time.perf_counter()
+    await asyncio.gather(*(submit(noop, value) for value in range(calls)))
+    return calls / (time.perf_counter() - start)
+
+
+async def run(calls: int) -> None:
+    """Run benchmark and print results.
+
+    :param calls: amount of calls
+    :type calls: int
+    """
+    loop = asyncio.get_running_loop()
+    threaded.ThreadPooled.configure(max_workers=1, pool="bench")
+    executor = threaded.ThreadPooled.pools()["bench"]
+
+    def run_in_executor(fn: Callable[..., typing.Any], *args: typing.Any) -> Awaitable[typing.Any]:
+        """Bridge used by ThreadPooled before submit_to_loop.
+
+        :return: awaitable for the call result
+        :rtype: Awaitable[typing.Any]
+        """
+        return loop.run_in_executor(executor, functools.partial(fn, *args))
+
+    submit_to_loop: Submit = functools.partial(executor.submit_to_loop, loop)
+
+    print(f"calls: {calls}")
+    print(f"{'bridge':<18}{'blocks/call':>12}{'bytes/call':>12}{'peak/call':>12}{'calls/s':>10}")
+    for name, submit in (("run_in_executor", run_in_executor), ("submit_to_loop", submit_to_loop)):
+        blocks, size, peak = await measure_allocations(submit, calls)
+        throughput = await measure_throughput(submit, calls)
+        print(f"{name:<18}{blocks:>12.1f}{size:>12.0f}{peak:>12.0f}{throughput:>10.0f}")
+
+    threaded.ThreadPooled.shutdown(pool="bench")
+
+
+def main() -> None:
+    """Parse arguments and run benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=10000, help="calls per bridge")
+    args = parser.parse_args()
+    asyncio.run(run(args.calls))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+#    Copyright 2017 - 2020 Alexey Stepanov aka penguinolog
+##
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+
+#         http://www.apache.org/licenses/LICENSE-2.0
+
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Latency of high priority calls under saturating low priority load.
+
+Compares FIFO pool with prioritized pool:
+
+    python benchmarks/bench_priority.py --workers 4 --samples 200
+"""
+
+from __future__ import annotations
+
+# Standard Library
+import argparse
+import time
+import typing
+
+# Threaded Implementation
+import threaded
+
+if typing.TYPE_CHECKING:
+    import concurrent.futures
+
+
+def percentile(values: list[float], percent: float) -> float:
+    """Get percentile of values.
+
+    :param values: measured values
+    :type values: list[float]
+    :param percent: percentile
+    :type percent: float
+    :return: percentile value
+    :rtype: float
+    """
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * percent / 100))]
+
+
+def measure(prioritized: bool, workers: int, samples: int, backlog: int) -> list[float]:
+    """Measure queue latency of high priority calls.
+
+    :param prioritized: use prioritized pool
+    :type prioritized: bool
+    :param workers: pool size
+    :type workers: int
+    :param samples: amount of high priority calls
+    :type samples: int
+    :param backlog: amount of low priority calls kept queued
+    :type backlog: int
+    :return: latencies in milliseconds
+    :rtype: list[float]
+    """
+    threaded.ThreadPooled.configure(max_workers=workers, pool="bench", prioritized=prioritized)
+
+    @threaded.threadpooled(pool="bench", priority=10)
+    def bulk() -> None:
+        time.sleep(0.001)
+
+    @threaded.threadpooled(pool="bench", priority=0)
+    def interactive(submitted: float) -> float:
+        return (time.perf_counter() - submitted) * 1000
+
+    executor = threaded.ThreadPooled.pools()["bench"]
+    pending: list[concurrent.futures.Future[float]] = []
+    for _ in range(samples):
+        while executor.queue_size < backlog:
+            bulk()
+        pending.append(interactive(time.perf_counter()))
+        time.sleep(0.002)
+    latencies = [future.result() for future in pending]
+    threaded.ThreadPooled.shutdown(pool="bench")
+    return latencies
+
+
+def main() -> None:
+    """Run benchmark and print results."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", type=int, default=4, help="pool size")
+    parser.add_argument("--samples", type=int, default=200, help="high priority calls")
+    parser.add_argument("--backlog", type=int, default=100, help="low priority calls kept queued")
+    args = parser.parse_args()
+
+    print(f"workers: {args.workers}, samples: {args.samples}, backlog: {args.backlog}")
+    print(f"{'pool':<14}{'p50, ms':>10}{'p99, ms':>10}")
+    for name, prioritized in (("fifo", False), ("prioritized", True)):
+        latencies = measure(prioritized, args.workers, args.samples, args.backlog)
+        print(f"{name:<14}{percentile(latencies, 50):>10.2f}{percentile(latencies, 99):>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+#    Copyright 2017 - 2020 Alexey Stepanov aka penguinolog
+##
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+
+#         http://www.apache.org/licenses/LICENSE-2.0
+
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Scaling of CPU-bound ThreadPooled calls from 1 to N workers.
+
+On free-threaded build (python3.13t and later) throughput grows with workers up to the cores count,
+with GIL it stays flat:
+
+    python3.13t benchmarks/bench_thread_scaling.py --max-workers 8 --calls-per-worker 8
+"""
+
+from __future__ import annotations
+
+# Standard Library
+import argparse
+import os
+import sys
+import sysconfig
+import time
+
+# Threaded Implementation
+import threaded
+
+
+def checksum(size: int) -> int:
+    """CPU-bound function: pure python loop.
+
+    :param size: amount of iterations
+    :type size: int
+    :return: checksum
+    :rtype: int
+    """
+    result = 0
+    for value in range(size):
+        result = (result * 31 + value) % 1000003
+    return result
+
+
+def gil_state() -> str:
+    """Get GIL state of the interpreter.
+
+    :return: description of the build and GIL state
+    :rtype: str
+    """
+    if not sysconfig.get_config_var("Py_GIL_DISABLED"):
+        return "GIL build"
+    if getattr(sys, "_is_gil_enabled", lambda: True)():
+        return "free-threaded build, GIL enabled"
+    return "free-threaded build, GIL disabled"
+
+
+def measure(workers: int, calls: int, size: int) -> float:
+    """Measure throughput of the calls.
+
+    :param workers: pool size
+    :type workers: int
+    :param calls: amount of calls
+    :type calls: int
+    :param size: iterations per call
+    :type size: int
+    :return: calls per second
+    :rtype: float
+    """
+    threaded.ThreadPooled.configure(max_workers=workers, pool="bench", min_workers=workers)
+    call = threaded.threadpooled(checksum, pool="bench")
+    start = time.perf_counter()
+    for future in [call(size) for _ in range(calls)]:
+        future.result()
+    throughput = calls / (time.perf_counter() - start)
+    threaded.ThreadPooled.shutdown(pool="bench")
+    return throughput
+
+
+def main() -> None:
+    """Run benchmark and print results."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1, help="maximum pool size")
+    parser.add_argument("--calls-per-worker", type=int, default=8, help="calls per worker")
+    parser.add_argument("--size", type=int, default=200000, help="iterations per call")
+    args = parser.parse_args()
+
+    print(f"{gil_state()}, cpu: {os.cpu_count()}, size: {args.size}")
+    print(f"{'workers':<10}{'calls/s':>10}{'speedup':>10}{'efficiency':>12}")
+    single: float | None = None
+    for workers in range(1, args.max_workers + 1):
+        throughput = measure(workers, workers * args.calls_per_worker, args.size)
+        single = single or throughput
+        speedup = throughput / single
+        print(f"{workers:<10}{throughput:>10.1f}{speedup:>10.2f}{speedup / workers:>12.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -30,6 +30,7 @@ import setuptools
 try:
     # noinspection PyPackageRequirements
     from Cython.Build import cythonize
+    from Cython.Compiler import Options
 except ImportError:
     cythonize = None
 
@@ -50,6 +51,20 @@ if cythonize is not None:
         setuptools.Extension("threaded._asynciotask", ["threaded/_asynciotask.pyx"]),
         setuptools.Extension("threaded._threaded", ["threaded/_threaded.pyx"]),
         setuptools.Extension("threaded._threadpooled", ["threaded/_threadpooled.py"]),
+        setuptools.Extension("threaded._compact_future", ["threaded/_compact_future.py"]),
+        setuptools.Extension("threaded._instrumentation", ["threaded/_instrumentation.py"]),
+        setuptools.Extension("threaded._interpreterpooled", ["threaded/_interpreterpooled.py"]),
+        setuptools.Extension("threaded._loop_bridge", ["threaded/_loop_bridge.py"]),
+        setuptools.Extension("threaded._loop_monitor", ["threaded/_loop_monitor.py"]),
+        setuptools.Extension("threaded._pipeline", ["threaded/_pipeline.py"]),
+        setuptools.Extension("threaded._processpooled", ["threaded/_processpooled.py"]),
+        setuptools.Extension("threaded._rate_limit", ["threaded/_rate_limit.py"]),
+        setuptools.Extension("threaded._result_cache", ["threaded/_result_cache.py"]),
+        setuptools.Extension("threaded._shared_memory", ["threaded/_shared_memory.py"]),
+        setuptools.Extension("threaded._timer", ["threaded/_timer.py"]),
+        setuptools.Extension("threaded._watchdog", ["threaded/_watchdog.py"]),
+        setuptools.Extension("threaded._work_queue", ["threaded/_work_queue.py"]),
+        setuptools.Extension("threaded.metrics", ["threaded/metrics.py"]),
     ]
     if sys.platform != "win32":
         # NOTE: Do not make pyx/pxd - it kills windows
@@ -59,15 +74,20 @@ if cythonize is not None:
 
     INTERFACES = ["class_decorator.pxd", "_asynciotask.pxd", "_threaded.pxd"]
 
+    COMPILER_DIRECTIVES = dict(  # noqa: C408
+        always_allow_keywords=True,
+        binding=True,
+        embedsignature=True,
+        overflowcheck=True,
+        language_level=3,
+    )
+    if "freethreading_compatible" in Options.directive_types:
+        # Shared state is protected by locks, GIL is not required: do not re-enable it on free-threaded build
+        COMPILER_DIRECTIVES["freethreading_compatible"] = True
+
     EXT_MODULES = cythonize(
         module_list=REQUIRES_OPTIMIZATION,
-        compiler_directives=dict(  # noqa: C408
-            always_allow_keywords=True,
-            binding=True,
-            embedsignature=True,
-            overflowcheck=True,
-            language_level=3,
-        ),
+        compiler_directives=COMPILER_DIRECTIVES,
     )
 else:
     REQUIRES_OPTIMIZATION = []
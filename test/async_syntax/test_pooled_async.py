@@ -75,6 +75,181 @@ class TestThreadPooled(unittest.TestCase):
         pooled_name = loop.run_until_complete(asyncio.wait_for(test(loop), 1))
         self.assertNotEqual(pooled_name, threading.current_thread().name)
 
+    def test_thread_pooled_map_loop(self):
+        loop = asyncio.get_event_loop()
+
+        @threaded.threadpooled(loop_getter=loop)
+        async def test(value):
+            return value * 2
+
+        async def collect(results):
+            return [value async for value in results]
+
+        self.assertEqual(loop.run_until_complete(collect(test.map(range(10), chunksize=3))), list(range(0, 20, 2)))
+        results = loop.run_until_complete(collect(test.imap_unordered(range(10))))
+        self.assertEqual(sorted(results), list(range(0, 20, 2)))
+
+        cache = threaded.ResultCache()
+        cached = threaded.threadpooled(test.__wrapped__, loop_getter=loop, cache=cache)
+        self.assertEqual(loop.run_until_complete(collect(cached.map([1, 2]))), [2, 4])
+        results = loop.run_until_complete(collect(cached.imap_unordered([1, 2, 3])))
+        self.assertEqual(sorted(results), [2, 4, 6])
+        self.assertEqual((cache.hits, cache.misses), (2, 3))
+
+    def test_thread_pooled_shard_key_loop(self):
+        loop = asyncio.get_event_loop()
+        calls = []
+
+        @threaded.threadpooled(loop_getter=loop, shard_key=lambda key, value: key)
+        async def test(key, value):
+            await asyncio.sleep(0.001)
+            calls.append((key, value))
+            return value
+
+        async def run():
+            return await asyncio.gather(*(test(value % 2, value) for value in range(10)))
+
+        self.assertEqual(loop.run_until_complete(run()), list(range(10)))
+        for key in (0, 1):
+            self.assertEqual([value for call_key, value in calls if call_key == key], list(range(key, 10, 2)))
+
+    def test_thread_pooled_coalesce_loop(self):
+        loop = asyncio.get_event_loop()
+        calls = []
+
+        @threaded.threadpooled(loop_getter=loop, coalesce=True)
+        async def test(value):
+            calls.append(value)
+            await asyncio.sleep(0.01)
+            return value
+
+        async def run():
+            return await asyncio.gather(test(1), test(1), test(2))
+
+        self.assertEqual(loop.run_until_complete(run()), [1, 1, 2])
+        self.assertEqual(sorted(calls), [1, 2])
+
+    def test_thread_pooled_coalesce_loop_cancel(self):
+        loop = asyncio.get_event_loop()
+        release = threading.Event()
+        calls = []
+
+        @threaded.threadpooled(loop_getter=loop, coalesce=True)
+        def test(value):
+            calls.append(value)
+            release.wait(5)
+            return value
+
+        async def run():
+            waiter = asyncio.ensure_future(test(1))
+            with self.assertRaises(asyncio.TimeoutError):
+                await asyncio.wait_for(test(1), 0.01)  # Cancels own future of the caller only
+            release.set()
+            return await waiter
+
+        self.assertEqual(loop.run_until_complete(run()), 1)
+        self.assertEqual(calls, [1])
+
+    def test_thread_pooled_cache_loop(self):
+        loop = asyncio.get_event_loop()
+        cache = threaded.ResultCache()
+
+        @threaded.threadpooled(loop_getter=loop, cache=cache)
+        async def test(value):
+            return value
+
+        self.assertEqual(loop.run_until_complete(test(1)), 1)
+        future = test(1)
+        self.assertTrue(future.done())
+        self.assertEqual(loop.run_until_complete(future), 1)
+        self.assertEqual(cache.hits, 1)
+
+    def test_thread_pooled_cancel_loop(self):
+        threaded.ThreadPooled.configure(max_workers=1, pool="cancel_loop")
+        loop = asyncio.get_event_loop()
+        release = threading.Event()
+        calls = []
+
+        @threaded.threadpooled(loop_getter=loop, pool="cancel_loop")
+        def block():
+            release.wait(5)
+
+        @threaded.threadpooled(loop_getter=loop, pool="cancel_loop")
+        def test():
+            calls.append(1)
+
+        async def run():
+            blocker = block()
+            queued = test()
+            await asyncio.sleep(0)
+            queued.cancel()
+            await asyncio.sleep(0)
+            release.set()
+            await blocker
+            await test()
+
+        loop.run_until_complete(run())
+        self.assertEqual(calls, [1])
+
+    def test_submit_to_loop(self):
+        threaded.ThreadPooled.configure(max_workers=1, pool="loop_bridge", max_queue=2, queue_policy="drop_oldest")
+        executor = threaded.ThreadPooled.pools()["loop_bridge"]
+        loop = asyncio.get_event_loop()
+        release = threading.Event()
+
+        @threaded.threadpooled(loop_getter=loop)
+        def power(value):
+            if value < 0:
+                raise ValueError(value)
+            return 2**value
+
+        async def run():
+            blocker = executor.submit_to_loop(loop, release.wait, 5)
+            await asyncio.sleep(0.05)
+            dropped = executor.submit_to_loop(loop, pow, 2, 2)
+            with threaded.call_timeout(0.05):
+                expired = executor.submit_to_loop(loop, pow, 2, 3)
+            queued = executor.submit_to_loop(loop, pow, 2, 4)
+            await asyncio.sleep(0.2)
+            release.set()
+            self.assertTrue(await blocker)
+            self.assertEqual(await queued, 16)
+            self.assertTrue(dropped.cancelled())
+            self.assertTrue(expired.cancelled())
+            self.assertEqual(executor.expired_count, 1)
+            self.assertEqual(await asyncio.gather(*(power(value) for value in range(8))), [2**x for x in range(8)])
+            with self.assertRaises(ValueError):
+                await power(-1)
+
+        loop.run_until_complete(run())
+        threaded.ThreadPooled.shutdown(pool="loop_bridge")
+        with self.assertRaises(RuntimeError):
+            executor.submit_to_loop(loop, pow, 2, 2)
+
+    def test_thread_pooled_reuse_loop(self):
+        threaded.ThreadPooled.configure(max_workers=1)
+
+        @threaded.threadpooled(reuse_loop=True)
+        async def test():
+            return asyncio.get_running_loop()
+
+        loop = test().result()
+        self.assertIs(test().result(), loop)
+        self.assertFalse(loop.is_closed())
+        threaded.ThreadPooled.shutdown()
+        self.assertTrue(loop.is_closed())
+
+    def test_thread_pooled_new_loop(self):
+        threaded.ThreadPooled.configure(max_workers=1)
+
+        @threaded.threadpooled
+        async def test():
+            return asyncio.get_running_loop()
+
+        loop = test().result()
+        self.assertTrue(loop.is_closed())
+        self.assertIsNot(test().result(), loop)
+
 
 class TestAsyncIOTask(unittest.TestCase):
     def test_default(self):
@@ -94,3 +269,58 @@ class TestAsyncIOTask(unittest.TestCase):
         loop = asyncio.get_event_loop()
         res = loop.run_until_complete(asyncio.wait_for(test(), 1))
         self.assertEqual(res, "test")
+
+    def test_method(self):
+        loop = asyncio.get_event_loop()
+
+        class Target:
+            @threaded.AsyncIOTask
+            async def method(self):
+                return self
+
+        target = Target()
+        res = loop.run_until_complete(asyncio.wait_for(target.method(), 1))
+        self.assertIs(res, target)
+
+    def test_cache(self):
+        loop = asyncio.get_event_loop()
+        cache = threaded.ResultCache(ttl=60)
+        calls = []
+
+        @threaded.asynciotask(cache=cache)
+        async def test(value):
+            calls.append(value)
+            return value
+
+        self.assertEqual(loop.run_until_complete(test(1)), 1)
+        future = test(1)
+        self.assertTrue(future.done())  # Resolved without event loop
+        self.assertEqual(loop.run_until_complete(future), 1)
+        self.assertEqual(calls, [1])
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+        @threaded.asynciotask(cache=cache)
+        async def negate(value):
+            return -value
+
+        self.assertEqual(loop.run_until_complete(negate(1)), -1)  # Shared cache: function is a part of the key
+
+    def test_rate_limit(self):
+        loop = asyncio.get_event_loop()
+        limiter = threaded.RateLimiter(1, 0.05)
+        started = []
+
+        @threaded.asynciotask(rate_limit=limiter)
+        async def test():
+            started.append(loop.time())
+
+        async def run():
+            futures = [test() for _ in range(3)]
+            # Throttled calls are waiting in the timer, not as tasks
+            self.assertEqual(len(asyncio.all_tasks()), 2)
+            await asyncio.gather(*futures)
+
+        loop.run_until_complete(run())
+        self.assertEqual(len(started), 3)
+        self.assertGreaterEqual(started[2] - started[0], 0.09)
+        self.assertEqual(limiter.throttled, 2)
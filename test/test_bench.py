@@ -0,0 +1,78 @@
+#    Copyright 2017 - 2020 Alexey Stepanov aka penguinolog
+##
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+# Standard Library
+import contextlib
+import io
+import json
+import pathlib
+import tempfile
+import unittest
+
+# Threaded Implementation
+from threaded import bench
+
+
+class TestBench(unittest.TestCase):
+    def test_run(self):
+        measurements = bench.run(20, repeat=1)
+        self.assertIn("threadpooled.submit", measurements)
+        self.assertIn("threadpooled.throughput[workers=16]", measurements)
+        self.assertIn("threaded.start_join", measurements)
+        self.assertIn("asynciotask.create", measurements)
+        self.assertIn("threadpooled.memory[compact_futures]", measurements)
+        for measurement in measurements.values():
+            self.assertGreater(measurement.value, 0, measurement)
+
+    def test_compare(self):
+        baseline = {
+            "latency": bench.Measurement("latency", 100.0, "ns/call"),
+            "throughput": bench.Measurement("throughput", 100.0, "calls/s", True),
+            "removed": bench.Measurement("removed", 100.0, "ns/call"),
+        }
+        current = {
+            "latency": bench.Measurement("latency", 130.0, "ns/call"),
+            "throughput": bench.Measurement("throughput", 130.0, "calls/s", True),
+            "added": bench.Measurement("added", 100.0, "ns/call"),
+        }
+        comparisons = {item.name: item for item in bench.compare(current, baseline, 0.2)}
+        self.assertEqual({"latency", "throughput"}, set(comparisons))
+        self.assertTrue(comparisons["latency"].regression)
+        self.assertFalse(comparisons["throughput"].regression)
+        self.assertAlmostEqual(0.3, comparisons["throughput"].change)
+
+        current["throughput"] = bench.Measurement("throughput", 70.0, "calls/s", True)
+        self.assertTrue(
+            next(item for item in bench.compare(current, baseline, 0.2) if item.name == "throughput").regression
+        )
+
+    def test_main_baseline(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = pathlib.Path(directory) / "baseline.json"
+            with contextlib.redirect_stdout(io.StringIO()):
+                self.assertEqual(
+                    0, bench.main(["--calls", "20", "--repeat", "1", "--only", "asynciotask", "--json", str(path)])
+                )
+            document = json.loads(path.read_text(encoding="utf-8"))
+            self.assertIn(document["environment"]["build"], {"python", "cython"})
+            self.assertEqual({"asynciotask.create", "asynciotask.complete"}, set(document["results"]))
+
+            for result in document["results"].values():
+                result["value"] /= 1000  # Baseline was much faster
+            path.write_text(json.dumps(document), encoding="utf-8")
+            output = io.StringIO()
+            with contextlib.redirect_stdout(output):
+                code = bench.main(["--calls", "20", "--repeat", "1", "--only", "asynciotask", "--baseline", str(path)])
+            self.assertEqual(1, code)
+            self.assertIn("REGRESSION", output.getvalue())
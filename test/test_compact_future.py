@@ -0,0 +1,113 @@
+#    Copyright 2017 - 2020 Alexey Stepanov aka penguinolog
+##
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+# Standard Library
+import asyncio
+import concurrent.futures
+import threading
+import unittest
+
+# Threaded Implementation
+from threaded._compact_future import CompactFuture
+
+
+def complete_later(future, result, delay=0.05):
+    def complete():
+        future.set_running_or_notify_cancel()
+        future.set_result(result)
+
+    timer = threading.Timer(delay, complete)
+    timer.start()
+    return timer
+
+
+class TestCompactFuture(unittest.TestCase):
+    def test_result(self):
+        future = CompactFuture()
+        self.assertFalse(future.done())
+        with self.assertRaises(concurrent.futures.TimeoutError):
+            future.result(timeout=0)
+        complete_later(future, 1)
+        self.assertEqual(future.result(timeout=5), 1)
+        self.assertIsNone(future.exception())
+        self.assertTrue(future.done())
+        self.assertIn("returned int", repr(future))
+        with self.assertRaises(concurrent.futures.InvalidStateError):
+            future.set_result(2)
+
+    def test_exception(self):
+        future = CompactFuture()
+        self.assertTrue(future.set_running_or_notify_cancel())
+        self.assertTrue(future.running())
+        future.set_exception(ValueError("fail"))
+        self.assertIsInstance(future.exception(), ValueError)
+        with self.assertRaises(ValueError):
+            future.result()
+        self.assertIn("raised ValueError", repr(future))
+
+    def test_cancel(self):
+        future = CompactFuture()
+        called = []
+        future.add_done_callback(called.append)
+        self.assertTrue(future.cancel())
+        self.assertTrue(future.cancel())
+        self.assertTrue(future.cancelled())
+        self.assertEqual(called, [future])
+        self.assertFalse(future.set_running_or_notify_cancel())
+        with self.assertRaises(concurrent.futures.CancelledError):
+            future.result()
+
+        running = CompactFuture()
+        running.set_running_or_notify_cancel()
+        self.assertFalse(running.cancel())
+        with self.assertRaises(RuntimeError):
+            running.set_running_or_notify_cancel()
+
+    def test_callbacks(self):
+        future = CompactFuture()
+        called = []
+
+        def fail(_):
+            raise RuntimeError("callback")
+
+        future.add_done_callback(fail)
+        future.add_done_callback(called.append)
+        with self.assertLogs("concurrent.futures", level="ERROR"):
+            future.set_result(1)
+        self.assertEqual(called, [future])
+        future.add_done_callback(called.append)
+        self.assertEqual(called, [future, future])
+
+    def test_wait(self):
+        futures = [CompactFuture() for _ in range(3)]
+        for index, future in enumerate(futures):
+            complete_later(future, index, delay=0.02 * (3 - index))
+        self.assertEqual([future.result() for future in concurrent.futures.as_completed(futures, timeout=5)], [2, 1, 0])
+
+        pending = CompactFuture()
+        cancelled = CompactFuture()
+        cancelled.cancel()
+        threading.Timer(0.05, cancelled.set_running_or_notify_cancel).start()
+        done, not_done = concurrent.futures.wait([pending, cancelled], timeout=0.5)
+        self.assertEqual((done, not_done), ({cancelled}, {pending}))
+
+    def test_wrap_future(self):
+        async def wait(future):
+            return await asyncio.wrap_future(future)
+
+        loop = asyncio.new_event_loop()  # Private loop: asyncio.run() would reset current event loop of the thread
+        self.addCleanup(loop.close)
+        future = CompactFuture()
+        complete_later(future, "result")
+        self.assertEqual(loop.run_until_complete(wait(future)), "result")
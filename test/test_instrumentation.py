@@ -0,0 +1,162 @@
+#    Copyright 2017 - 2020 Alexey Stepanov aka penguinolog
+##
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+# Standard Library
+import asyncio
+import threading
+import time
+import unittest
+
+# Threaded Implementation
+import threaded
+from threaded._instrumentation import Histogram
+from threaded._instrumentation import qualified_name
+
+
+class TestHistogram(unittest.TestCase):
+    def test_record(self):
+        histogram = Histogram()
+        self.assertEqual(histogram.quantile(0.5), 0.0)
+        for value in (0.001, 0.002, 0.003, 0.1):
+            histogram.record(value)
+        self.assertEqual(histogram.count, 4)
+        self.assertAlmostEqual(histogram.total, 0.106)
+        self.assertEqual(histogram.min, 0.001)
+        self.assertEqual(histogram.max, 0.1)
+        self.assertAlmostEqual(histogram.mean, 0.0265)
+        self.assertEqual(sum(count for _, count in histogram.buckets()), 4)
+        # Upper bound of the bucket: relative error is less than 25%
+        median = histogram.quantile(0.5)
+        self.assertGreater(median, 0.002)
+        self.assertLess(median, 0.002 * 1.25)
+        self.assertEqual(histogram.quantile(1), 0.1)
+        with self.assertRaises(ValueError):
+            histogram.quantile(2)
+
+    def test_fixed_memory(self):
+        histogram = Histogram()
+        for value in (0, 1e-9, 1e6):  # Longer than the last bucket is counted in it
+            histogram.record(value)
+        bounds = [bound for bound, _ in histogram.buckets()]
+        self.assertEqual(len(bounds), 3)
+        self.assertEqual(bounds, sorted(bounds))
+        histogram.reset()
+        self.assertEqual((histogram.count, histogram.buckets()), (0, ()))
+
+
+class TestInstrumentation(unittest.TestCase):
+    def setUp(self):
+        threaded.instrumentation.enable()
+
+    def tearDown(self):
+        threaded.instrumentation.disable()
+        threaded.instrumentation.reset()
+
+    def test_threadpooled(self):
+        release = threading.Event()
+
+        @threaded.threadpooled
+        def blocked():
+            release.wait(5)
+
+        @threaded.threadpooled
+        def failed():
+            raise ValueError("fail")
+
+        future = blocked()
+        stats = threaded.instrumentation.stats()[qualified_name(blocked)]
+        for _ in range(100):
+            if stats.in_flight:
+                break
+            time.sleep(0.01)
+        self.assertEqual((stats.in_flight, stats.calls), (1, 0))
+        release.set()
+        future.result()
+        self.assertEqual((stats.in_flight, stats.calls, stats.exceptions), (0, 1, 0))
+        self.assertEqual((stats.queue_wait.count, stats.run_time.count), (1, 1))
+
+        with self.assertRaises(ValueError):
+            failed().result()
+        self.assertEqual(threaded.instrumentation.stats()[qualified_name(failed)].exceptions, 1)
+
+    def test_threadpooled_map(self):
+        @threaded.threadpooled
+        def test(value):
+            return value
+
+        self.assertEqual(list(test.map(range(5), chunksize=2)), list(range(5)))
+        stats = threaded.instrumentation.stats()[qualified_name(test)]
+        self.assertEqual((stats.calls, stats.queue_wait.count, stats.run_time.count), (5, 5, 5))
+
+    def test_queue_wait(self):
+        release = threading.Event()
+        threaded.ThreadPooled.configure(max_workers=1, pool="instrumentation")
+
+        @threaded.threadpooled(pool="instrumentation")
+        def func(event):
+            event.wait(5)
+
+        blocker = func(release)
+        done = threading.Event()
+        done.set()
+        waiting = func(done)
+        time.sleep(0.1)
+        release.set()
+        waiting.result()
+        blocker.result()
+        threaded.ThreadPooled.shutdown(pool="instrumentation")
+
+        stats = threaded.instrumentation.stats()[qualified_name(func)]
+        self.assertEqual(stats.calls, 2)
+        self.assertGreaterEqual(stats.queue_wait.max, 0.09)
+        self.assertGreaterEqual(stats.run_time.max, 0.09)
+
+    def test_threaded(self):
+        @threaded.threaded(started=True)
+        def func():
+            pass
+
+        func().join()
+        stats = threaded.instrumentation.stats()[qualified_name(func)]
+        self.assertEqual((stats.calls, stats.in_flight), (1, 0))
+
+    def test_asynciotask(self):
+        loop = asyncio.new_event_loop()
+
+        @threaded.asynciotask(loop_getter=loop)
+        async def func():
+            await asyncio.sleep(0.05)
+
+        try:
+            loop.run_until_complete(func())
+        finally:
+            loop.close()
+        stats = threaded.instrumentation.stats()[qualified_name(func)]
+        self.assertEqual(stats.calls, 1)
+        self.assertGreaterEqual(stats.run_time.max, 0.04)
+
+    def test_disabled(self):
+        threaded.instrumentation.disable()
+
+        @threaded.threadpooled
+        def func():
+            pass
+
+        func().result()
+        self.assertNotIn(qualified_name(func), threaded.instrumentation.stats())
+        threaded.instrumentation.enable()
+        func().result()
+        self.assertEqual(threaded.instrumentation.stats()[qualified_name(func)].calls, 1)
+        threaded.instrumentation.reset()
+        self.assertEqual(threaded.instrumentation.stats()[qualified_name(func)].calls, 0)
@@ -0,0 +1,73 @@
+#    Copyright 2017 - 2020 Alexey Stepanov aka penguinolog
+##
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+# Standard Library
+import asyncio
+import concurrent.futures
+import unittest
+
+# Threaded Implementation
+import threaded
+from threaded import _interpreterpooled
+from threaded import _threadpooled
+
+
+@threaded.interpreterpooled
+def square(value):
+    return value * value
+
+
+def cube(value):
+    return value**3
+
+
+@threaded.InterpreterPooled
+async def coroutine(value):
+    await asyncio.sleep(0)
+    return value
+
+
+class TestInterpreterPooled(unittest.TestCase):
+    def tearDown(self):
+        threaded.InterpreterPooled.shutdown()
+
+    def test_call(self):
+        self.assertEqual(square(3).result(timeout=30), 9)
+        self.assertEqual(coroutine(1).result(timeout=30), 1)
+
+    def test_loop(self):
+        loop = asyncio.new_event_loop()
+        self.addCleanup(loop.close)
+        self.assertEqual(loop.run_until_complete(threaded.interpreterpooled(cube, loop_getter=loop)(2)), 8)
+
+    def test_executor(self):
+        threaded.InterpreterPooled.configure(max_workers=2, pool="interpreters")
+        executor = threaded.InterpreterPooled.pools()["interpreters"]
+        if _interpreterpooled.INTERPRETERS_AVAILABLE:
+            self.assertIsInstance(executor, concurrent.futures.InterpreterPoolExecutor)
+        else:
+            self.assertIsInstance(executor, _threadpooled.ThreadPoolExecutor)
+        threaded.InterpreterPooled.configure(max_workers=2, pool="interpreters")
+        self.assertIs(executor, threaded.InterpreterPooled.pools()["interpreters"])
+        threaded.InterpreterPooled.configure(max_workers=1, pool="interpreters")
+        self.assertIsNot(executor, threaded.InterpreterPooled.pools()["interpreters"])
+        threaded.InterpreterPooled.configure(pool="interpreters")
+        executor = threaded.InterpreterPooled.pools()["interpreters"]
+        threaded.InterpreterPooled.configure(pool="interpreters")  # Default workers count is not changed
+        self.assertIs(executor, threaded.InterpreterPooled.pools()["interpreters"])
+
+        pooled = threaded.interpreterpooled(pool="interpreters")
+        threaded.InterpreterPooled.shutdown(pool="interpreters")
+        self.assertIsNot(pooled.executor, executor)
+        self.assertEqual(pooled(cube)(3).result(timeout=30), 27)
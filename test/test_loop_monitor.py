@@ -0,0 +1,121 @@
+#    Copyright 2017 - 2020 Alexey Stepanov aka penguinolog
+##
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+# Standard Library
+import asyncio
+import gc
+import time
+import unittest
+import weakref
+from unittest import mock
+
+# Threaded Implementation
+import threaded
+from threaded import _loop_monitor
+from threaded._instrumentation import qualified_name
+
+
+def blocking_work():
+    time.sleep(0.3)
+
+
+class TestLoopMonitor(unittest.TestCase):
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+
+    def tearDown(self):
+        self.loop.close()
+
+    def test_blocking_call(self):
+        @threaded.asynciotask(loop_getter=self.loop)
+        async def blocker():
+            await asyncio.sleep(0.1)
+            blocking_work()
+
+        reported = []
+        monitor = threaded.LoopMonitor(self.loop, interval=0.02, threshold=0.1, callback=reported.append).start()
+        try:
+            self.loop.run_until_complete(blocker())
+            self.loop.run_until_complete(asyncio.sleep(0.1))  # Heartbeat after blocking call
+        finally:
+            monitor.stop()
+        self.assertFalse(monitor.running)
+
+        calls = monitor.blocking_calls()
+        self.assertEqual(calls, tuple(reported))
+        self.assertEqual(len(calls), 1)
+        call = calls[0]
+        self.assertEqual(call.function, qualified_name(blocker))
+        self.assertEqual(call.coroutine, blocker.__wrapped__.__qualname__)
+        self.assertIsNotNone(call.task)
+        self.assertIn("blocking_work", call.stack)
+        self.assertGreaterEqual(call.duration, 0.2)
+        self.assertGreaterEqual(monitor.lag.max, 0.2)
+        self.assertGreater(monitor.lag.count, 1)
+
+        monitor.reset()
+        self.assertEqual((monitor.blocking_calls(), monitor.lag.count), ((), 0))
+
+    def test_capacity(self):
+        async def main():
+            for _ in range(3):
+                blocking_work()
+                await asyncio.sleep(0.05)
+
+        monitor = threaded.LoopMonitor(self.loop, interval=0.02, threshold=0.1, capacity=2, callback=id).start()
+        try:
+            self.loop.run_until_complete(main())
+        finally:
+            monitor.stop()
+        calls = monitor.blocking_calls()
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(calls[0].coroutine, main.__qualname__)
+        self.assertIsNone(calls[0].function)
+        with self.assertRaises(ValueError):
+            threaded.LoopMonitor(self.loop, capacity=0)
+
+    def test_heartbeat_during_sampling(self):
+        format_stack = _loop_monitor._watchdog.format_stack
+
+        def slow_format_stack(ident):
+            stack = format_stack(ident)
+            time.sleep(0.4)  # Blocking call is finished and heartbeat executed before sample is recorded
+            return stack
+
+        async def main():
+            await asyncio.sleep(0.05)
+            blocking_work()
+            await asyncio.sleep(0.5)
+
+        monitor = threaded.LoopMonitor(self.loop, interval=0.02, threshold=0.1, callback=id)
+        with mock.patch("threaded._loop_monitor._watchdog.format_stack", side_effect=slow_format_stack):
+            monitor.start()
+            try:
+                self.loop.run_until_complete(main())
+            finally:
+                monitor.stop()
+        # Outdated sample is not recorded as blocking call by the next heartbeat
+        self.assertEqual([call.duration for call in monitor.blocking_calls()], [])
+        self.assertGreaterEqual(monitor.lag.max, 0.2)
+
+    def test_register_not_retained(self):
+        namespace = {}
+        exec("async def dynamic():\n    pass", namespace)  # noqa: S102
+        func = namespace.pop("dynamic")
+        _loop_monitor.register(func)
+        self.assertIn(func.__code__, _loop_monitor._wrapped)
+        code = weakref.ref(func.__code__)
+        del func
+        gc.collect()
+        self.assertIsNone(code())
@@ -0,0 +1,109 @@
+#    Copyright 2017 - 2020 Alexey Stepanov aka penguinolog
+##
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+# Standard Library
+import time
+import unittest
+import urllib.error
+import urllib.request
+
+# Threaded Implementation
+import threaded
+from threaded import metrics
+from threaded._instrumentation import qualified_name
+
+
+def parse(text):
+    samples = {}
+    for line in text.splitlines():
+        if line and not line.startswith("#"):
+            name, value = line.rsplit(" ", 1)
+            samples[name] = float(value)
+    return samples
+
+
+def wait_completed(pool, count):
+    # Counters are updated by worker after the future result is set
+    executor = threaded.ThreadPooled.pools()[pool]
+    for _ in range(100):
+        if executor.completed_count >= count and not executor.active_count:
+            return
+        time.sleep(0.01)
+
+
+class TestMetrics(unittest.TestCase):
+    def setUp(self):
+        threaded.instrumentation.enable()
+        threaded.ThreadPooled.configure(max_workers=2, pool="metrics")
+
+    def tearDown(self):
+        threaded.instrumentation.disable()
+        threaded.instrumentation.reset()
+        threaded.ThreadPooled.shutdown(pool="metrics")
+
+    def test_render(self):
+        @threaded.threadpooled(pool="metrics")
+        def func(fail):
+            if fail:
+                raise ValueError("fail")
+
+        func(False).result()
+        with self.assertRaises(ValueError):
+            func(True).result()
+        wait_completed("metrics", 2)
+
+        text = metrics.render()
+        self.assertIn("# TYPE threaded_pool_submitted_total counter", text)
+        self.assertIn("# TYPE threaded_function_run_time_seconds histogram", text)
+        samples = parse(text)
+        self.assertEqual(samples['threaded_pool_max_workers{pool="metrics"}'], 2)
+        self.assertEqual(samples['threaded_pool_submitted_total{pool="metrics"}'], 2)
+        self.assertEqual(samples['threaded_pool_completed_total{pool="metrics"}'], 2)
+        self.assertEqual(samples['threaded_pool_failed_total{pool="metrics"}'], 1)
+        self.assertEqual(samples['threaded_pool_active_workers{pool="metrics"}'], 0)
+        self.assertEqual(samples['threaded_pool_queue_size{pool="metrics"}'], 0)
+
+        function = qualified_name(func)
+        self.assertEqual(samples[f'threaded_function_calls_total{{function="{function}"}}'], 2)
+        self.assertEqual(samples[f'threaded_function_exceptions_total{{function="{function}"}}'], 1)
+        self.assertEqual(samples[f'threaded_function_in_flight{{function="{function}"}}'], 0)
+        buckets = [
+            value
+            for name, value in samples.items()
+            if name.startswith(f'threaded_function_run_time_seconds_bucket{{function="{function}"')
+        ]
+        self.assertEqual(buckets, sorted(buckets))
+        self.assertEqual(buckets[-1], 2)
+        self.assertEqual(samples[f'threaded_function_run_time_seconds_count{{function="{function}"}}'], 2)
+
+    def test_http(self):
+        @threaded.threadpooled(pool="metrics")
+        def func():
+            pass
+
+        func().result()
+        wait_completed("metrics", 1)
+        server = metrics.start_http_server()
+        try:
+            host, port = server.server_address[:2]
+            with urllib.request.urlopen(f"http://{host}:{port}/metrics", timeout=5) as response:
+                self.assertEqual(response.headers["Content-Type"], metrics.CONTENT_TYPE)
+                samples = parse(response.read().decode("utf-8"))
+            with self.assertRaises(urllib.error.HTTPError):
+                urllib.request.urlopen(f"http://{host}:{port}/other", timeout=5)
+        finally:
+            server.shutdown()
+            server.server_close()
+        self.assertEqual(samples['threaded_pool_completed_total{pool="metrics"}'], 1)
+        self.assertEqual(samples[f'threaded_function_calls_total{{function="{qualified_name(func)}"}}'], 1)
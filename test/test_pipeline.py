@@ -0,0 +1,124 @@
+#    Copyright 2017 - 2020 Alexey Stepanov aka penguinolog
+##
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+# Standard Library
+import asyncio
+import threading
+import time
+import unittest
+
+# Threaded Implementation
+import threaded
+
+
+@threaded.threadpooled(pool="pipeline")
+def parse(value):
+    return int(value)
+
+
+@threaded.asynciotask
+async def enrich(value):
+    await asyncio.sleep(0)
+    return value, threading.current_thread().name
+
+
+async def collect(iterator):
+    return [item async for item in iterator]
+
+
+class TestPipeline(unittest.TestCase):
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()  # Private loop: current event loop of the thread is not changed
+        self.addCleanup(self.loop.close)
+
+    def tearDown(self):
+        threaded.ThreadPooled.shutdown(pool="pipeline")
+
+    def test_stages(self):
+        written = []
+
+        def write(item):
+            written.append(item)
+            return item[0]
+
+        pipeline = threaded.Pipeline().stage(parse, concurrency=4).stage(enrich, concurrency=8).stage(write)
+        results = self.loop.run_until_complete(collect(pipeline.run(str(value) for value in range(20))))
+        self.assertEqual(sorted(results), list(range(20)))
+        self.assertEqual({name for _, name in written}, {threading.current_thread().name})
+        self.assertEqual([stage.name for stage in pipeline.stages], ["parse", "enrich", "write"])
+
+        stats = pipeline.stats()
+        self.assertEqual([stage.processed for stage in stats], [20, 20, 20])
+        self.assertEqual([stage.running for stage in stats], [0, 0, 0])
+        self.assertEqual([stage.queue_maxsize for stage in stats], [4, 8, 1])
+        for stage in stats:
+            self.assertGreater(stage.throughput, 0)
+            self.assertLessEqual(stage.queue_peak, stage.queue_maxsize)
+
+    def test_backpressure(self):
+        pulled = []
+
+        def source():
+            for value in range(50):
+                pulled.append(value)
+                yield value
+
+        async def slow(value):
+            await asyncio.sleep(0.01)
+            return value
+
+        async def run():
+            pipeline = threaded.Pipeline().stage(parse, concurrency=2, maxsize=2).stage(slow, maxsize=1)
+            iterator = pipeline.run(source())
+            self.assertEqual(await iterator.__anext__(), 0)
+            await asyncio.sleep(0.05)
+            # Slow stage holds the upstream: source is not consumed ahead
+            self.assertLess(len(pulled), 15)
+            self.assertEqual(pipeline.stats()[1].queue_size, 1)
+            await iterator.aclose()
+            return pipeline
+
+        pipeline = self.loop.run_until_complete(run())
+        self.assertLess(pipeline.stats()[1].processed, 15)
+
+    def test_async_source(self):
+        async def source():
+            for value in range(5):
+                yield value
+
+        pipeline = threaded.Pipeline().stage(lambda value: value * 2, name="double")
+        self.assertEqual(self.loop.run_until_complete(collect(pipeline.run(source()))), [0, 2, 4, 6, 8])
+        self.assertEqual(pipeline.stats()[0].name, "double")
+
+    def test_failure(self):
+        def check(value):
+            if value == 3:
+                raise ValueError(value)
+            time.sleep(0.001)
+            return value
+
+        pipeline = threaded.Pipeline().stage(threaded.threadpooled(check, pool="pipeline"), concurrency=2)
+        with self.assertRaises(ValueError):
+            self.loop.run_until_complete(collect(pipeline.run(range(100))))
+        self.assertLess(pipeline.stats()[0].processed, 100)
+        # Pipeline can be restarted
+        self.assertEqual(sorted(self.loop.run_until_complete(collect(pipeline.run(range(3))))), [0, 1, 2])
+
+    def test_validation(self):
+        with self.assertRaises(ValueError):
+            threaded.Pipeline().stage(parse, concurrency=0)
+        with self.assertRaises(ValueError):
+            threaded.Pipeline().stage(parse, maxsize=0)
+        with self.assertRaises(ValueError):
+            self.loop.run_until_complete(collect(threaded.Pipeline().run([])))
@@ -13,9 +13,17 @@
 #    under the License.
 
 # Standard Library
+import collections
 import concurrent.futures
+import gc
+import os
+import pathlib
+import subprocess
+import sys
 import threading
+import time
 import unittest
+import weakref
 
 # Threaded Implementation
 import threaded
@@ -53,10 +61,808 @@ class TestThreadPooled(unittest.TestCase):
         self.assertNotEqual(pooled_name, threading.current_thread().name)
         self.assertEqual(thread_pooled.executor.max_workers, 2)
 
+    def test_thread_pooled_method(self):
+        class Target:
+            @threaded.ThreadPooled
+            def method(self):
+                return self, threading.current_thread().name
+
+        target = Target()
+        instance, pooled_name = target.method().result()
+        self.assertIs(instance, target)
+        self.assertNotEqual(pooled_name, threading.current_thread().name)
+        self.assertIsInstance(Target.method, threaded.ThreadPooled)
+
+    def test_named_pool(self):
+        threaded.ThreadPooled.configure(max_workers=1, pool="named")
+
+        @threaded.threadpooled(pool="named")
+        def test():
+            return threading.current_thread().name
+
+        @threaded.threadpooled
+        def test_default():
+            return threading.current_thread().name
+
+        self.assertNotEqual(test().result(), test_default().result())
+        pools = threaded.ThreadPooled.pools()
+        self.assertEqual(pools["named"].max_workers, 1)
+        self.assertIsNot(pools["named"], pools["default"])
+
+        threaded.ThreadPooled.shutdown(pool="named")
+        self.assertTrue(pools["named"].is_shutdown)
+        self.assertFalse(pools["default"].is_shutdown)
+        # Shut down pool is recreated on demand
+        self.assertNotEqual(test().result(), test_default().result())
+        self.assertIsNot(threaded.ThreadPooled.pools()["named"], pools["named"])
+
+    def fill_limited_pool(self, queue_policy, queue_timeout=None):
+        """Configure pool with single worker and single queue place, occupy both."""
+        release = threading.Event()
+        threaded.ThreadPooled.configure(
+            max_workers=1,
+            pool="limited",
+            max_queue=1,
+            queue_policy=queue_policy,
+            queue_timeout=queue_timeout,
+        )
+
+        @threaded.threadpooled(pool="limited")
+        def test(value=None):
+            release.wait(5)
+            return value
+
+        running = test()
+        while not running.running():
+            release.wait(0.001)
+        queued = test()
+        self.assertEqual(threaded.ThreadPooled.pools()["limited"].queue_size, 1)
+        return test, release, queued
+
+    def test_queue_block(self):
+        test, release, queued = self.fill_limited_pool(threaded.QueuePolicy.BLOCK, queue_timeout=0.01)
+        with self.assertRaises(threaded.RejectedExecutionError):
+            test()
+        release.set()
+        self.assertIsNone(queued.result(timeout=5))
+        self.assertEqual(test("unblocked").result(timeout=5), "unblocked")
+
+    def test_queue_reject(self):
+        test, release, _ = self.fill_limited_pool("reject")
+        with self.assertRaises(threaded.RejectedExecutionError):
+            test()
+        release.set()
+
+    def test_queue_caller_runs(self):
+        test, release, _ = self.fill_limited_pool(threaded.QueuePolicy.CALLER_RUNS)
+        release.set()
+        result = test("caller")
+        self.assertTrue(result.done())
+        self.assertEqual(result.result(), "caller")
+
+    def test_queue_drop_oldest(self):
+        test, release, queued = self.fill_limited_pool(threaded.QueuePolicy.DROP_OLDEST)
+        latest = test("latest")
+        self.assertTrue(queued.cancelled())
+        release.set()
+        self.assertEqual(latest.result(timeout=5), "latest")
+
+    def test_priority(self):
+        threaded.ThreadPooled.configure(max_workers=1, pool="prioritized", prioritized=True)
+        release = threading.Event()
+        order = []
+
+        @threaded.threadpooled(pool="prioritized")
+        def block():
+            release.wait(5)
+
+        @threaded.threadpooled(pool="prioritized", priority=10)
+        def test(value):
+            order.append(value)
+
+        blocking = block()
+        while not blocking.running():
+            release.wait(0.001)
+        futures = [test("low 1"), test("low 2")]
+        with threaded.call_priority(0):
+            futures.append(test("high"))
+        futures.append(test("low 3"))
+        release.set()
+        concurrent.futures.wait(futures)
+        self.assertEqual(order, ["high", "low 1", "low 2", "low 3"])
+
+    def test_map(self):
+        threaded.ThreadPooled.configure(max_workers=2)
+
+        @threaded.threadpooled
+        def test(value, power=1):
+            return value**power
+
+        self.assertEqual(list(test.map(range(10))), list(range(10)))
+        self.assertEqual(list(test.map(range(10), [2] * 10, chunksize=3)), [value**2 for value in range(10)])
+        self.assertEqual(sorted(test.imap_unordered(range(10), chunksize=4)), list(range(10)))
+        self.assertEqual(sorted(test.map(range(10), ordered=False)), list(range(10)))
+
+    def test_map_bare(self):
+        @threaded.ThreadPooled
+        def test(value):
+            return -value
+
+        self.assertEqual(list(test.map(range(5), chunksize=2)), [0, -1, -2, -3, -4])
+        self.assertEqual(sorted(test.imap_unordered(range(5))), [-4, -3, -2, -1, 0])
+
+    def test_map_method(self):
+        class Target:
+            def __init__(self, offset):
+                self.offset = offset
+
+            @threaded.ThreadPooled
+            def method(self, value):
+                return self.offset + value
+
+        target = Target(10)
+        self.assertEqual(target.method(1).result(timeout=5), 11)
+        self.assertEqual(list(target.method.map(range(3), chunksize=2)), [10, 11, 12])
+        self.assertEqual(sorted(target.method.imap_unordered(range(3))), [10, 11, 12])
+        self.assertEqual(list(target.method.map()), [])
+        self.assertEqual(target.method.__name__, "method")
+
+    def test_map_options(self):
+        cache = threaded.ResultCache()
+        calls = []
+
+        @threaded.threadpooled(cache=cache)
+        def cached(value):
+            calls.append(value)
+            return value * 2
+
+        self.assertEqual(list(cached.map([1, 2])), [2, 4])
+        self.assertEqual(cached(1).result(timeout=5), 2)  # map and direct calls share the cache
+        self.assertEqual(sorted(cached.imap_unordered([1, 2, 3])), [2, 4, 6])
+        self.assertEqual(calls, [1, 2, 3])
+        with self.assertRaises(ValueError):
+            cached.map([1], chunksize=2)
+
+        release = threading.Event()
+        started = []
+
+        @threaded.threadpooled(coalesce=True)
+        def coalesced(value):
+            started.append(value)
+            release.wait(5)
+            return value
+
+        results = coalesced.map([1, 1, 2])
+        first = coalesced(1)
+        release.set()
+        self.assertEqual(list(results), [1, 1, 2])
+        self.assertEqual(first.result(timeout=5), 1)
+        self.assertEqual(sorted(started), [1, 2])  # Calls in flight are shared with map
+
+        limiter = threaded.RateLimiter(1, 0.05)
+
+        @threaded.threadpooled(rate_limit=limiter)
+        def limited(value):
+            return value
+
+        self.assertEqual(list(limited.map(range(4), chunksize=2)), list(range(4)))
+        self.assertEqual(limiter.throttled, 2)  # Permit per call: chunk of 2 calls exceeds the burst of 1 call
+        self.assertGreater(limiter.max_delay, 0.1)
+
+        threaded.ThreadPooled.configure(max_workers=1, pool="deadline")
+        release.clear()
+
+        @threaded.threadpooled(pool="deadline")
+        def block():
+            release.wait(5)
+
+        @threaded.threadpooled(pool="deadline", timeout=0.05)
+        def deadline(value):
+            return value
+
+        def consume():  # Chunks are submitted on iteration
+            with self.assertRaises(concurrent.futures.CancelledError):  # Chunk not started before deadline
+                list(deadline.map(range(4), chunksize=2))
+            cancelled.set()
+
+        cancelled = threading.Event()
+        blocker = block()
+        threading.Thread(target=consume).start()
+        time.sleep(0.2)
+        release.set()
+        blocker.result(timeout=5)
+        self.assertTrue(cancelled.wait(5))
+
+    def test_map_exception(self):
+        @threaded.threadpooled
+        def test(value):
+            if value == 3:
+                raise ValueError(value)
+            return value
+
+        results = test.map(range(10))
+        self.assertEqual([next(results) for _ in range(3)], [0, 1, 2])
+        with self.assertRaises(ValueError):
+            next(results)
+        with self.assertRaises(ValueError):
+            list(test.map(range(10), chunksize=0))
+
+    def test_autoscale(self):
+        threaded.ThreadPooled.configure(max_workers=4, pool="autoscale", min_workers=1, idle_timeout=0.05)
+        executor = threaded.ThreadPooled.pools()["autoscale"]
+        self.assertEqual(executor.worker_count, 1)
+        release = threading.Event()
+
+        @threaded.threadpooled(pool="autoscale")
+        def test():
+            release.wait(5)
+            return threading.current_thread().name
+
+        futures = [test() for _ in range(6)]
+        self.assertEqual(executor.worker_count, 4)
+        release.set()
+        self.assertLessEqual(len({future.result() for future in futures}), 4)
+        self.assertEqual(executor.peak_worker_count, 4)
+
+        for _ in range(100):
+            if executor.worker_count == 1:
+                break
+            time.sleep(0.01)
+        self.assertEqual(executor.worker_count, 1)
+        self.assertEqual(executor.peak_worker_count, 4)
+        concurrent.futures.wait([test() for _ in range(4)])
+        self.assertGreater(executor.worker_count, 1)
+
+    def test_autoscale_growth_threshold(self):
+        threaded.ThreadPooled.configure(max_workers=4, pool="threshold", idle_timeout=1, growth_threshold=3)
+        executor = threaded.ThreadPooled.pools()["threshold"]
+        self.assertEqual(executor.worker_count, 0)
+        release = threading.Event()
+
+        @threaded.threadpooled(pool="threshold")
+        def test():
+            release.wait(5)
+
+        running = test()
+        while not running.running():
+            release.wait(0.001)
+        futures = [test(), test()]
+        self.assertEqual(executor.worker_count, 1)
+        futures.append(test())
+        self.assertEqual(executor.worker_count, 2)
+        release.set()
+        concurrent.futures.wait(futures)
+
+    def test_interpreter_exit(self):
+        script = "import threaded\nprint(threaded.threadpooled(lambda: 'done')().result())\n"
+        env = dict(os.environ, PYTHONPATH=str(pathlib.Path(threaded.__file__).resolve().parent.parent))
+        process = subprocess.run(  # noqa: S603
+            [sys.executable, "-c", script], env=env, capture_output=True, text=True, timeout=30, check=False
+        )
+        self.assertEqual((process.returncode, process.stdout.strip()), (0, "done"), process.stderr)
+
+    def test_shard_key(self):
+        threaded.ThreadPooled.configure(max_workers=4, pool="shard")
+        lock = threading.Lock()
+        running = collections.Counter()
+        calls = []
+        overlaps = []
+
+        @threaded.threadpooled(pool="shard", shard_key=lambda account, value: account)
+        def test(account, value):
+            with lock:
+                running[account] += 1
+                overlaps.append(sum(1 for count in running.values() if count))
+                self.assertEqual(running[account], 1)
+            time.sleep(0.001)
+            with lock:
+                running[account] -= 1
+                calls.append((account, value))
+            return value
+
+        futures = [test(value % 3, value) for value in range(30)]
+        self.assertEqual([future.result() for future in futures], list(range(30)))
+        for account in range(3):
+            self.assertEqual([value for key, value in calls if key == account], list(range(account, 30, 3)))
+        self.assertGreater(max(overlaps), 1)
+        self.assertEqual(list(test.map([0, 0, 1], [1, 2, 3])), [1, 2, 3])
+        with self.assertRaises(ValueError):
+            list(test.map([0], [1], chunksize=2))
+
+    def test_shard_key_no_parking(self):
+        threaded.ThreadPooled.configure(max_workers=2, pool="shard")
+        executor = threaded.ThreadPooled.pools()["shard"]
+        release = threading.Event()
+
+        @threaded.threadpooled(pool="shard", shard_key=lambda key: key)
+        def test(key):
+            if key == "blocked":
+                release.wait(5)
+            return key
+
+        blocked = [test("blocked") for _ in range(5)]
+        # Backlog of the busy key does not occupy workers: other keys are executed
+        self.assertEqual(test("free").result(timeout=1), "free")
+        self.assertEqual(executor.worker_count, 2)
+        self.assertTrue(blocked[2].cancel())
+        release.set()
+        concurrent.futures.wait(blocked)
+        self.assertTrue(blocked[2].cancelled())
+        self.assertEqual([future.result() for future in blocked if not future.cancelled()], ["blocked"] * 4)
+
+    def test_shard_key_queue_policy(self):
+        threaded.ThreadPooled.configure(
+            max_workers=1,
+            pool="shard",
+            max_queue=1,
+            queue_policy=threaded.QueuePolicy.DROP_OLDEST,
+        )
+        release = threading.Event()
+
+        @threaded.threadpooled(pool="shard", shard_key=lambda key: key)
+        def test(key):
+            release.wait(5)
+            return key
+
+        running = test(0)
+        while not running.running():
+            time.sleep(0.001)
+        dropped = [test(1), test(1)]
+        queued = test(2)  # Drop work item of the key 1
+        self.assertTrue(dropped[0].cancelled())
+        # The rest of the key backlog can not be resubmitted to the full queue
+        with self.assertRaises(threaded.RejectedExecutionError):
+            dropped[1].result(timeout=1)
+        release.set()
+        self.assertEqual(queued.result(timeout=5), 2)
+
+    def test_coalesce(self):
+        release = threading.Event()
+        calls = []
+
+        @threaded.threadpooled(coalesce=True)
+        def test(value, unused=None):
+            calls.append(value)
+            release.wait(5)
+            return value
+
+        futures = [test(1), test(1), test(1, unused=None), test(2), test([3]), test([3])]
+        self.assertIsNot(futures[0], futures[1])  # Own future of the caller for the shared call
+        release.set()
+        self.assertEqual([future.result() for future in futures], [1, 1, 1, 2, [3], [3]])
+        self.assertEqual(sorted(calls, key=str), [1, 1, 2, [3], [3]])  # Different keyword and unhashable arguments
+        # Done call is not shared
+        self.assertEqual(test(1).result(), 1)
+        self.assertEqual(len(calls), 6)
+
+    def test_coalesce_key(self):
+        release = threading.Event()
+
+        @threaded.threadpooled(coalesce=True, coalesce_key=lambda request_id, retry: request_id)
+        def test(request_id, retry):
+            release.wait(5)
+            return retry
+
+        future = test("request", 0)
+        coalesced = test("request", 1)
+        release.set()
+        self.assertEqual(future.result(), 0)
+        self.assertEqual(coalesced.result(), 0)
+
+        with self.assertRaises(ValueError):
+            threaded.ThreadPooled(coalesce_key=lambda: None)
+
+    def test_coalesce_cancel(self):
+        threaded.ThreadPooled.configure(max_workers=1, pool="coalesce")
+        self.addCleanup(threaded.ThreadPooled.shutdown, pool="coalesce")
+        release = threading.Event()
+        started = threading.Event()
+        calls = []
+
+        @threaded.threadpooled(pool="coalesce")
+        def block():
+            started.set()
+            release.wait(5)
+
+        @threaded.threadpooled(pool="coalesce", coalesce=True)
+        def test(value):
+            calls.append(value)
+            release.wait(5)
+            return value
+
+        blocker = block()
+        self.assertTrue(started.wait(5))
+        cancelled, kept = test(1), test(1)
+        self.assertTrue(cancelled.cancel())  # Queued: cancel affects the caller only
+        abandoned = [test(2), test(2)]
+        self.assertTrue(all(future.cancel() for future in abandoned))  # All callers cancelled: call is cancelled
+        release.set()
+        blocker.result(timeout=5)
+        self.assertEqual(kept.result(timeout=5), 1)
+        self.assertTrue(cancelled.cancelled())
+        self.assertEqual(calls, [1])
+
+        release.clear()
+        running = test(3)
+        while not running.running():
+            time.sleep(0.001)
+        joined = test(3)
+        self.assertTrue(joined.running())
+        self.assertFalse(running.cancel())  # Running call is not cancelled, as direct submit
+        self.assertFalse(joined.cancel())
+        release.set()
+        self.assertEqual([running.result(timeout=5), joined.result(timeout=5)], [3, 3])
+        self.assertEqual(calls, [1, 3])
+
+    def test_cache(self):
+        cache = threaded.ResultCache(maxsize=10, cache_exceptions=True)
+        calls = []
+
+        @threaded.threadpooled(cache=cache)
+        def test(value):
+            calls.append(value)
+            if value < 0:
+                raise ValueError(value)
+            return value * 2
+
+        self.assertEqual(test(1).result(), 2)
+        future = test(1)
+        self.assertTrue(future.done())  # Resolved without executor
+        self.assertEqual(future.result(), 2)
+        with self.assertRaises(ValueError):
+            test(-1).result()
+        with self.assertRaises(ValueError):
+            test(-1).result()
+        self.assertEqual(calls, [1, -1])
+        self.assertEqual((cache.hits, cache.misses), (2, 2))
+
+    def test_cache_shared(self):
+        cache = threaded.ResultCache()
+
+        @threaded.threadpooled(cache=cache)
+        def double(value):
+            return value * 2
+
+        @threaded.threadpooled(cache=cache)
+        def square(value):
+            return value**2
+
+        self.assertEqual(double(3).result(), 6)
+        self.assertEqual(square(3).result(), 9)  # Function is a part of the key
+        self.assertEqual(double(3).result(), 6)
+        self.assertEqual(len(cache), 2)
+
+    def test_rate_limit(self):
+        threaded.ThreadPooled.configure(max_workers=1, pool="limited")
+        limiter = threaded.RateLimiter(1, 0.05)
+        started = []
+
+        @threaded.threadpooled(pool="limited", rate_limit=limiter)
+        def test():
+            started.append(time.monotonic())
+
+        @threaded.threadpooled(pool="limited")
+        def free():
+            return len(started)
+
+        futures = [test() for _ in range(3)]
+        # Throttled calls do not occupy the worker
+        self.assertLess(free().result(timeout=1), 3)
+        concurrent.futures.wait(futures, timeout=5)
+        self.assertEqual(len(started), 3)
+        self.assertGreaterEqual(started[2] - started[0], 0.09)
+        self.assertEqual(limiter.throttled, 2)
+        self.assertGreater(limiter.total_delay, 0)
+
+        throttled = test()
+        self.assertTrue(throttled.cancel())
+
+    def test_rate_limit_running(self):
+        threaded.ThreadPooled.configure(max_workers=1, pool="limited")
+        self.addCleanup(threaded.ThreadPooled.shutdown, pool="limited")
+        limiter = threaded.RateLimiter(1, 0.05)
+        release = threading.Event()
+
+        @threaded.threadpooled(pool="limited", rate_limit=limiter)
+        def test(value):
+            if value:
+                release.wait(5)
+            return value
+
+        test(0)
+        throttled = test(1)
+        while not throttled.running():
+            time.sleep(0.001)
+        self.assertFalse(throttled.cancel())  # Released to the pool and started: not cancelled, as direct submit
+        release.set()
+        self.assertEqual(throttled.result(timeout=5), 1)
+
+    def test_rate_limit_queue_block(self):
+        threaded.ThreadPooled.configure(max_workers=1, pool="limited", max_queue=1, queue_policy="block")
+        threaded.ThreadPooled.configure(max_workers=1, pool="deadline")
+        release = threading.Event()
+
+        @threaded.threadpooled(pool="limited", rate_limit=(1, 0.05))
+        def test(value):
+            release.wait(5)
+            return value
+
+        @threaded.threadpooled(pool="deadline")
+        def block():
+            release.wait(5)
+
+        futures = [test(0), test(1), test(2)]  # Running, queued and throttled: waits for free place after release
+        blocker = block()
+        with threaded.call_timeout(0.1):
+            expired = block()
+        time.sleep(0.3)
+        # Throttled call waiting for the full queue does not block the timer thread
+        self.assertTrue(expired.cancelled())
+        self.assertFalse(futures[2].done())
+        release.set()
+        self.assertEqual([future.result(timeout=5) for future in futures], [0, 1, 2])
+        blocker.result(timeout=5)
+
+    def test_timeout(self):
+        threaded.ThreadPooled.configure(max_workers=1, pool="deadline")
+        executor = threaded.ThreadPooled.pools()["deadline"]
+        release = threading.Event()
+        started = []
+
+        @threaded.threadpooled(pool="deadline")
+        def block():
+            release.wait(5)
+
+        @threaded.threadpooled(pool="deadline", timeout=0.05)
+        def test(value):
+            started.append(value)
+
+        blocker = block()
+        expired = test(1)
+        with threaded.call_timeout(0.05):
+            expired_by_call = block()
+        time.sleep(0.2)
+        release.set()
+        blocker.result(timeout=5)
+        self.assertTrue(expired.cancelled())
+        self.assertTrue(expired_by_call.cancelled())
+        self.assertEqual(executor.expired_count, 2)
+        test(2).result(timeout=5)
+        self.assertEqual(started, [2])
+        self.assertEqual(executor.expired_count, 2)
+
+        with self.assertRaises(ValueError):
+            threaded.threadpooled(timeout=0)
+
+    def check_expired_queue_size(self, prioritized):
+        pool = f"expire_queued_{prioritized}"
+        threaded.ThreadPooled.configure(max_workers=1, pool=pool, max_queue=5, prioritized=prioritized)
+        executor = threaded.ThreadPooled.pools()[pool]
+        release = threading.Event()
+        started = []
+
+        @threaded.threadpooled(pool=pool)
+        def block():
+            release.wait(5)
+
+        @threaded.threadpooled(pool=pool)
+        def test(value):
+            started.append(value)
+
+        blocker = block()
+        with threaded.call_timeout(0.05):
+            expired = [test(value) for value in range(3)]
+        queued = test(3)
+        time.sleep(0.2)
+        # Expired work items are not counted before removal from the queue
+        self.assertEqual(executor.expired_count, 3)
+        self.assertEqual(executor.queue_size, 1)
+        release.set()
+        blocker.result(timeout=5)
+        queued.result(timeout=5)
+        # Waiters of expired work items are notified without execution
+        done, _ = concurrent.futures.wait(expired, timeout=5)
+        self.assertEqual(len(done), 3)
+        self.assertEqual(started, [3])
+        self.assertEqual(executor.queue_size, 0)
+
+    def test_timeout_queue_size(self):
+        for prioritized in (False, True):
+            with self.subTest(prioritized=prioritized):
+                self.check_expired_queue_size(prioritized)
+
+    def test_timeout_done_not_retained(self):
+        class Result:
+            pass
+
+        release = threading.Event()
+
+        @threaded.threadpooled(timeout=60)
+        def test():
+            release.wait(5)
+            return Result()
+
+        future = test()
+        release.set()
+        result = weakref.ref(future.result(timeout=5))
+        del future
+        gc.collect()
+        self.assertIsNone(result())  # Deadline timer does not keep done future until deadline
+
+    def test_cancel_queued(self):
+        threaded.ThreadPooled.configure(max_workers=1, pool="cancel_queued", max_queue=1, queue_policy="reject")
+        release = threading.Event()
+
+        @threaded.threadpooled(pool="cancel_queued")
+        def block():
+            release.wait(5)
+
+        blocker = block()
+        queued = block()
+        with self.assertRaises(threaded.RejectedExecutionError):
+            block()
+        # Cancelled work item frees the place in the queue
+        self.assertTrue(queued.cancel())
+        replacement = block()
+        release.set()
+        blocker.result(timeout=5)
+        replacement.result(timeout=5)
+
+    def test_compact_futures(self):
+        threaded.ThreadPooled.configure(max_workers=1, pool="compact", compact_futures=True)
+        executor = threaded.ThreadPooled.pools()["compact"]
+        self.assertTrue(executor.compact_futures)
+        release = threading.Event()
+        done = []
+
+        @threaded.threadpooled(pool="compact")
+        def test(value):
+            release.wait(5)
+            if value < 0:
+                raise ValueError(value)
+            return value
+
+        futures = [test(value) for value in range(3)]
+        self.assertIsInstance(futures[0], concurrent.futures.Future)
+        self.assertIsNot(type(futures[0]), concurrent.futures.Future)
+        failed = test(-1)
+        cancelled = test(10)
+        self.assertTrue(cancelled.cancel())
+        futures[2].add_done_callback(done.append)
+        release.set()
+        self.assertEqual(
+            sorted(future.result() for future in concurrent.futures.as_completed(futures, timeout=5)), [0, 1, 2]
+        )
+        completed, not_completed = concurrent.futures.wait([failed, cancelled], timeout=5)
+        self.assertEqual((len(completed), len(not_completed)), (2, 0))
+        self.assertIsInstance(failed.exception(), ValueError)
+        with self.assertRaises(ValueError):
+            failed.result()
+        self.assertTrue(cancelled.cancelled())
+        self.assertEqual(done, [futures[2]])
+
+    def test_executor_concurrent_create(self):
+        threaded.ThreadPooled.configure(pool="concurrent_create")
+        threaded.ThreadPooled.shutdown(pool="concurrent_create")
+        pooled = threaded.threadpooled(pool="concurrent_create")
+        barrier = threading.Barrier(8)
+        executors = []
+
+        def get_executor():
+            barrier.wait()
+            executors.append(pooled.executor)
+
+        threads = [threading.Thread(target=get_executor) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len({id(executor) for executor in executors}), 1)
+        self.assertIs(executors[0], threaded.ThreadPooled.pools()["concurrent_create"])
+
     def test_reconfigure(self):
         thread_pooled = threaded.threadpooled()
         executor = thread_pooled.executor
         thread_pooled.configure(max_workers=executor.max_workers)
         self.assertIs(executor, thread_pooled.executor)
         thread_pooled.configure(max_workers=executor.max_workers + 1)
+        self.assertIs(executor, thread_pooled.executor)
+        self.assertEqual(executor.max_workers, thread_pooled.executor.max_workers)
+        thread_pooled.configure(max_workers=executor.max_workers, max_queue=10)
         self.assertIsNot(executor, thread_pooled.executor)
+        self.assertTrue(executor.is_shutdown)
+
+    def test_recreate_configured(self):
+        threaded.ThreadPooled.configure(
+            max_workers=3,
+            pool="recreate",
+            max_queue=5,
+            queue_policy=threaded.QueuePolicy.DROP_OLDEST,
+            prioritized=True,
+            idle_timeout=7.0,
+        )
+        executor = threaded.ThreadPooled.pools()["recreate"]
+        threaded.ThreadPooled.shutdown(pool="recreate")
+        self.assertTrue(executor.is_shutdown)
+
+        recreated = threaded.threadpooled(pool="recreate").executor
+        self.assertIsNot(executor, recreated)
+        self.assertFalse(recreated.is_shutdown)
+        self.assertEqual(recreated.max_workers, 3)
+        self.assertEqual(recreated.max_queue, 5)
+        self.assertIs(recreated.queue_policy, threaded.QueuePolicy.DROP_OLDEST)
+        self.assertTrue(recreated.prioritized)
+        self.assertEqual(recreated.idle_timeout, 7.0)
+        threaded.ThreadPooled.shutdown(pool="recreate")
+
+    def test_resize(self):
+        threaded.ThreadPooled.configure(max_workers=2, pool="resize")
+        executor = threaded.ThreadPooled.pools()["resize"]
+        release = threading.Event()
+
+        @threaded.threadpooled(pool="resize")
+        def test():
+            release.wait(5)
+            return threading.current_thread().name
+
+        futures = [test() for _ in range(8)]
+        self.assertEqual(executor.worker_count, 2)
+
+        latencies = []
+
+        def submit():
+            while not resized.is_set():
+                started = time.perf_counter()
+                futures.append(test())
+                latencies.append(time.perf_counter() - started)
+
+        resized = threading.Event()
+        submitter = threading.Thread(target=submit)
+        submitter.start()
+        started = time.perf_counter()
+        threaded.ThreadPooled.configure(max_workers=8, pool="resize")
+        configure_latency = time.perf_counter() - started
+        resized.set()
+        submitter.join()
+
+        # In-flight work is not waited: configure and submits are not blocked
+        self.assertFalse(any(future.done() for future in futures))
+        self.assertLess(configure_latency, 1)
+        self.assertLess(max(latencies), 1)
+        self.assertIs(executor, threaded.ThreadPooled.pools()["resize"])
+        self.assertEqual(executor.max_workers, 8)
+        self.assertEqual(executor.worker_count, 8)
+
+        threaded.ThreadPooled.configure(max_workers=1, pool="resize")
+        self.assertFalse(any(future.done() for future in futures))
+        release.set()
+        concurrent.futures.wait(futures)
+        for _ in range(100):
+            if executor.worker_count == 1:
+                break
+            time.sleep(0.01)
+        self.assertEqual(executor.worker_count, 1)
+        self.assertEqual(len({test().result() for _ in range(4)}), 1)
+
+        with self.assertRaises(ValueError):
+            executor.resize(0)
+
+    def test_swap(self):
+        threaded.ThreadPooled.configure(max_workers=1, pool="swap")
+        executor = threaded.ThreadPooled.pools()["swap"]
+        release = threading.Event()
+
+        @threaded.threadpooled(pool="swap")
+        def test():
+            release.wait(5)
+
+        futures = [test() for _ in range(3)]
+        started = time.perf_counter()
+        threaded.ThreadPooled.configure(max_workers=1, pool="swap", max_queue=10)
+        self.assertLess(time.perf_counter() - started, 1)
+        self.assertTrue(executor.is_shutdown)
+        new_future = test()
+        self.assertIsNot(executor, threaded.ThreadPooled.pools()["swap"])
+        release.set()
+        concurrent.futures.wait([*futures, new_future])
+        self.assertFalse(any(future.cancelled() for future in futures))
@@ -0,0 +1,161 @@
+#    Copyright 2017 - 2020 Alexey Stepanov aka penguinolog
+##
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+# Standard Library
+import asyncio
+import os
+import time
+import unittest
+from multiprocessing import shared_memory
+from unittest import mock
+
+# Threaded Implementation
+import threaded
+from threaded import _shared_memory
+
+
+@threaded.processpooled
+def get_pid():
+    return os.getpid()
+
+
+@threaded.ProcessPooled
+def square(value):
+    return value * value
+
+
+@threaded.processpooled(shared_memory_threshold=1024)
+def describe(data, *, view=None):
+    return type(data).__name__, len(data), type(view).__name__, view.readonly if view is not None else None
+
+
+@threaded.processpooled(shared_memory_threshold=1024)
+def payload(size):
+    return b"x" * size
+
+
+@threaded.processpooled(shared_memory_threshold=1024)
+def transpose(view):
+    return memoryview(bytes(view.tobytes()[::-1])).cast(view.format, view.shape)
+
+
+@threaded.processpooled(pool="process")
+def delayed(value):
+    time.sleep(0.2)
+    return value
+
+
+@threaded.processpooled
+async def coroutine(value):
+    await asyncio.sleep(0)
+    return value
+
+
+def not_decorated(value):
+    return value
+
+
+class TestProcessPooled(unittest.TestCase):
+    def tearDown(self):
+        threaded.ProcessPooled.shutdown()
+
+    def test_call(self):
+        self.assertNotEqual(get_pid().result(timeout=30), os.getpid())
+        self.assertEqual(square(3).result(timeout=30), 9)
+        self.assertEqual(coroutine(1).result(timeout=30), 1)
+        self.assertEqual(threaded.processpooled(not_decorated)(2).result(timeout=30), 2)
+
+    def test_not_accessible(self):
+        @threaded.processpooled
+        def local():
+            pass
+
+        with self.assertRaises(TypeError):
+            local()
+
+    def test_shared_memory(self):
+        shared = []  # Descriptors of segments created by the parent and worker processes
+        export, receive_result = _shared_memory.export, _shared_memory.receive_result
+
+        def spy_export(value, threshold):
+            descriptor, segment = export(value, threshold)
+            if segment is not None:
+                shared.append(descriptor)
+            return descriptor, segment
+
+        def spy_receive_result(value):
+            if isinstance(value, _shared_memory.SharedBuffer):
+                shared.append(value)
+            return receive_result(value)
+
+        with mock.patch.multiple(_shared_memory, export=spy_export, receive_result=spy_receive_result):
+            data = b"\x01" * 4096
+            self.assertEqual(
+                describe(data, view=memoryview(bytearray(8))).result(timeout=30),
+                ("bytes", 4096, "memoryview", True),
+            )
+            self.assertEqual([(item.kind, item.size) for item in shared], [("bytes", 4096), ("memoryview", 8)])
+            self.assertEqual(describe(bytearray(data)).result(timeout=30), ("bytearray", 4096, "NoneType", None))
+            self.assertEqual((shared[-1].kind, shared[-1].size), ("bytearray", 4096))
+            self.assertEqual(describe(b"small").result(timeout=30), ("bytes", 5, "NoneType", None))
+            self.assertEqual(len(shared), 3)  # Small arguments are pickled
+            self.assertEqual(payload(4096).result(timeout=30), b"x" * 4096)
+            self.assertEqual((shared[-1].kind, shared[-1].size), ("bytes", 4096))  # Result from the worker
+
+            view = memoryview(bytes(range(8))).cast("H", (2, 2))
+            result = transpose(view).result(timeout=30)
+            self.assertEqual((result.format, result.shape), ("H", (2, 2)))
+            self.assertEqual(result.tobytes(), bytes(range(8))[::-1])
+            self.assertEqual([(item.kind, item.shape) for item in shared[-2:]], [("memoryview", (2, 2))] * 2)
+
+        for item in shared:  # All segments are unlinked after the call
+            with self.assertRaises(FileNotFoundError):
+                shared_memory.SharedMemory(name=item.name)
+
+        with self.assertRaises(ValueError):
+            threaded.processpooled(shared_memory_threshold=0)
+
+    def test_cancel_running(self):
+        threaded.ProcessPooled.configure(max_workers=1, pool="process")
+        future = delayed(1)
+        deadline = time.monotonic() + 30
+        while not future.running() and not future.done() and time.monotonic() < deadline:
+            time.sleep(0.001)
+        self.assertTrue(future.running())  # Passed to the worker process: not cancelled, as executor future
+        self.assertFalse(future.cancel())
+        self.assertEqual(future.result(timeout=30), 1)
+
+    def test_loop(self):
+        loop = asyncio.new_event_loop()
+        self.addCleanup(loop.close)
+
+        self.assertEqual(loop.run_until_complete(threaded.processpooled(not_decorated, loop_getter=loop)(4)), 4)
+
+    def test_configure(self):
+        threaded.ProcessPooled.configure(max_workers=1, pool="process")
+        executor = threaded.ProcessPooled.pools()["process"]
+        self.assertEqual(executor.max_workers, 1)
+        threaded.ProcessPooled.configure(max_workers=1, pool="process")
+        self.assertIs(executor, threaded.ProcessPooled.pools()["process"])
+        threaded.ProcessPooled.configure(max_workers=2, pool="process")
+        self.assertIsNot(executor, threaded.ProcessPooled.pools()["process"])
+        self.assertTrue(executor.is_shutdown)
+
+        pooled = threaded.processpooled(pool="process")
+        self.assertEqual(pooled.executor.max_workers, 2)
+        reconfigured = pooled.executor
+        threaded.ProcessPooled.shutdown(pool="process")
+        self.assertTrue(reconfigured.is_shutdown)
+        self.assertIsNot(reconfigured, pooled.executor)
+        self.assertFalse(pooled.executor.is_shutdown)
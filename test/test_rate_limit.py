@@ -0,0 +1,59 @@
+#    Copyright 2017 - 2020 Alexey Stepanov aka penguinolog
+##
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+# Standard Library
+import threading
+import unittest
+
+# Threaded Implementation
+import threaded
+from threaded import _timer
+
+
+class TestRateLimiter(unittest.TestCase):
+    def test_token_bucket(self):
+        now = [0.0]
+        limiter = threaded.RateLimiter(2, 1, timer=lambda: now[0])
+        self.assertEqual([limiter.reserve() for _ in range(2)], [0, 0])  # Burst
+        self.assertEqual(limiter.reserve(), 0.5)
+        self.assertEqual(limiter.reserve(), 1.0)  # Queued after the previous throttled call
+        now[0] = 10
+        self.assertEqual(limiter.reserve(), 0)
+        self.assertEqual(limiter.reserve(2), 0.5)
+        self.assertEqual(limiter.throttled, 3)
+        self.assertEqual(limiter.total_delay, 2.0)
+        self.assertEqual(limiter.max_delay, 1.0)
+
+    def test_validation(self):
+        with self.assertRaises(ValueError):
+            threaded.RateLimiter(0)
+        with self.assertRaises(ValueError):
+            threaded.RateLimiter(1, 0)
+        limiter = threaded.RateLimiter(1)
+        self.assertIs(threaded.RateLimiter.from_spec(limiter), limiter)
+        self.assertEqual(threaded.RateLimiter.from_spec((5, 2)).calls, 5)
+
+
+class TestTimerQueue(unittest.TestCase):
+    def test_order(self):
+        timer_queue = _timer.TimerQueue(idle_timeout=0.01)
+        calls = []
+        done = threading.Event()
+        timer_queue.call_later(0.02, calls.append, 2)
+        timer_queue.call_later(0.02, calls.append, 3)
+        timer_queue.call_later(0, calls.append, 1)
+        timer_queue.call_later(0.03, done.set)
+        self.assertTrue(done.wait(1))
+        self.assertEqual(calls, [1, 2, 3])
+        self.assertEqual(len(timer_queue), 0)
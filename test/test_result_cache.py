@@ -0,0 +1,68 @@
+#    Copyright 2017 - 2020 Alexey Stepanov aka penguinolog
+##
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+# Standard Library
+import unittest
+
+# Threaded Implementation
+import threaded
+
+
+class TestResultCache(unittest.TestCase):
+    def test_lru(self):
+        cache = threaded.ResultCache(maxsize=2)
+        cache.put(1, "one")
+        cache.put(2, "two")
+        self.assertEqual(cache.get(1), ("one", None))  # 1 is recently used
+        cache.put(3, "three")
+        self.assertIsNone(cache.get(2))
+        self.assertEqual(cache.get(1), ("one", None))
+        self.assertEqual(cache.get(3), ("three", None))
+        self.assertEqual(len(cache), 2)
+        self.assertEqual((cache.hits, cache.misses), (3, 1))
+        cache.clear()
+        self.assertEqual((len(cache), cache.hits, cache.misses), (0, 0, 0))
+
+    def test_ttl(self):
+        now = [0.0]
+        cache = threaded.ResultCache(ttl=10, timer=lambda: now[0])
+        cache.put("key", "value")
+        now[0] = 9.9
+        self.assertEqual(cache.get("key"), ("value", None))
+        now[0] = 10
+        self.assertIsNone(cache.get("key"))
+        self.assertEqual(len(cache), 0)
+
+    def test_exceptions(self):
+        error = ValueError("negative")
+        cache = threaded.ResultCache()
+        cache.put("key", None, error)
+        self.assertIsNone(cache.get("key"))
+        cache = threaded.ResultCache(cache_exceptions=True)
+        cache.put("key", None, error)
+        self.assertEqual(cache.get("key"), (None, error))
+
+    def test_key(self):
+        cache = threaded.ResultCache()
+        self.assertEqual(cache.make_key(1, b=2, a=1), cache.make_key(1, a=1, b=2))
+        unhashable = cache.make_key([1])
+        cache.put(unhashable, "value")
+        self.assertIsNone(cache.get(unhashable))
+        self.assertEqual(threaded.ResultCache(key=lambda value, **_: value).make_key(1, retry=3), 1)
+
+    def test_validation(self):
+        with self.assertRaises(ValueError):
+            threaded.ResultCache(maxsize=0)
+        with self.assertRaises(ValueError):
+            threaded.ResultCache(ttl=0)
@@ -69,6 +69,21 @@ class ThreadedTest(unittest.TestCase):
         self.assertTrue(test_thread.daemon)
         self.assertFalse(test_thread.is_alive())
 
+    def test_method(self):
+        result = []
+
+        class Target:
+            @threaded.Threaded
+            def method(self, value):
+                result.append((self, value))
+
+        target = Target()
+        test_thread = target.method(1)
+        self.assertEqual(test_thread.name, "Threaded: method")
+        test_thread.start()
+        test_thread.join()
+        self.assertEqual(result, [(target, 1)])
+
     @mock.patch("threading.Thread", autospec=True)
     def test_started(self, thread):
         @threaded.threaded(started=True)
@@ -0,0 +1,79 @@
+#    Copyright 2017 - 2020 Alexey Stepanov aka penguinolog
+##
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+# Standard Library
+import threading
+import time
+import unittest
+
+# Threaded Implementation
+import threaded
+
+
+class TestWatchdog(unittest.TestCase):
+    def setUp(self):
+        threaded.ThreadPooled.configure(max_workers=2, pool="watchdog")
+        self.release = threading.Event()
+
+    def tearDown(self):
+        self.release.set()
+        threaded.ThreadPooled.shutdown(pool="watchdog")
+
+    def test_stalled(self):
+        @threaded.threadpooled(pool="watchdog")
+        def stuck_call():
+            self.release.wait(5)
+
+        reported = []
+        watchdog = threaded.Watchdog(0.1, interval=0.02, callback=reported.append).start()
+        try:
+            future = stuck_call()
+            for _ in range(100):
+                if reported:
+                    break
+                time.sleep(0.01)
+            time.sleep(0.1)  # Reported once
+            self.assertTrue(watchdog.running)
+        finally:
+            watchdog.stop()
+        self.assertFalse(watchdog.running)
+
+        self.assertEqual(len(reported), 1)
+        task = reported[0]
+        self.assertEqual(task.pool, "watchdog")
+        self.assertGreaterEqual(task.duration, 0.1)
+        self.assertIn("stuck_call", task.stack)
+        self.assertEqual(watchdog.stalled()[0].thread, task.thread)
+        self.assertGreater(watchdog.stalled()[0].duration, task.duration)
+
+        summary = {stalls.pool: stalls for stalls in watchdog.summary()}
+        self.assertEqual(summary["watchdog"], threaded.PoolStalls("watchdog", 2, 1, 1, 0.5))
+
+        self.release.set()
+        future.result()
+        self.assertEqual(watchdog.check(), ())
+        summary = {stalls.pool: stalls for stalls in watchdog.summary()}
+        self.assertEqual(summary["watchdog"].stalled, 0)
+
+    def test_check(self):
+        @threaded.threadpooled(pool="watchdog")
+        def short_call():
+            pass
+
+        short_call().result()
+        watchdog = threaded.Watchdog(0.05)
+        self.assertEqual(watchdog.check(), ())
+        self.assertEqual(watchdog.interval, 0.0125)
+        with self.assertRaises(ValueError):
+            threaded.Watchdog(0)
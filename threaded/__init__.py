@@ -19,10 +19,27 @@ from __future__ import annotations
 # Local Implementation
 from ._asynciotask import AsyncIOTask
 from ._asynciotask import asynciotask
+from ._instrumentation import instrumentation
+from ._interpreterpooled import InterpreterPooled
+from ._interpreterpooled import interpreterpooled
+from ._loop_monitor import BlockingCall
+from ._loop_monitor import LoopMonitor
+from ._pipeline import Pipeline
+from ._processpooled import ProcessPooled
+from ._processpooled import processpooled
+from ._rate_limit import RateLimiter
+from ._result_cache import ResultCache
 from ._threaded import Threaded
 from ._threaded import threaded
+from ._threadpooled import QueuePolicy
+from ._threadpooled import RejectedExecutionError
 from ._threadpooled import ThreadPooled
 from ._threadpooled import threadpooled
+from ._watchdog import PoolStalls
+from ._watchdog import StalledTask
+from ._watchdog import Watchdog
+from ._work_queue import call_priority
+from ._work_queue import call_timeout
 
 try:  # noqa: SIM105,FURB107,RUF100
     # Local Implementation
@@ -32,10 +49,27 @@ except ImportError:
 
 __all__ = (
     "AsyncIOTask",
+    "BlockingCall",
+    "InterpreterPooled",
+    "LoopMonitor",
+    "Pipeline",
+    "PoolStalls",
+    "ProcessPooled",
+    "QueuePolicy",
+    "RateLimiter",
+    "RejectedExecutionError",
+    "ResultCache",
+    "StalledTask",
     "ThreadPooled",
     "Threaded",
+    "Watchdog",
     "__version__",
     "asynciotask",
+    "call_priority",
+    "call_timeout",
+    "instrumentation",
+    "interpreterpooled",
+    "processpooled",
     "threaded",
     "threadpooled",
 )
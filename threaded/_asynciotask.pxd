@@ -24,3 +24,5 @@ cdef class AsyncIOTask(class_decorator.BaseDecorator):
     cdef:
         readonly object loop_getter
         readonly bint loop_getter_need_context
+        readonly object cache
+        readonly object rate_limit
@@ -22,11 +22,16 @@ import functools
 import typing
 
 # Local Implementation
+from . import _instrumentation
+from . import _loop_monitor
+from . import _rate_limit
+from . import _result_cache
 from . import class_decorator
 
 if typing.TYPE_CHECKING:
     from collections.abc import Awaitable
     from collections.abc import Callable
+    from collections.abc import Hashable
 
     from typing_extensions import ParamSpec
 
@@ -35,10 +40,60 @@ if typing.TYPE_CHECKING:
 __all__ = ("AsyncIOTask", "asynciotask")
 
 
+def _create_task_later(
+    loop: asyncio.AbstractEventLoop,
+    delay: float,
+    func: Callable[..., Awaitable[typing.Any]],
+    args: tuple[typing.Any, ...],
+    kwargs: dict[str, typing.Any],
+) -> asyncio.Future[typing.Any]:
+    """Create task by event loop timer after delay. Coroutine is not created until timer.
+
+    :param loop: event loop
+    :type loop: asyncio.AbstractEventLoop
+    :param delay: delay in seconds
+    :type delay: float
+    :param func: coroutine function
+    :type func: Callable[..., Awaitable[typing.Any]]
+    :param args: positional arguments
+    :type args: tuple[typing.Any, ...]
+    :param kwargs: keyword arguments
+    :type kwargs: dict[str, typing.Any]
+    :return: future for the task result. Cancel is propagated to the task.
+    :rtype: asyncio.Future[typing.Any]
+    """
+    future: asyncio.Future[typing.Any] = loop.create_future()
+
+    def copy_state(task: asyncio.Future[typing.Any]) -> None:
+        """Copy task state to the future."""
+        if future.cancelled():
+            return
+        if task.cancelled():
+            future.cancel()
+            return
+        exception: BaseException | None = task.exception()
+        if exception is not None:
+            future.set_exception(exception)
+        else:
+            future.set_result(task.result())
+
+    def start() -> None:
+        """Create task for the delayed call."""
+        if future.cancelled():
+            return
+        task: asyncio.Task[typing.Any] = loop.create_task(func(*args, **kwargs))  # type: ignore[arg-type]
+        task.add_done_callback(copy_state)
+        future.add_done_callback(lambda _: task.cancel())
+
+    handle: asyncio.TimerHandle = loop.call_later(delay, start)
+    future.add_done_callback(lambda _: handle.cancel())
+    return future
+
+
 class AsyncIOTask(class_decorator.BaseDecorator):
     """Wrap to asyncio.Task."""
 
-    __slots__ = ("__loop_getter", "__loop_getter_need_context")
+    __slots__ = ("__cache", "__loop_getter", "__loop_getter_need_context", "__rate_limit")
 
     def __init__(
         self,
@@ -46,6 +101,8 @@ class AsyncIOTask(class_decorator.BaseDecorator):
         *,
         loop_getter: Callable[..., asyncio.AbstractEventLoop] | asyncio.AbstractEventLoop = asyncio.get_event_loop,
         loop_getter_need_context: bool = False,
+        cache: _result_cache.ResultCache | None = None,
+        rate_limit: _rate_limit.RateLimiter | tuple[int, float] | None = None,
     ) -> None:
         """Wrap function in future and return.
 
@@ -58,10 +115,16 @@ class AsyncIOTask(class_decorator.BaseDecorator):
                            ]
         :param loop_getter_need_context: Loop getter requires function context
         :type loop_getter_need_context: bool
+        :param cache: Cache for call results. Cache hit returns done asyncio.Future without task.
+        :type cache: typing.Optional[ResultCache]
+        :param rate_limit: Calls limit: (calls, per_seconds) or RateLimiter. Throttled tasks are created by timer.
+        :type rate_limit: typing.Union[RateLimiter, tuple[int, float], None]
         """
         super().__init__(func=func)
         self.__loop_getter: Callable[..., asyncio.AbstractEventLoop] | asyncio.AbstractEventLoop = loop_getter
         self.__loop_getter_need_context: bool = loop_getter_need_context
+        self.__cache: _result_cache.ResultCache | None = cache
+        self.__rate_limit: _rate_limit.RateLimiter | None = _rate_limit.RateLimiter.from_spec(rate_limit)
 
     @property
     def loop_getter(self) -> Callable[..., asyncio.AbstractEventLoop] | asyncio.AbstractEventLoop:
@@ -79,6 +142,22 @@ class AsyncIOTask(class_decorator.BaseDecorator):
         """
         return self.__loop_getter_need_context
 
+    @property
+    def cache(self) -> _result_cache.ResultCache | None:
+        """Cache for call results.
+
+        :rtype: typing.Optional[ResultCache]
+        """
+        return self.__cache
+
+    @property
+    def rate_limit(self) -> _rate_limit.RateLimiter | None:
+        """Rate limiter for calls.
+
+        :rtype: typing.Optional[RateLimiter]
+        """
+        return self.__rate_limit
+
     def get_loop(self, *args: typing.Any, **kwargs: typing.Any) -> asyncio.AbstractEventLoop:
         """Get event loop in decorator class.
 
@@ -101,6 +180,9 @@ class AsyncIOTask(class_decorator.BaseDecorator):
         :return: wrapper, which will produce asyncio.Task on call with function called inside it
         :rtype: Callable[..., asyncio.Task]
         """
+        qualname: str = _instrumentation.qualified_name(func)
+        instrumentation: _instrumentation.Instrumentation = _instrumentation.instrumentation
+        _loop_monitor.register(func)
 
         # noinspection PyMissingOrEmptyDocstring
         @functools.wraps(func)
@@ -110,9 +192,42 @@ class AsyncIOTask(class_decorator.BaseDecorator):
             :return: asyncio.Task
             :rtype: asyncio.Task[Any]
             """
-            return self.get_loop(*args, **kwargs).create_task(func(*args, **kwargs))  # type: ignore[arg-type]
+            # Event loop wait is counted from the call to the first step of the task
+            target = instrumentation.wrap_coroutine(qualname, func) if instrumentation.enabled else func
+            return self.get_loop(*args, **kwargs).create_task(target(*args, **kwargs))  # type: ignore[arg-type]
+
+        if self.cache is None and self.rate_limit is None:
+            return wrapper
 
-        return wrapper
+        cache: _result_cache.ResultCache | None = self.cache
+        rate_limit: _rate_limit.RateLimiter | None = self.rate_limit
+
+        # noinspection PyMissingOrEmptyDocstring
+        @functools.wraps(func)
+        def managed_wrapper(*args: Spec.args, **kwargs: Spec.kwargs) -> asyncio.Task[typing.Any]:
+            """Function wrapper with result cache and rate limit.
+
+            :return: asyncio.Task or asyncio.Future on cache hit or throttled call
+            :rtype: asyncio.Task[Any]
+            """
+            loop: asyncio.AbstractEventLoop = self.get_loop(*args, **kwargs)
+            if cache is not None:
+                key: Hashable = (qualname, cache.make_key(*args, **kwargs))  # Cache can be shared between functions
+                cached = cache.get(key)
+                if cached is not None:
+                    return _result_cache.resolved_asyncio_future(loop, cached)  # type: ignore[return-value]
+            target = instrumentation.wrap_coroutine(qualname, func) if instrumentation.enabled else func
+            delay: float = 0.0 if rate_limit is None else rate_limit.reserve()
+            future: asyncio.Future[typing.Any]
+            if delay > 0:
+                future = _create_task_later(loop, delay, target, args, kwargs)
+            else:
+                future = loop.create_task(target(*args, **kwargs))  # type: ignore[arg-type]
+            if cache is not None:
+                future.add_done_callback(functools.partial(cache.put_future, key))
+            return future  # type: ignore[return-value]
+
+        return managed_wrapper
 
     def __call__(
         self,
@@ -137,6 +252,8 @@ class AsyncIOTask(class_decorator.BaseDecorator):
             f"{self._func!r}, "
             f"loop_getter={self.loop_getter!r}, "
             f"loop_getter_need_context={self.loop_getter_need_context!r}, "
+            f"cache={self.cache!r}, "
+            f"rate_limit={self.rate_limit!r}, "
             f") at 0x{id(self):X}>"
         )  # pragma: no cover
 
@@ -147,6 +264,8 @@ def asynciotask(
     *,
     loop_getter: Callable[..., asyncio.AbstractEventLoop] | asyncio.AbstractEventLoop = asyncio.get_event_loop,
     loop_getter_need_context: bool = False,
+    cache: _result_cache.ResultCache | None = None,
+    rate_limit: _rate_limit.RateLimiter | tuple[int, float] | None = None,
 ) -> AsyncIOTask:
     """Overload: no function."""
 
@@ -157,6 +276,8 @@ def asynciotask(
     *,
     loop_getter: Callable[..., asyncio.AbstractEventLoop] | asyncio.AbstractEventLoop = asyncio.get_event_loop,
     loop_getter_need_context: bool = False,
+    cache: _result_cache.ResultCache | None = None,
+    rate_limit: _rate_limit.RateLimiter | tuple[int, float] | None = None,
 ) -> Callable[..., asyncio.Task[typing.Any]]:
     """Overload: provided function."""
 
@@ -166,6 +287,8 @@ def asynciotask(
     *,
     loop_getter: Callable[..., asyncio.AbstractEventLoop] | asyncio.AbstractEventLoop = asyncio.get_event_loop,
     loop_getter_need_context: bool = False,
+    cache: _result_cache.ResultCache | None = None,
+    rate_limit: _rate_limit.RateLimiter | tuple[int, float] | None = None,
 ) -> AsyncIOTask | Callable[..., asyncio.Task[typing.Any]]:
     """Wrap function in future and return.
 
@@ -178,6 +301,10 @@ def asynciotask(
                        ]
     :param loop_getter_need_context: Loop getter requires function context
     :type loop_getter_need_context: bool
+    :param cache: Cache for call results. Cache hit returns done asyncio.Future without task.
+    :type cache: typing.Optional[ResultCache]
+    :param rate_limit: Calls limit: (calls, per_seconds) or RateLimiter. Throttled tasks are created by timer.
+    :type rate_limit: typing.Union[RateLimiter, tuple[int, float], None]
     :return: AsyncIOTask instance, if called as function or argumented decorator, else callable wrapper
     :rtype: typing.Union[AsyncIOTask, Callable[..., asyncio.Task]]
     """
@@ -186,9 +313,13 @@ def asynciotask(
             func=func,
             loop_getter=loop_getter,
             loop_getter_need_context=loop_getter_need_context,
+            cache=cache,
+            rate_limit=rate_limit,
         )
     return AsyncIOTask(  # type: ignore[return-value]
         func=None,
         loop_getter=loop_getter,
         loop_getter_need_context=loop_getter_need_context,
+        cache=cache,
+        rate_limit=rate_limit,
     )(func)
@@ -23,9 +23,64 @@ import typing
 
 from threaded cimport class_decorator
 
+from threaded import _instrumentation
+from threaded import _loop_monitor
+from threaded import _rate_limit
+from threaded import _result_cache
+
 __all__ = ("AsyncIOTask", "asynciotask")
 
 
+def _create_task_later(
+    loop: asyncio.AbstractEventLoop,
+    delay: float,
+    func: typing.Callable[..., "typing.Awaitable"],
+    args: typing.Tuple[typing.Any, ...],
+    kwargs: typing.Dict[str, typing.Any],
+) -> asyncio.Future:
+    """Create task by event loop timer after delay. Coroutine is not created until timer.
+
+    :param loop: event loop
+    :type loop: asyncio.AbstractEventLoop
+    :param delay: delay in seconds
+    :type delay: float
+    :param func: coroutine function
+    :type func: typing.Callable[..., typing.Awaitable]
+    :param args: positional arguments
+    :type args: typing.Tuple[typing.Any, ...]
+    :param kwargs: keyword arguments
+    :type kwargs: typing.Dict[str, typing.Any]
+    :return: future for the task result. Cancel is propagated to the task.
+    :rtype: asyncio.Future
+    """
+    future = loop.create_future()
+
+    def copy_state(task):  # type: (asyncio.Future) -> None
+        """Copy task state to the future."""
+        if future.cancelled():
+            return
+        if task.cancelled():
+            future.cancel()
+            return
+        exception = task.exception()
+        if exception is not None:
+            future.set_exception(exception)
+        else:
+            future.set_result(task.result())
+
+    def start():  # type: () -> None
+        """Create task for the delayed call."""
+        if future.cancelled():
+            return
+        task = loop.create_task(func(*args, **kwargs))
+        task.add_done_callback(copy_state)
+        future.add_done_callback(lambda _: task.cancel())
+
+    handle = loop.call_later(delay, start)
+    future.add_done_callback(lambda _: handle.cancel())
+    return future
+
+
 cdef class AsyncIOTask(class_decorator.BaseDecorator):
     """Wrap to asyncio.Task."""
 
@@ -36,7 +91,9 @@ cdef class AsyncIOTask(class_decorator.BaseDecorator):
         loop_getter: typing.Union[
             typing.Callable[..., asyncio.AbstractEventLoop], asyncio.AbstractEventLoop
         ] = asyncio.get_event_loop,
-        bint loop_getter_need_context: bool = False
+        bint loop_getter_need_context: bool = False,
+        cache: typing.Optional[_result_cache.ResultCache] = None,
+        rate_limit: typing.Union[_rate_limit.RateLimiter, typing.Tuple[int, float], None] = None
     ) -> None:
         """Wrap function in future and return.
 
@@ -49,10 +106,16 @@ cdef class AsyncIOTask(class_decorator.BaseDecorator):
                            ]
         :param loop_getter_need_context: Loop getter requires function context
         :type loop_getter_need_context: bool
+        :param cache: Cache for call results. Cache hit returns done asyncio.Future without task.
+        :type cache: typing.Optional[ResultCache]
+        :param rate_limit: Calls limit: (calls, per_seconds) or RateLimiter. Throttled tasks are created by timer.
+        :type rate_limit: typing.Union[RateLimiter, typing.Tuple[int, float], None]
         """
         super().__init__(func=func)
         self.loop_getter = loop_getter
         self.loop_getter_need_context = loop_getter_need_context
+        self.cache = cache
+        self.rate_limit = _rate_limit.RateLimiter.from_spec(rate_limit)
 
     def get_loop(self, *args, **kwargs):  # type: (typing.Any, typing.Any) -> asyncio.AbstractEventLoop
         """Get event loop in decorator class.
@@ -76,6 +139,10 @@ cdef class AsyncIOTask(class_decorator.BaseDecorator):
         :return: wrapper, which will produce asyncio.Task on call with function called inside it
         :rtype: typing.Callable[..., asyncio.Task]
         """
+        cdef str qualname = _instrumentation.qualified_name(func)
+        instrumentation = _instrumentation.instrumentation
+        _loop_monitor.register(func)
+
         # noinspection PyMissingOrEmptyDocstring
         @functools.wraps(func)
         def wrapper(*args, **kwargs):  # type: (typing.Any, typing.Any) -> asyncio.Task
@@ -84,10 +151,42 @@ cdef class AsyncIOTask(class_decorator.BaseDecorator):
             :return: asyncio.Task
             :rtype: asyncio.Task[Any]
             """
+            # Event loop wait is counted from the call to the first step of the task
+            target = instrumentation.wrap_coroutine(qualname, func) if instrumentation.enabled else func
+            loop = self.get_loop(*args, **kwargs)
+            return loop.create_task(target(*args, **kwargs))
+
+        if self.cache is None and self.rate_limit is None:
+            return wrapper
+
+        cache = self.cache
+        rate_limit = self.rate_limit
+
+        # noinspection PyMissingOrEmptyDocstring
+        @functools.wraps(func)
+        def managed_wrapper(*args, **kwargs):  # type: (typing.Any, typing.Any) -> asyncio.Task
+            """Function wrapper with result cache and rate limit.
+
+            :return: asyncio.Task or asyncio.Future on cache hit or throttled call
+            :rtype: asyncio.Task[Any]
+            """
             loop = self.get_loop(*args, **kwargs)
-            return loop.create_task(func(*args, **kwargs))
+            if cache is not None:
+                key = (qualname, cache.make_key(*args, **kwargs))  # Cache can be shared between functions
+                cached = cache.get(key)
+                if cached is not None:
+                    return _result_cache.resolved_asyncio_future(loop, cached)
+            target = instrumentation.wrap_coroutine(qualname, func) if instrumentation.enabled else func
+            delay = 0.0 if rate_limit is None else rate_limit.reserve()
+            if delay > 0:
+                future = _create_task_later(loop, delay, target, args, kwargs)
+            else:
+                future = loop.create_task(target(*args, **kwargs))
+            if cache is not None:
+                future.add_done_callback(functools.partial(cache.put_future, key))
+            return future
 
-        return wrapper
+        return managed_wrapper
 
     def __call__(  # pylint: disable=useless-super-delegation
         self, *args: typing.Union[typing.Callable[..., "typing.Awaitable"], typing.Any], **kwargs: typing.Any
@@ -110,6 +209,8 @@ cdef class AsyncIOTask(class_decorator.BaseDecorator):
             f"{self._func!r}, "
             f"loop_getter={self.loop_getter!r}, "
             f"loop_getter_need_context={self.loop_getter_need_context!r}, "
+            f"cache={self.cache!r}, "
+            f"rate_limit={self.rate_limit!r}, "
             f") at 0x{id(self):X}>"
         )  # pragma: no cover
 
@@ -120,7 +221,9 @@ def asynciotask(  # noqa: F811
     loop_getter: typing.Union[
         typing.Callable[..., asyncio.AbstractEventLoop], asyncio.AbstractEventLoop
     ] = asyncio.get_event_loop,
-    loop_getter_need_context: bool = False
+    loop_getter_need_context: bool = False,
+    cache: typing.Optional[_result_cache.ResultCache] = None,
+    rate_limit: typing.Union[_rate_limit.RateLimiter, typing.Tuple[int, float], None] = None
 ) -> typing.Union[AsyncIOTask, typing.Callable[..., asyncio.Task]]:
     """Wrap function in future and return.
 
@@ -133,11 +236,25 @@ def asynciotask(  # noqa: F811
                        ]
     :param loop_getter_need_context: Loop getter requires function context
     :type loop_getter_need_context: bool
+    :param cache: Cache for call results. Cache hit returns done asyncio.Future without task.
+    :type cache: typing.Optional[ResultCache]
+    :param rate_limit: Calls limit: (calls, per_seconds) or RateLimiter. Throttled tasks are created by timer.
+    :type rate_limit: typing.Union[RateLimiter, typing.Tuple[int, float], None]
     :return: AsyncIOTask instance, if called as function or argumented decorator, else callable wrapper
     :rtype: typing.Union[AsyncIOTask, typing.Callable[..., asyncio.Task]]
     """
     if func is None:
-        return AsyncIOTask(func=func, loop_getter=loop_getter, loop_getter_need_context=loop_getter_need_context)
+        return AsyncIOTask(
+            func=func,
+            loop_getter=loop_getter,
+            loop_getter_need_context=loop_getter_need_context,
+            cache=cache,
+            rate_limit=rate_limit,
+        )
     return AsyncIOTask(  # type: ignore
-        func=None, loop_getter=loop_getter, loop_getter_need_context=loop_getter_need_context
+        func=None,
+        loop_getter=loop_getter,
+        loop_getter_need_context=loop_getter_need_context,
+        cache=cache,
+        rate_limit=rate_limit,
     )(func)
@@ -23,7 +23,9 @@ import typing
 # Local Implementation
 from . import class_decorator
 
-__all__ = ("APIPooled",)
+__all__ = ("DEFAULT_POOL", "APIPooled")
+
+DEFAULT_POOL = "default"
 
 
 class APIPooled(class_decorator.BaseDecorator, abc.ABC):
@@ -33,18 +35,34 @@ class APIPooled(class_decorator.BaseDecorator, abc.ABC):
 
     @classmethod
     @abc.abstractmethod
-    def configure(cls: type[APIPooled], max_workers: int | None = None) -> None:
+    def configure(cls: type[APIPooled], max_workers: int | None = None, *, pool: str = DEFAULT_POOL) -> None:
         """Pool executor create and configure.
 
         :param max_workers: Maximum workers
         :type max_workers: typing.Optional[int]
+        :param pool: Pool name
+        :type pool: str
         """
         raise NotImplementedError()  # pragma: no cover
 
     @classmethod
     @abc.abstractmethod
-    def shutdown(cls: type[APIPooled]) -> None:
-        """Shutdown executor."""
+    def shutdown(cls: type[APIPooled], pool: str | None = None) -> None:
+        """Shutdown executor.
+
+        :param pool: Pool name. If None: shutdown all pools.
+        :type pool: typing.Optional[str]
+        """
+        raise NotImplementedError()  # pragma: no cover
+
+    @classmethod
+    @abc.abstractmethod
+    def pools(cls: type[APIPooled]) -> dict[str, typing.Any]:
+        """Configured pools.
+
+        :return: pool name to executor mapping
+        :rtype: dict[str, typing.Any]
+        """
         raise NotImplementedError()  # pragma: no cover
 
     @property
@@ -0,0 +1,255 @@
+#    Copyright 2017 - 2020 Alexey Stepanov aka penguinolog
+##
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+
+#         http://www.apache.org/licenses/LICENSE-2.0
+
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Compact concurrent.futures.Future for short-lived submissions.
+
+Condition, waiters and callbacks lists are created only if required:
+most of futures are completed without waiting threads and callbacks.
+"""
+
+from __future__ import annotations
+
+# Standard Library
+import logging
+import threading
+import typing
+from concurrent.futures import _base
+
+if typing.TYPE_CHECKING:
+    from collections.abc import Callable
+
+    _Future = _base.Future[typing.Any]
+else:
+    _Future = _base.Future
+
+__all__ = ("CompactFuture",)
+
+LOGGER = logging.getLogger("concurrent.futures")
+
+_CANCELLED_STATES = (_base.CANCELLED, _base.CANCELLED_AND_NOTIFIED)
+_DONE_STATES = (_base.CANCELLED, _base.CANCELLED_AND_NOTIFIED, _base.FINISHED)
+
+
+class CompactFuture(_Future):
+    """concurrent.futures.Future with slots, single lock and lazy condition, waiters and callbacks.
+
+    Compatible with concurrent.futures.wait, concurrent.futures.as_completed and asyncio.wrap_future:
+    condition and waiters list are created on the first access by them.
+    """
+
+    __slots__ = ("__callbacks", "__condition", "__lock", "__waiters", "_exception", "_result", "_state")
+
+    def __init__(self) -> None:  # pylint: disable=super-init-not-called
+        """Compact future. Should not be called by clients."""
+        self.__lock: threading.Lock = threading.Lock()
+        self.__condition: threading.Condition | None = None
+        self.__waiters: list[typing.Any] | None = None
+        self.__callbacks: list[Callable[[CompactFuture], typing.Any]] | None = None
+        self._state: str = _base.PENDING
+        self._result: typing.Any = None
+        self._exception: BaseException | None = None
+
+    @property
+    def _condition(self) -> threading.Condition:  # type: ignore[override]
+        """Condition over the future lock, created on first access.
+
+        Should not be accessed under the future lock.
+
+        :rtype: threading.Condition
+        """
+        if self.__condition is None:
+            with self.__lock:
+                if self.__condition is None:
+                    self.__condition = threading.Condition(self.__lock)
+        return self.__condition
+
+    @property
+    def _waiters(self) -> list[typing.Any]:  # type: ignore[override]
+        """Waiters of concurrent.futures.wait and as_completed, created on first access under the future lock.
+
+        :rtype: list[typing.Any]
+        """
+        if self.__waiters is None:
+            self.__waiters = []
+        return self.__waiters
+
+    @property
+    def _done_callbacks(self) -> list[Callable[[CompactFuture], typing.Any]]:
+        """Done callbacks, created on first access under the future lock.
+
+        :rtype: list[Callable[[CompactFuture], typing.Any]]
+        """
+        if self.__callbacks is None:
+            self.__callbacks = []
+        return self.__callbacks
+
+    def __repr__(self) -> str:
+        """For debug purposes: without lock, state is read once.
+
+        :return: repr info
+        :rtype: str
+        """
+        state: str = self._state
+        info: str = f"{self.__class__.__name__} at 0x{id(self):x} state={_base._STATE_TO_DESCRIPTION_MAP[state]}"
+        if state == _base.FINISHED:
+            if self._exception is not None:
+                return f"<{info} raised {self._exception.__class__.__name__}>"
+            return f"<{info} returned {self._result.__class__.__name__}>"
+        return f"<{info}>"
+
+    def __notify(self) -> None:
+        """Wake up waiting threads, if any. Should be called under the future lock."""
+        if self.__condition is not None:
+            self.__condition.notify_all()
+
+    def _invoke_callbacks(self) -> None:
+        """Call done callbacks."""
+        for callback in self.__callbacks or ():
+            try:
+                callback(self)
+            except Exception:  # noqa: PERF203
+                LOGGER.exception("exception calling callback for %r", self)
+
+    def cancel(self) -> bool:
+        """Cancel the future if possible.
+
+        :return: future is cancelled
+        :rtype: bool
+        """
+        with self.__lock:
+            if self._state in {_base.RUNNING, _base.FINISHED}:
+                return False
+            if self._state in _CANCELLED_STATES:
+                return True
+            self._state = _base.CANCELLED
+            self.__notify()
+        self._invoke_callbacks()
+        return True
+
+    def cancelled(self) -> bool:
+        """Future is cancelled.
+
+        :rtype: bool
+        """
+        return self._state in _CANCELLED_STATES
+
+    def running(self) -> bool:
+        """Future is executing.
+
+        :rtype: bool
+        """
+        return self._state == _base.RUNNING
+
+    def done(self) -> bool:
+        """Future is cancelled or finished.
+
+        :rtype: bool
+        """
+        return self._state in _DONE_STATES
+
+    def add_done_callback(self, fn: Callable[[CompactFuture], typing.Any]) -> None:
+        """Attach callable to be called on future done. If future is done, callable is called immediately.
+
+        :param fn: callable with future as the only argument
+        :type fn: Callable[[CompactFuture], typing.Any]
+        """
+        with self.__lock:
+            if self._state not in _DONE_STATES:
+                self._done_callbacks.append(fn)
+                return
+        try:
+            fn(self)
+        except Exception:
+            LOGGER.exception("exception calling callback for %r", self)
+
+    def result(self, timeout: float | None = None) -> typing.Any:
+        """Get result of the call, wait for it if required.
+
+        :param timeout: Time to wait for result. If None: wait forever.
+        :type timeout: typing.Optional[float]
+        :return: result of the call
+        :rtype: typing.Any
+        :raises CancelledError: future is cancelled
+        :raises TimeoutError: future is not done before timeout
+        """
+        if self._state == _base.FINISHED and self._exception is None:
+            return self._result
+        return super().result(timeout)
+
+    def exception(self, timeout: float | None = None) -> BaseException | None:
+        """Get exception raised by the call, wait for it if required.
+
+        :param timeout: Time to wait for exception. If None: wait forever.
+        :type timeout: typing.Optional[float]
+        :return: exception raised by the call, None if call is completed without exception
+        :rtype: typing.Optional[BaseException]
+        :raises CancelledError: future is cancelled
+        :raises TimeoutError: future is not done before timeout
+        """
+        if self._state == _base.FINISHED:
+            return self._exception
+        return super().exception(timeout)
+
+    def set_running_or_notify_cancel(self) -> bool:
+        """Mark the future as running or notify waiters about cancel. Should be used by executor only.
+
+        :return: future is not cancelled
+        :rtype: bool
+        :raises RuntimeError: future is already running or done
+        """
+        with self.__lock:
+            if self._state == _base.CANCELLED:
+                self._state = _base.CANCELLED_AND_NOTIFIED
+                for waiter in self.__waiters or ():
+                    waiter.add_cancelled(self)
+                return False
+            if self._state == _base.PENDING:
+                self._state = _base.RUNNING
+                return True
+            LOGGER.critical("Future %s in unexpected state: %s", id(self), self._state)
+            raise RuntimeError("Future in unexpected state")
+
+    def set_result(self, result: typing.Any) -> None:
+        """Set result of the call. Should be used by executor only.
+
+        :param result: result of the call
+        :type result: typing.Any
+        :raises InvalidStateError: future is already done
+        """
+        with self.__lock:
+            if self._state in _DONE_STATES:
+                raise _base.InvalidStateError(f"{self._state}: {self!r}")
+            self._result = result
+            self._state = _base.FINISHED
+            for waiter in self.__waiters or ():
+                waiter.add_result(self)
+            self.__notify()
+        self._invoke_callbacks()
+
+    def set_exception(self, exception: BaseException | None) -> None:
+        """Set exception raised by the call. Should be used by executor only.
+
+        :param exception: exception raised by the call
+        :type exception: typing.Optional[BaseException]
+        :raises InvalidStateError: future is already done
+        """
+        with self.__lock:
+            if self._state in _DONE_STATES:
+                raise _base.InvalidStateError(f"{self._state}: {self!r}")
+            self._exception = exception
+            self._state = _base.FINISHED
+            for waiter in self.__waiters or ():
+                waiter.add_exception(self)
+            self.__notify()
+        self._invoke_callbacks()
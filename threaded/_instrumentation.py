@@ -0,0 +1,478 @@
+#    Copyright 2017 - 2020 Alexey Stepanov aka penguinolog
+##
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+
+#         http://www.apache.org/licenses/LICENSE-2.0
+
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Instrumentation of decorated functions: queue wait, run time, exceptions and calls in flight.
+
+Statistics are keyed by qualified name of the decorated function, latencies are recorded to the log-bucketed
+histograms with fixed memory. Disabled instrumentation costs single flag check per call.
+"""
+
+from __future__ import annotations
+
+# Standard Library
+import threading
+import time
+import typing
+
+if typing.TYPE_CHECKING:
+    from collections.abc import Awaitable
+    from collections.abc import Callable
+    from collections.abc import Coroutine
+
+__all__ = ("FunctionStats", "Histogram", "Instrumentation", "instrumentation", "qualified_name")
+
+SUB_BUCKETS = 4  # Buckets per power of 2: relative error is less than 25%
+_SUB_BUCKET_BITS = 2
+_OCTAVES = 40  # Up to 2 ** 40 nanoseconds (~18 minutes), longer durations are counted in the last bucket
+BUCKETS_COUNT = _OCTAVES * SUB_BUCKETS
+
+
+def _bucket_index(nanoseconds: int) -> int:
+    """Get histogram bucket index for the duration.
+
+    :param nanoseconds: duration in nanoseconds
+    :type nanoseconds: int
+    :return: bucket index
+    :rtype: int
+    """
+    if nanoseconds < SUB_BUCKETS:
+        return max(nanoseconds, 0)
+    octave: int = nanoseconds.bit_length() - 1
+    sub_bucket: int = (nanoseconds >> (octave - _SUB_BUCKET_BITS)) & (SUB_BUCKETS - 1)
+    return min((octave - 1) * SUB_BUCKETS + sub_bucket, BUCKETS_COUNT - 1)
+
+
+def _bucket_upper_bound(index: int) -> int:
+    """Get exclusive upper bound of the histogram bucket.
+
+    :param index: bucket index
+    :type index: int
+    :return: upper bound in nanoseconds
+    :rtype: int
+    """
+    if index < SUB_BUCKETS:
+        return index + 1
+    octave, sub_bucket = divmod(index, SUB_BUCKETS)
+    return (SUB_BUCKETS + sub_bucket + 1) << (octave - 1)
+
+
+def qualified_name(func: Callable[..., typing.Any]) -> str:
+    """Get statistics key for the function.
+
+    :param func: decorated function
+    :type func: Callable[..., typing.Any]
+    :return: module and qualified name
+    :rtype: str
+    """
+    name: str = getattr(func, "__qualname__", None) or getattr(func, "__name__", None) or repr(func)
+    module: str | None = getattr(func, "__module__", None)
+    return f"{module}.{name}" if module else name
+
+
+class Histogram:
+    """Histogram of durations with fixed memory: log-bucketed, 4 buckets per power of 2.
+
+    Not thread-safe: updated under the lock of FunctionStats.
+    """
+
+    __slots__ = ("__buckets", "__count", "__max", "__min", "__total")
+
+    def __init__(self) -> None:
+        """Histogram of durations with fixed memory."""
+        self.__buckets: list[int] = [0] * BUCKETS_COUNT
+        self.__count: int = 0
+        self.__total: float = 0.0
+        self.__min: float = 0.0
+        self.__max: float = 0.0
+
+    @property
+    def count(self) -> int:
+        """Amount of recorded durations.
+
+        :rtype: int
+        """
+        return self.__count
+
+    @property
+    def total(self) -> float:
+        """Sum of recorded durations in seconds.
+
+        :rtype: float
+        """
+        return self.__total
+
+    @property
+    def min(self) -> float:
+        """Minimal recorded duration in seconds, 0 if empty.
+
+        :rtype: float
+        """
+        return self.__min
+
+    @property
+    def max(self) -> float:
+        """Maximal recorded duration in seconds, 0 if empty.
+
+        :rtype: float
+        """
+        return self.__max
+
+    @property
+    def mean(self) -> float:
+        """Mean duration in seconds, 0 if empty.
+
+        :rtype: float
+        """
+        return self.__total / self.__count if self.__count else 0.0
+
+    def record(self, seconds: float) -> None:
+        """Record duration.
+
+        :param seconds: duration in seconds
+        :type seconds: float
+        """
+        self.__buckets[_bucket_index(int(seconds * 1e9))] += 1
+        if not self.__count or seconds < self.__min:
+            self.__min = seconds
+        self.__max = max(self.__max, seconds)
+        self.__count += 1
+        self.__total += seconds
+
+    def quantile(self, quantile: float) -> float:
+        """Estimate duration quantile: upper bound of the bucket, not greater than maximal duration.
+
+        :param quantile: quantile in range from 0 to 1
+        :type quantile: float
+        :return: duration in seconds, 0 if empty
+        :rtype: float
+        :raises ValueError: quantile is not in range from 0 to 1
+        """
+        if not 0 <= quantile <= 1:
+            raise ValueError("quantile must be in range from 0 to 1")
+        rank: float = quantile * self.__count
+        seen: int = 0
+        for index, count in enumerate(self.__buckets):
+            seen += count
+            if count and seen >= rank:
+                return min(_bucket_upper_bound(index) / 1e9, self.__max)
+        return self.__max
+
+    def buckets(self) -> tuple[tuple[float, int], ...]:
+        """Not empty buckets.
+
+        :return: upper bound in seconds and count for the not empty buckets in ascending order
+        :rtype: tuple[tuple[float, int], ...]
+        """
+        return tuple((_bucket_upper_bound(index) / 1e9, count) for index, count in enumerate(self.__buckets) if count)
+
+    def reset(self) -> None:
+        """Remove recorded durations."""
+        self.__buckets = [0] * BUCKETS_COUNT
+        self.__count = 0
+        self.__total = self.__min = self.__max = 0.0
+
+    def __repr__(self) -> str:  # pragma: no cover
+        """For debug purposes.
+
+        :return: repr info
+        :rtype: str
+        """
+        return (
+            f"<{self.__class__.__name__}("
+            f") count={self.count}, mean={self.mean:.6f}, p99={self.quantile(0.99):.6f}, max={self.max:.6f}>"
+        )
+
+
+class FunctionStats:
+    """Statistics of the decorated function calls."""
+
+    __slots__ = ("__calls", "__exceptions", "__in_flight", "__lock", "__name", "__queue_wait", "__run_time")
+
+    def __init__(self, name: str) -> None:
+        """Statistics of the decorated function calls.
+
+        :param name: qualified name of the function
+        :type name: str
+        """
+        self.__name: str = name
+        self.__lock: threading.Lock = threading.Lock()
+        self.__queue_wait: Histogram = Histogram()
+        self.__run_time: Histogram = Histogram()
+        self.__calls: int = 0
+        self.__exceptions: int = 0
+        self.__in_flight: int = 0
+
+    @property
+    def name(self) -> str:
+        """Qualified name of the function.
+
+        :rtype: str
+        """
+        return self.__name
+
+    @property
+    def queue_wait(self) -> Histogram:
+        """Time between call and start of execution (in worker, thread or event loop).
+
+        :rtype: Histogram
+        """
+        return self.__queue_wait
+
+    @property
+    def run_time(self) -> Histogram:
+        """Execution time.
+
+        :rtype: Histogram
+        """
+        return self.__run_time
+
+    @property
+    def calls(self) -> int:
+        """Amount of completed calls.
+
+        :rtype: int
+        """
+        return self.__calls
+
+    @property
+    def exceptions(self) -> int:
+        """Amount of calls completed by exception.
+
+        :rtype: int
+        """
+        return self.__exceptions
+
+    @property
+    def in_flight(self) -> int:
+        """Amount of started and not completed calls.
+
+        :rtype: int
+        """
+        return self.__in_flight
+
+    def start(self, queue_wait: float) -> None:
+        """Record call start.
+
+        :param queue_wait: time between call and start of execution in seconds
+        :type queue_wait: float
+        """
+        with self.__lock:
+            self.__queue_wait.record(queue_wait)
+            self.__in_flight += 1
+
+    def finish(self, run_time: float, failed: bool) -> None:
+        """Record call completion.
+
+        :param run_time: execution time in seconds
+        :type run_time: float
+        :param failed: call is completed by exception
+        :type failed: bool
+        """
+        with self.__lock:
+            self.__run_time.record(run_time)
+            self.__in_flight -= 1
+            self.__calls += 1
+            if failed:
+                self.__exceptions += 1
+
+    def reset(self) -> None:
+        """Reset statistics, except calls in flight."""
+        with self.__lock:
+            self.__queue_wait.reset()
+            self.__run_time.reset()
+            self.__calls = self.__exceptions = 0
+
+    def __repr__(self) -> str:  # pragma: no cover
+        """For debug purposes.
+
+        :return: repr info
+        :rtype: str
+        """
+        return (
+            f"<{self.__class__.__name__}("
+            f"name={self.name!r}, "
+            f") calls={self.calls}, exceptions={self.exceptions}, in_flight={self.in_flight}, "
+            f"queue_wait={self.queue_wait!r}, run_time={self.run_time!r}>"
+        )
+
+
+class _Call:
+    """Function call with recording of queue wait since creation, run time and exception."""
+
+    __slots__ = ("__created", "__func", "__stats")
+
+    def __init__(self, stats: FunctionStats, func: Callable[..., typing.Any]) -> None:
+        """Function call with recording of queue wait since creation, run time and exception.
+
+        :param stats: function statistics
+        :type stats: FunctionStats
+        :param func: function to call
+        :type func: Callable[..., typing.Any]
+        """
+        self.__stats: FunctionStats = stats
+        self.__func: Callable[..., typing.Any] = func
+        self.__created: float = time.perf_counter()
+
+    def __call__(self, *args: typing.Any, **kwargs: typing.Any) -> typing.Any:
+        """Call function and record statistics.
+
+        :return: function result
+        :rtype: typing.Any
+        """
+        started: float = time.perf_counter()
+        self.__stats.start(started - self.__created)
+        try:
+            result: typing.Any = self.__func(*args, **kwargs)
+        except BaseException:
+            self.__stats.finish(time.perf_counter() - started, failed=True)
+            raise
+        self.__stats.finish(time.perf_counter() - started, failed=False)
+        return result
+
+
+class _CoroutineCall:
+    """Coroutine function call with recording of event loop wait since creation, run time and exception."""
+
+    __slots__ = ("__created", "__func", "__stats")
+
+    def __init__(self, stats: FunctionStats, func: Callable[..., Awaitable[typing.Any]]) -> None:
+        """Coroutine function call with recording of event loop wait since creation, run time and exception.
+
+        :param stats: function statistics
+        :type stats: FunctionStats
+        :param func: coroutine function to call
+        :type func: Callable[..., Awaitable[typing.Any]]
+        """
+        self.__stats: FunctionStats = stats
+        self.__func: Callable[..., Awaitable[typing.Any]] = func
+        self.__created: float = time.perf_counter()
+
+    def __call__(self, *args: typing.Any, **kwargs: typing.Any) -> Coroutine[typing.Any, typing.Any, typing.Any]:
+        """Get coroutine, which calls function and records statistics.
+
+        Function is called on the first step of coroutine: not started coroutine is closed without warning.
+
+        :return: coroutine
+        :rtype: Coroutine[typing.Any, typing.Any, typing.Any]
+        """
+        return self.__run(args, kwargs)
+
+    async def __run(self, args: tuple[typing.Any, ...], kwargs: dict[str, typing.Any]) -> typing.Any:
+        """Await function result and record statistics.
+
+        :return: function result
+        :rtype: typing.Any
+        """
+        started: float = time.perf_counter()
+        self.__stats.start(started - self.__created)
+        try:
+            result: typing.Any = await self.__func(*args, **kwargs)
+        except BaseException:
+            self.__stats.finish(time.perf_counter() - started, failed=True)
+            raise
+        self.__stats.finish(time.perf_counter() - started, failed=False)
+        return result
+
+
+class Instrumentation:
+    """Statistics of the decorated functions calls, switchable at runtime. Disabled by default."""
+
+    __slots__ = ("__enabled", "__lock", "__stats")
+
+    def __init__(self) -> None:
+        """Statistics of the decorated functions calls."""
+        self.__enabled: bool = False
+        self.__lock: threading.Lock = threading.Lock()
+        self.__stats: dict[str, FunctionStats] = {}
+
+    @property
+    def enabled(self) -> bool:
+        """Statistics is recorded for the new calls.
+
+        :rtype: bool
+        """
+        return self.__enabled
+
+    def enable(self) -> None:
+        """Start recording statistics for the new calls."""
+        self.__enabled = True
+
+    def disable(self) -> None:
+        """Stop recording statistics for the new calls. Recorded statistics is kept."""
+        self.__enabled = False
+
+    def get(self, name: str) -> FunctionStats:
+        """Get statistics of the function, create if not exists.
+
+        :param name: qualified name of the function
+        :type name: str
+        :return: function statistics
+        :rtype: FunctionStats
+        """
+        stats: FunctionStats | None = self.__stats.get(name)
+        if stats is None:
+            with self.__lock:
+                stats = self.__stats.setdefault(name, FunctionStats(name))
+        return stats
+
+    def stats(self) -> dict[str, FunctionStats]:
+        """Statistics of the called functions.
+
+        :return: qualified name to statistics mapping (snapshot)
+        :rtype: dict[str, FunctionStats]
+        """
+        with self.__lock:
+            return dict(self.__stats)
+
+    def reset(self) -> None:
+        """Reset statistics of all functions."""
+        for stats in self.stats().values():
+            stats.reset()
+
+    def wrap(self, name: str, func: Callable[..., typing.Any]) -> Callable[..., typing.Any]:
+        """Get callable, which records statistics of the call. Queue wait is counted from now.
+
+        :param name: qualified name of the function
+        :type name: str
+        :param func: function to call
+        :type func: Callable[..., typing.Any]
+        :return: instrumented callable
+        :rtype: Callable[..., typing.Any]
+        """
+        return _Call(self.get(name), func)
+
+    def wrap_coroutine(
+        self, name: str, func: Callable[..., Awaitable[typing.Any]]
+    ) -> Callable[..., Coroutine[typing.Any, typing.Any, typing.Any]]:
+        """Get coroutine function, which records statistics of the call. Event loop wait is counted from now.
+
+        :param name: qualified name of the function
+        :type name: str
+        :param func: coroutine function to call
+        :type func: Callable[..., Awaitable[typing.Any]]
+        :return: instrumented coroutine function
+        :rtype: Callable[..., Coroutine[typing.Any, typing.Any, typing.Any]]
+        """
+        return _CoroutineCall(self.get(name), func)
+
+    def __repr__(self) -> str:  # pragma: no cover
+        """For debug purposes.
+
+        :return: repr info
+        :rtype: str
+        """
+        return f"<{self.__class__.__name__}() enabled={self.enabled}, functions={len(self.__stats)}>"
+
+
+instrumentation: Instrumentation = Instrumentation()
@@ -0,0 +1,384 @@
+#    Copyright 2017 - 2020 Alexey Stepanov aka penguinolog
+##
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+
+#         http://www.apache.org/licenses/LICENSE-2.0
+
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""InterpreterPooled implementation.
+
+Subinterpreters with own GIL are used, if concurrent.futures.InterpreterPoolExecutor is available (Python 3.14+)
+and package is not compiled (extension modules can not be imported in isolated interpreters).
+Else threads are used.
+
+Asyncio is supported
+"""
+
+from __future__ import annotations
+
+# Standard Library
+import asyncio
+import concurrent.futures
+import functools
+import os
+import threading
+import typing
+
+# Local Implementation
+from . import _base_threaded
+from . import _processpooled
+from . import _threadpooled
+
+if typing.TYPE_CHECKING:
+    from asyncio import AbstractEventLoop
+    from asyncio import Task
+    from collections.abc import Awaitable
+    from collections.abc import Callable
+
+    from typing_extensions import ParamSpec
+
+    Spec = ParamSpec("Spec")
+
+__all__ = ("INTERPRETERS_AVAILABLE", "InterpreterPooled", "interpreterpooled")
+
+_InterpreterPoolExecutor: type[concurrent.futures.ThreadPoolExecutor] | None = getattr(
+    concurrent.futures, "InterpreterPoolExecutor", None
+)
+
+INTERPRETERS_AVAILABLE: bool = _InterpreterPoolExecutor is not None and __file__.endswith(".py")
+
+
+def _call(
+    target: Callable[..., typing.Any] | tuple[str, str],
+    args: tuple[typing.Any, ...],
+    kwargs: dict[str, typing.Any],
+) -> typing.Any:
+    """Call function in the worker interpreter.
+
+    :param target: function or module and qualified name of the decorated function
+    :type target: typing.Union[Callable[..., typing.Any], tuple[str, str]]
+    :param args: positional arguments
+    :type args: tuple[typing.Any, ...]
+    :param kwargs: keyword arguments
+    :type kwargs: dict[str, typing.Any]
+    :return: call result
+    :rtype: typing.Any
+    """
+    return _processpooled.resolve_target(target)(*args, **kwargs)
+
+
+def _resolve_max_workers(max_workers: int | None) -> int:
+    """Get workers count of the executor created with max_workers.
+
+    :param max_workers: Maximum workers. If None: default of the executor.
+    :type max_workers: typing.Optional[int]
+    :return: maximum workers
+    :rtype: int
+    """
+    if max_workers is not None:
+        return max_workers
+    # InterpreterPoolExecutor is available on Python 3.14+ only, which respects process CPU affinity
+    cpu_count: Callable[[], int | None] = (
+        getattr(os, "process_cpu_count", os.cpu_count) if INTERPRETERS_AVAILABLE else os.cpu_count
+    )
+    return min(32, (cpu_count() or 1) + 4)
+
+
+def _is_shutdown(executor: concurrent.futures.ThreadPoolExecutor) -> bool:
+    """Get executor shutdown state: interpreter pool has no public reader.
+
+    :param executor: executor instance
+    :type executor: concurrent.futures.ThreadPoolExecutor
+    :rtype: bool
+    """
+    return executor._shutdown or executor._broken is not False
+
+
+class InterpreterPooled(_base_threaded.APIPooled):
+    """Post function to InterpreterPoolExecutor or ThreadPoolExecutor, if subinterpreters are not available."""
+
+    __slots__ = ("__loop_getter", "__loop_getter_need_context", "__pool")
+
+    __executors: typing.ClassVar[dict[str, concurrent.futures.ThreadPoolExecutor]] = {}
+    __executors_lock: typing.ClassVar[threading.RLock] = threading.RLock()
+
+    @classmethod
+    def configure(
+        cls: type[InterpreterPooled],
+        max_workers: int | None = None,
+        *,
+        pool: str = _base_threaded.DEFAULT_POOL,
+    ) -> None:
+        """Pool executor create and configure.
+
+        If pool is configured with other max_workers, new executor is used for new calls,
+        while old one completes queued calls in background.
+
+        :param max_workers: Maximum workers
+        :type max_workers: typing.Optional[int]
+        :param pool: Pool name
+        :type pool: str
+        """
+        with cls.__executors_lock:
+            executor: concurrent.futures.ThreadPoolExecutor | None = cls.__executors.get(pool)
+            if executor is not None and not _is_shutdown(executor):
+                if executor._max_workers == _resolve_max_workers(max_workers):
+                    return
+                executor.shutdown(wait=False)
+
+            if INTERPRETERS_AVAILABLE:
+                cls.__executors[pool] = _InterpreterPoolExecutor(max_workers=max_workers)  # type: ignore[misc]
+            else:
+                cls.__executors[pool] = _threadpooled.ThreadPoolExecutor(max_workers=max_workers)
+
+    @classmethod
+    def shutdown(cls: type[InterpreterPooled], pool: str | None = None) -> None:
+        """Shutdown executor.
+
+        :param pool: Pool name. If None: shutdown all pools.
+        :type pool: typing.Optional[str]
+        """
+        executors: tuple[concurrent.futures.ThreadPoolExecutor, ...] = ()
+        with cls.__executors_lock:
+            if pool is None:
+                executors = tuple(cls.__executors.values())
+            elif pool in cls.__executors:
+                executors = (cls.__executors[pool],)
+        # Wait outside of lock: running calls can get executor
+        for executor in executors:
+            executor.shutdown()
+
+    @classmethod
+    def pools(cls: type[InterpreterPooled]) -> dict[str, concurrent.futures.ThreadPoolExecutor]:
+        """Configured pools.
+
+        :return: pool name to executor mapping (snapshot), including shut down executors
+        :rtype: dict[str, concurrent.futures.ThreadPoolExecutor]
+        """
+        return dict(cls.__executors)
+
+    @property
+    def executor(self) -> concurrent.futures.ThreadPoolExecutor:
+        """Executor instance: InterpreterPoolExecutor or ThreadPoolExecutor. Shut down executor is recreated.
+
+        :rtype: concurrent.futures.ThreadPoolExecutor
+        """
+        executor: concurrent.futures.ThreadPoolExecutor | None = self.__executors.get(self.__pool)
+        if executor is None or _is_shutdown(executor):
+            with self.__executors_lock:  # Only one executor is created by concurrent calls
+                executor = self.__executors.get(self.__pool)
+                if executor is None or _is_shutdown(executor):
+                    self.configure(pool=self.__pool)
+                    executor = self.__executors[self.__pool]
+        return executor
+
+    def __init__(
+        self,
+        func: Callable[..., Awaitable[typing.Any] | typing.Any] | None = None,
+        *,
+        loop_getter: None | (Callable[..., AbstractEventLoop] | AbstractEventLoop) = None,
+        loop_getter_need_context: bool = False,
+        pool: str = _base_threaded.DEFAULT_POOL,
+    ) -> None:
+        """Wrap function in future and return.
+
+        :param func: function to wrap
+        :type func: typing.Optional[Callable]
+        :param loop_getter: Method to get event loop, if wrap in asyncio task
+        :type loop_getter: typing.Union[
+                               None,
+                               Callable[..., AbstractEventLoop],
+                               AbstractEventLoop
+                           ]
+        :param loop_getter_need_context: Loop getter requires function context
+        :type loop_getter_need_context: bool
+        :param pool: Name of the pool to execute in
+        :type pool: str
+        """
+        super().__init__(func=func)
+        self.__loop_getter: None | (Callable[..., AbstractEventLoop] | AbstractEventLoop) = loop_getter
+        self.__loop_getter_need_context: bool = loop_getter_need_context
+        self.__pool: str = pool
+
+    @property
+    def loop_getter(
+        self,
+    ) -> Callable[..., AbstractEventLoop] | AbstractEventLoop | None:
+        """Loop getter.
+
+        :rtype: typing.Union[None, Callable[..., AbstractEventLoop], AbstractEventLoop]
+        """
+        return self.__loop_getter
+
+    @property
+    def loop_getter_need_context(self) -> bool:
+        """Loop getter need execution context.
+
+        :rtype: bool
+        """
+        return self.__loop_getter_need_context
+
+    @property
+    def pool(self) -> str:
+        """Name of the pool to execute in.
+
+        :rtype: str
+        """
+        return self.__pool
+
+    def _get_loop(self, *args: typing.Any, **kwargs: typing.Any) -> AbstractEventLoop | None:
+        """Get event loop in decorator class.
+
+        :return: event loop if available or getter available
+        :rtype: Optional[AbstractEventLoop]
+        """
+        if callable(self.loop_getter):
+            if self.loop_getter_need_context:
+                return self.loop_getter(*args, **kwargs)  # pylint: disable=not-callable
+            return self.loop_getter()  # pylint: disable=not-callable
+        return self.loop_getter
+
+    def _get_function_wrapper(
+        self, func: Callable[Spec, Awaitable[typing.Any] | typing.Any]
+    ) -> Callable[Spec, concurrent.futures.Future[typing.Any] | Awaitable[typing.Any]]:
+        """Here should be constructed and returned real decorator.
+
+        :param func: Wrapped function
+        :type func: Callable
+        :return: wrapped coroutine or function
+        :rtype: Callable[..., Union[Awaitable, concurrent.futures.Future]]
+        """
+        prepared = self._await_if_required(func, reuse_loop=True)
+
+        # noinspection PyMissingOrEmptyDocstring
+        @functools.wraps(prepared)
+        def wrapper(
+            *args: Spec.args, **kwargs: Spec.kwargs
+        ) -> concurrent.futures.Future[typing.Any] | Awaitable[typing.Any]:
+            """Main function wrapper.
+
+            :return: coroutine or function
+            :rtype: Union[Awaitable, concurrent.futures.Future]
+            """
+            loop: AbstractEventLoop | None = self._get_loop(*args, **kwargs)
+            future: concurrent.futures.Future[typing.Any]
+            if INTERPRETERS_AVAILABLE:
+                # Function is pickled to the worker interpreter, where decorator replaces it in the module
+                future = self.executor.submit(_call, _processpooled.get_target(func), args, kwargs)
+            else:
+                future = self.executor.submit(prepared, *args, **kwargs)
+            if loop is None:
+                return future
+            return asyncio.wrap_future(future, loop=loop)
+
+        return wrapper
+
+    def __call__(
+        self,
+        *args: Callable[..., Awaitable[typing.Any] | typing.Any] | typing.Any,
+        **kwargs: typing.Any,
+    ) -> (
+        concurrent.futures.Future[typing.Any]
+        | Awaitable[typing.Any]
+        | Callable[..., concurrent.futures.Future[typing.Any] | Awaitable[typing.Any]]
+    ):
+        """Callable instance.
+
+        :return: Future, Awaitable or it's getter (depends of decoration way and asyncio.Loop provided)
+        :rtype: Union[concurrent.futures.Future[Any], Awaitable[Any] Callable[..., ...]]
+        """
+        return super().__call__(*args, **kwargs)  # type: ignore[no-any-return]
+
+    def __repr__(self) -> str:  # pragma: no cover
+        """For debug purposes.
+
+        :return: repr info
+        :rtype: str
+        """
+        return (
+            f"<{self.__class__.__name__}("
+            f"{self._func!r}, "
+            f"loop_getter={self.loop_getter!r}, "
+            f"loop_getter_need_context={self.loop_getter_need_context!r}, "
+            f"pool={self.pool!r}, "
+            f") at 0x{id(self):X}>"
+        )
+
+
+@typing.overload
+def interpreterpooled(
+    func: Callable[..., Awaitable[typing.Any] | typing.Any],
+    *,
+    loop_getter: None = None,
+    loop_getter_need_context: bool = False,
+    pool: str = _base_threaded.DEFAULT_POOL,
+) -> Callable[..., concurrent.futures.Future[typing.Any]]:
+    """Overload: function callable, no loop getter."""
+
+
+@typing.overload
+def interpreterpooled(
+    func: Callable[..., Awaitable[typing.Any] | typing.Any],
+    *,
+    loop_getter: Callable[..., AbstractEventLoop] | AbstractEventLoop,
+    loop_getter_need_context: bool = False,
+    pool: str = _base_threaded.DEFAULT_POOL,
+) -> Callable[..., Task[typing.Any]]:
+    """Overload: function callable, loop getter available."""
+
+
+@typing.overload
+def interpreterpooled(
+    func: None = None,
+    *,
+    loop_getter: None | Callable[..., AbstractEventLoop] | AbstractEventLoop = None,
+    loop_getter_need_context: bool = False,
+    pool: str = _base_threaded.DEFAULT_POOL,
+) -> InterpreterPooled:
+    """Overload: No function."""
+
+
+def interpreterpooled(
+    func: Callable[..., Awaitable[typing.Any] | typing.Any] | None = None,
+    *,
+    loop_getter: None | Callable[..., AbstractEventLoop] | AbstractEventLoop = None,
+    loop_getter_need_context: bool = False,
+    pool: str = _base_threaded.DEFAULT_POOL,
+) -> InterpreterPooled | Callable[..., concurrent.futures.Future[typing.Any] | Awaitable[typing.Any]]:
+    """Post function to InterpreterPoolExecutor or ThreadPoolExecutor, if subinterpreters are not available.
+
+    :param func: function to wrap
+    :type func: typing.Optional[Callable[..., typing.Union[Awaitable, typing.Any]]]
+    :param loop_getter: Method to get event loop, if wrap in asyncio task
+    :type loop_getter: typing.Union[
+                           None,
+                           Callable[..., AbstractEventLoop],
+                           AbstractEventLoop
+                       ]
+    :param loop_getter_need_context: Loop getter requires function context
+    :type loop_getter_need_context: bool
+    :param pool: Name of the pool to execute in
+    :type pool: str
+    :return: InterpreterPooled instance, if called as function or argumented decorator, else callable wrapper
+    :rtype: typing.Union[InterpreterPooled, Callable[..., typing.Union[concurrent.futures.Future, Awaitable]]]
+    """
+    if func is None:
+        return InterpreterPooled(
+            func=func,
+            loop_getter=loop_getter,
+            loop_getter_need_context=loop_getter_need_context,
+            pool=pool,
+        )
+    return InterpreterPooled(  # type: ignore[return-value]
+        func=None,
+        loop_getter=loop_getter,
+        loop_getter_need_context=loop_getter_need_context,
+        pool=pool,
+    )(func)
@@ -0,0 +1,239 @@
+#    Copyright 2017 - 2020 Alexey Stepanov aka penguinolog
+##
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+
+#         http://www.apache.org/licenses/LICENSE-2.0
+
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Bridge from the pool workers to the asyncio event loop.
+
+Worker completes asyncio.Future directly, without concurrent.futures.Future and chaining callbacks.
+Completions are delivered to the event loop in batches: one call_soon_threadsafe per batch.
+"""
+
+from __future__ import annotations
+
+# Standard Library
+import contextlib
+import threading
+import typing
+import weakref
+
+if typing.TYPE_CHECKING:
+    import asyncio
+    from asyncio import AbstractEventLoop
+    from collections.abc import Callable
+
+__all__ = ("LoopCompletions", "LoopWorkItem", "get_completions")
+
+_PENDING = 0
+_RUNNING = 1
+_CANCELLED = 2
+
+
+class LoopCompletions:
+    """Completed work items queue for the event loop."""
+
+    __slots__ = ("__items", "__lock", "__loop_ref", "__scheduled")
+
+    def __init__(self, loop: AbstractEventLoop) -> None:
+        """Completed work items queue for the event loop.
+
+        :param loop: event loop to deliver results
+        :type loop: AbstractEventLoop
+        """
+        # Weak reference without callback is reused by weakref.ref(loop) on lookup in the registry
+        self.__loop_ref: weakref.ref[AbstractEventLoop] = weakref.ref(loop)
+        self.__lock: threading.Lock = threading.Lock()
+        self.__items: list[LoopWorkItem] = []
+        self.__scheduled: bool = False
+
+    @property
+    def lock(self) -> threading.Lock:
+        """Lock for the work items state change.
+
+        :rtype: threading.Lock
+        """
+        return self.__lock
+
+    def put(self, item: LoopWorkItem) -> None:
+        """Put completed work item. Event loop is woken up only by the first item in batch.
+
+        :param item: completed or cancelled work item
+        :type item: LoopWorkItem
+        """
+        with self.__lock:
+            self.__items.append(item)
+            if self.__scheduled:
+                return
+            self.__scheduled = True
+
+        loop: AbstractEventLoop | None = self.__loop_ref()
+        if loop is not None:
+            with contextlib.suppress(RuntimeError):  # Event loop is closed
+                loop.call_soon_threadsafe(self.__flush)
+                return
+        # Nobody can wait for results
+        with self.__lock:
+            self.__items.clear()
+            self.__scheduled = False
+
+    def __flush(self) -> None:
+        """Complete futures of the work items batch. Called in the event loop."""
+        with self.__lock:
+            items, self.__items = self.__items, []
+            self.__scheduled = False
+        for item in items:
+            item.complete()
+
+
+class LoopWorkItem:
+    """Executor work item with result delivered to asyncio.Future."""
+
+    __slots__ = (
+        "__args",
+        "__completions",
+        "__exception",
+        "__fn",
+        "__future",
+        "__kwargs",
+        "__result",
+        "__state",
+        "__weakref__",
+    )
+
+    def __init__(
+        self,
+        completions: LoopCompletions,
+        future: asyncio.Future[typing.Any],
+        fn: Callable[..., typing.Any],
+        args: tuple[typing.Any, ...],
+        kwargs: dict[str, typing.Any],
+    ) -> None:
+        """Executor work item with result delivered to asyncio.Future.
+
+        :param completions: completions queue of the future event loop
+        :type completions: LoopCompletions
+        :param future: future for the call result
+        :type future: asyncio.Future[typing.Any]
+        :param fn: callable to execute
+        :type fn: Callable[..., typing.Any]
+        :param args: positional arguments
+        :type args: tuple[typing.Any, ...]
+        :param kwargs: keyword arguments
+        :type kwargs: dict[str, typing.Any]
+        """
+        self.__completions: LoopCompletions = completions
+        self.__future: asyncio.Future[typing.Any] = future
+        self.__fn: Callable[..., typing.Any] = fn
+        self.__args: tuple[typing.Any, ...] = args
+        self.__kwargs: dict[str, typing.Any] = kwargs
+        self.__state: int = _PENDING
+        self.__result: typing.Any = None
+        self.__exception: BaseException | None = None
+
+    @property
+    def future(self) -> LoopWorkItem:
+        """Work item itself: cancellation API for the work queue and executor shutdown.
+
+        :rtype: LoopWorkItem
+        """
+        return self
+
+    @property
+    def loop_future(self) -> asyncio.Future[typing.Any]:
+        """Future for the call result.
+
+        :rtype: asyncio.Future[typing.Any]
+        """
+        return self.__future
+
+    def cancelled(self) -> bool:
+        """Work item is cancelled by executor or by the future owner.
+
+        :rtype: bool
+        """
+        return self.__state == _CANCELLED or self.__future.cancelled()
+
+    def done(self) -> bool:
+        """Work item is started or cancelled.
+
+        :rtype: bool
+        """
+        return self.__state != _PENDING or self.__future.done()
+
+    def exception(self) -> BaseException | None:
+        """Exception raised by the call, None if call is not completed or completed without exception.
+
+        :rtype: typing.Optional[BaseException]
+        """
+        return self.__exception
+
+    def cancel(self) -> bool:
+        """Cancel not started work item. Thread-safe: future is cancelled in the event loop.
+
+        :return: work item is cancelled
+        :rtype: bool
+        """
+        with self.__completions.lock:
+            if self.__state != _PENDING:
+                return False
+            self.__state = _CANCELLED
+        self.__completions.put(self)
+        return True
+
+    def run(self) -> None:
+        """Execute callable in the worker and send result to the event loop."""
+        with self.__completions.lock:
+            if self.__state != _PENDING or self.__future.cancelled():
+                return
+            self.__state = _RUNNING
+
+        try:
+            self.__result = self.__fn(*self.__args, **self.__kwargs)
+        except StopIteration as exc:  # Can not be set to asyncio.Future
+            self.__exception = RuntimeError("StopIteration raised by the pooled function")
+            self.__exception.__cause__ = exc
+        except BaseException as exc:  # noqa: BLE001
+            self.__exception = exc
+        del self.__fn, self.__args, self.__kwargs
+        self.__completions.put(self)
+        # Break reference cycle: exception -> traceback -> this frame -> work item
+        del self
+
+    def complete(self) -> None:
+        """Set result or cancel the future. Called in the event loop."""
+        if self.__future.cancelled():
+            return
+        if self.__state == _CANCELLED:
+            self.__future.cancel()
+        elif self.__exception is not None:
+            self.__future.set_exception(self.__exception)
+        else:
+            self.__future.set_result(self.__result)
+
+
+_completions: weakref.WeakKeyDictionary[AbstractEventLoop, LoopCompletions] = weakref.WeakKeyDictionary()
+_completions_lock = threading.Lock()
+
+
+def get_completions(loop: AbstractEventLoop) -> LoopCompletions:
+    """Get completions queue for the event loop.
+
+    :param loop: event loop
+    :type loop: AbstractEventLoop
+    :return: completions queue shared by all executors
+    :rtype: LoopCompletions
+    """
+    completions: LoopCompletions | None = _completions.get(loop)
+    if completions is None:
+        with _completions_lock:
+            completions = _completions.setdefault(loop, LoopCompletions(loop))
+    return completions
@@ -0,0 +1,341 @@
+#    Copyright 2017 - 2020 Alexey Stepanov aka penguinolog
+##
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+
+#         http://www.apache.org/licenses/LICENSE-2.0
+
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Event loop lag monitor and blocking calls detector.
+
+Heartbeat callback in the event loop measures scheduling lag. Watcher thread detects overdue heartbeat
+and samples the event loop thread: stack and running task with AsyncIOTask wrapped coroutine in its await chain.
+AsyncIOTask functions are registered on decoration: calls are not affected.
+"""
+
+from __future__ import annotations
+
+# Standard Library
+import asyncio
+import collections
+import logging
+import threading
+import time
+import typing
+import weakref
+
+# Package Implementation
+from . import _instrumentation
+from . import _threaded
+from . import _watchdog
+
+if typing.TYPE_CHECKING:
+    from collections.abc import Callable
+    from types import CodeType
+
+__all__ = ("BlockingCall", "LoopMonitor", "register")
+
+LOGGER = logging.getLogger("threaded")
+
+# Code of AsyncIOTask wrapped functions to the qualified name, not kept after function is collected
+_wrapped: weakref.WeakKeyDictionary[CodeType, str] = weakref.WeakKeyDictionary()
+
+
+def register(func: Callable[..., typing.Any]) -> None:
+    """Register AsyncIOTask wrapped function to be recognized in the await chain of the running task.
+
+    :param func: wrapped coroutine function
+    :type func: Callable[..., typing.Any]
+    """
+    code: CodeType | None = getattr(func, "__code__", None)
+    if code is not None:
+        _wrapped[code] = _instrumentation.qualified_name(func)
+
+
+def _wrapped_function(task: asyncio.Task[typing.Any] | None) -> str | None:
+    """Find the innermost AsyncIOTask wrapped function in the await chain of the task.
+
+    :param task: running task
+    :type task: typing.Optional[asyncio.Task[typing.Any]]
+    :return: qualified name of the function, None if not found
+    :rtype: typing.Optional[str]
+    """
+    found: str | None = None
+    awaitable: typing.Any = task.get_coro() if task is not None else None
+    while awaitable is not None:
+        code: CodeType | None = getattr(awaitable, "cr_code", None) or getattr(awaitable, "gi_code", None)
+        found = _wrapped.get(code, found)  # type: ignore[arg-type]
+        awaitable = getattr(awaitable, "cr_await", None) or getattr(awaitable, "gi_yieldfrom", None)
+    return found
+
+
+class BlockingCall(typing.NamedTuple):
+    """Event loop callback, which blocked event loop longer than threshold."""
+
+    detected: float  # time.monotonic() of detection
+    duration: float  # Event loop lag caused by the call, seconds
+    task: str | None  # Name of the running task, None if plain callback was running
+    coroutine: str | None  # Qualified name of the running task coroutine
+    function: str | None  # Qualified name of the AsyncIOTask wrapped function in the await chain of the task
+    stack: str  # Event loop thread stack sampled on detection
+
+
+def _log_blocking(call: BlockingCall) -> None:
+    """Log blocking call with sampled stack.
+
+    :param call: blocking call
+    :type call: BlockingCall
+    """
+    LOGGER.warning(
+        "Event loop was blocked for %.3f s by task %s (%s):\n%s",
+        call.duration,
+        call.task,
+        call.function or call.coroutine,
+        call.stack,
+    )
+
+
+class LoopMonitor:
+    """Event loop lag monitor and blocking calls detector."""
+
+    __slots__ = (
+        "__beat_handle",
+        "__callback",
+        "__capacity",
+        "__expected",
+        "__interval",
+        "__lag",
+        "__lock",
+        "__loop",
+        "__loop_ident",
+        "__offenders",
+        "__pending",
+        "__skip",
+        "__stop",
+        "__threshold",
+        "__watcher",
+    )
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        *,
+        interval: float = 0.05,
+        threshold: float = 0.1,
+        capacity: int = 100,
+        callback: Callable[[BlockingCall], typing.Any] | None = None,
+    ) -> None:
+        """Event loop lag monitor and blocking calls detector.
+
+        :param loop: monitored event loop
+        :type loop: asyncio.AbstractEventLoop
+        :param interval: Heartbeat interval, seconds
+        :type interval: float
+        :param threshold: Event loop lag, after which running callback is reported as blocking, seconds
+        :type threshold: float
+        :param capacity: Maximum blocking calls kept, the oldest are dropped
+        :type capacity: int
+        :param callback: Called for each blocking call in the event loop thread. If None: log warning.
+        :type callback: typing.Optional[Callable[[BlockingCall], typing.Any]]
+        :raises ValueError: interval or threshold is not positive or capacity is less than 1
+        """
+        if interval <= 0 or threshold <= 0:
+            raise ValueError("interval and threshold must be > 0")
+        if capacity < 1:
+            raise ValueError("capacity must be >= 1")
+        self.__loop: asyncio.AbstractEventLoop = loop
+        self.__interval: float = interval
+        self.__threshold: float = threshold
+        self.__capacity: int = capacity
+        self.__callback: Callable[[BlockingCall], typing.Any] = callback if callback is not None else _log_blocking
+        self.__lag: _instrumentation.Histogram = _instrumentation.Histogram()
+        self.__offenders: collections.deque[BlockingCall] = collections.deque(maxlen=capacity)
+        self.__lock: threading.Lock = threading.Lock()
+        self.__stop: threading.Event = threading.Event()
+        self.__watcher: threading.Thread | None = None
+        self.__beat_handle: asyncio.TimerHandle | None = None
+        self.__loop_ident: int | None = None
+        self.__expected: float | None = None  # Expected time of the next heartbeat
+        self.__pending: BlockingCall | None = None  # Blocking call detected and not finished yet
+        self.__skip: bool = False  # Event loop was not running: do not record the next heartbeat lag
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """Monitored event loop.
+
+        :rtype: asyncio.AbstractEventLoop
+        """
+        return self.__loop
+
+    @property
+    def interval(self) -> float:
+        """Heartbeat interval.
+
+        :rtype: float
+        """
+        return self.__interval
+
+    @property
+    def threshold(self) -> float:
+        """Event loop lag, after which running callback is reported as blocking.
+
+        :rtype: float
+        """
+        return self.__threshold
+
+    @property
+    def capacity(self) -> int:
+        """Maximum blocking calls kept.
+
+        :rtype: int
+        """
+        return self.__capacity
+
+    @property
+    def lag(self) -> _instrumentation.Histogram:
+        """Event loop scheduling lag of the heartbeats.
+
+        :rtype: Histogram
+        """
+        return self.__lag
+
+    @property
+    def running(self) -> bool:
+        """Monitor is started.
+
+        :rtype: bool
+        """
+        return self.__watcher is not None and self.__watcher.is_alive()
+
+    def blocking_calls(self) -> tuple[BlockingCall, ...]:
+        """Recent blocking calls, the oldest first.
+
+        :rtype: tuple[BlockingCall, ...]
+        """
+        with self.__lock:
+            return tuple(self.__offenders)
+
+    def reset(self) -> None:
+        """Remove recorded lag and blocking calls."""
+        with self.__lock:
+            self.__offenders.clear()
+            self.__lag.reset()
+
+    def start(self) -> LoopMonitor:
+        """Start heartbeat in the event loop and watcher thread. Can be called from any thread.
+
+        :return: monitor itself
+        :rtype: LoopMonitor
+        """
+        with self.__lock:
+            if self.running:
+                return self
+            self.__stop.clear()
+            self.__expected = None
+            self.__watcher = _threaded.threaded(self.__watch, daemon=True, started=True)()
+        self.__loop.call_soon_threadsafe(self.__beat, None)
+        return self
+
+    def stop(self) -> None:
+        """Stop heartbeat and watcher thread."""
+        with self.__lock:
+            watcher, self.__watcher = self.__watcher, None
+        self.__stop.set()
+        if not self.__loop.is_closed():
+            self.__loop.call_soon_threadsafe(self.__cancel_beat)
+        if watcher is not None and watcher is not threading.current_thread():
+            watcher.join()
+
+    def __cancel_beat(self) -> None:
+        """Cancel scheduled heartbeat. Called in the event loop."""
+        if self.__beat_handle is not None:
+            self.__beat_handle.cancel()
+            self.__beat_handle = None
+
+    def __beat(self, expected: float | None) -> None:
+        """Record lag and finish detected blocking call, schedule next heartbeat. Called in the event loop.
+
+        :param expected: expected time of this heartbeat, None for the first one
+        :type expected: typing.Optional[float]
+        """
+        now: float = self.__loop.time()
+        with self.__lock:
+            self.__loop_ident = threading.get_ident()
+            pending, self.__pending = self.__pending, None
+            skip, self.__skip = self.__skip, False
+            if expected is None:  # (Re)start: drop heartbeat scheduled before stop
+                self.__cancel_beat()
+                pending = None
+            elif skip:  # Event loop was not running: lag is not caused by callbacks
+                pending = None
+            else:
+                self.__lag.record(max(now - expected, 0.0))
+                if pending is not None:
+                    pending = pending._replace(duration=now - expected)
+                    self.__offenders.append(pending)
+            if self.__stop.is_set():
+                self.__beat_handle = None
+                return
+            self.__expected = now + self.__interval
+            self.__beat_handle = self.__loop.call_at(self.__expected, self.__beat, self.__expected)
+        if pending is not None:
+            try:
+                self.__callback(pending)
+            except Exception:
+                LOGGER.exception("Loop monitor callback failed")
+
+    def __watch(self) -> None:
+        """Detect overdue heartbeat and sample the event loop thread. Called in the watcher thread."""
+        period: float = min(self.__interval, self.__threshold) / 2
+        while not self.__stop.wait(period):
+            if not self.__loop.is_running():
+                with self.__lock:
+                    self.__skip = True
+                continue
+            with self.__lock:
+                expected: float | None = self.__expected
+                detected: bool = self.__pending is not None
+            if expected is None or detected or self.__loop.time() - expected < self.__threshold:
+                continue
+            self.__sample(expected)
+
+    def __sample(self, expected: float) -> None:
+        """Sample running task and stack of the event loop thread.
+
+        :param expected: expected time of the overdue heartbeat
+        :type expected: float
+        """
+        task: asyncio.Task[typing.Any] | None = asyncio.current_task(self.__loop)
+        coroutine: typing.Any = task.get_coro() if task is not None else None
+        call = BlockingCall(
+            detected=time.monotonic(),
+            duration=0.0,
+            task=task.get_name() if task is not None else None,
+            coroutine=getattr(coroutine, "__qualname__", None),
+            function=_wrapped_function(task),
+            stack=_watchdog.format_stack(self.__loop_ident),
+        )
+        with self.__lock:
+            if self.__expected == expected:  # Heartbeat was not executed during sampling: call is still running
+                self.__pending = call
+
+    def __repr__(self) -> str:  # pragma: no cover
+        """For debug purposes.
+
+        :return: repr info
+        :rtype: str
+        """
+        return (
+            f"<{self.__class__.__name__}("
+            f"{self.loop!r}, "
+            f"interval={self.interval!r}, "
+            f"threshold={self.threshold!r}, "
+            f"capacity={self.capacity!r}, "
+            f") running={self.running}>"
+        )
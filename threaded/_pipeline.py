@@ -0,0 +1,383 @@
+#    Copyright 2017 - 2020 Alexey Stepanov aka penguinolog
+##
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+
+#         http://www.apache.org/licenses/LICENSE-2.0
+
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Multi-stage pipeline: decorated functions linked by bounded queues.
+
+Pipeline is driven by the asyncio event loop: stage workers are tasks, which call stage function and await result
+(concurrent.futures.Future from ThreadPooled, asyncio.Task from AsyncIOTask, coroutine or plain value).
+Items are streamed through stages, full queue blocks upstream stage (backpressure).
+"""
+
+from __future__ import annotations
+
+# Standard Library
+import asyncio
+import concurrent.futures
+import inspect
+import time
+import typing
+
+if typing.TYPE_CHECKING:
+    from collections.abc import AsyncIterable
+    from collections.abc import AsyncIterator
+    from collections.abc import Callable
+    from collections.abc import Iterable
+
+__all__ = ("Pipeline", "PipelineStage", "StageStats")
+
+_END = object()  # End of stream marker
+
+
+class StageStats(typing.NamedTuple):
+    """Pipeline stage statistics."""
+
+    name: str
+    concurrency: int
+    processed: int  # Items passed to the next stage
+    running: int  # Calls in progress
+    throughput: float  # Processed items per second since pipeline start
+    queue_size: int  # Items waiting in the stage input queue
+    queue_maxsize: int
+    queue_peak: int  # Maximum queue occupancy since pipeline start
+
+
+async def _call(func: Callable[[typing.Any], typing.Any], item: typing.Any) -> typing.Any:
+    """Call stage function and wait for result.
+
+    :param func: stage function
+    :type func: Callable[[typing.Any], typing.Any]
+    :param item: stage input
+    :type item: typing.Any
+    :return: stage output
+    :rtype: typing.Any
+    """
+    result: typing.Any = func(item)
+    if isinstance(result, concurrent.futures.Future):
+        return await asyncio.wrap_future(result)
+    if inspect.isawaitable(result):
+        return await result
+    return result
+
+
+class PipelineStage:
+    """Pipeline stage: function with own concurrency and bounded input queue."""
+
+    __slots__ = (
+        "__concurrency",
+        "__finished",
+        "__func",
+        "__maxsize",
+        "__name",
+        "__processed",
+        "__queue",
+        "__queue_peak",
+        "__running",
+        "__started",
+    )
+
+    def __init__(
+        self,
+        func: Callable[[typing.Any], typing.Any],
+        *,
+        concurrency: int = 1,
+        maxsize: int | None = None,
+        name: str | None = None,
+    ) -> None:
+        """Pipeline stage: function with own concurrency and bounded input queue.
+
+        :param func: Stage function: called with single item, result is passed to the next stage
+        :type func: Callable[[typing.Any], typing.Any]
+        :param concurrency: Maximum concurrent calls
+        :type concurrency: int
+        :param maxsize: Input queue size. If None: equal to concurrency.
+        :type maxsize: typing.Optional[int]
+        :param name: Stage name for statistics. If None: function name.
+        :type name: typing.Optional[str]
+        :raises ValueError: concurrency or maxsize is less than 1
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be >= 1")
+        if maxsize is None:
+            maxsize = concurrency
+        if maxsize < 1:
+            raise ValueError("maxsize must be >= 1")
+        self.__func: Callable[[typing.Any], typing.Any] = func
+        self.__concurrency: int = concurrency
+        self.__maxsize: int = maxsize
+        self.__name: str = name if name is not None else getattr(func, "__name__", repr(func))
+        self.__queue: asyncio.Queue[typing.Any] | None = None
+        self.__processed: int = 0
+        self.__running: int = 0
+        self.__queue_peak: int = 0
+        self.__started: float = 0.0
+        self.__finished: float | None = None
+
+    @property
+    def func(self) -> Callable[[typing.Any], typing.Any]:
+        """Stage function.
+
+        :rtype: Callable[[typing.Any], typing.Any]
+        """
+        return self.__func
+
+    @property
+    def concurrency(self) -> int:
+        """Maximum concurrent calls.
+
+        :rtype: int
+        """
+        return self.__concurrency
+
+    @property
+    def maxsize(self) -> int:
+        """Input queue size.
+
+        :rtype: int
+        """
+        return self.__maxsize
+
+    @property
+    def name(self) -> str:
+        """Stage name.
+
+        :rtype: str
+        """
+        return self.__name
+
+    @property
+    def stats(self) -> StageStats:
+        """Stage statistics of the current or last pipeline run.
+
+        :rtype: StageStats
+        """
+        end: float = self.__finished if self.__finished is not None else time.monotonic()
+        elapsed: float = end - self.__started
+        return StageStats(
+            name=self.__name,
+            concurrency=self.__concurrency,
+            processed=self.__processed,
+            running=self.__running,
+            throughput=self.__processed / elapsed if self.__processed and elapsed > 0 else 0.0,
+            queue_size=self.__queue.qsize() if self.__queue is not None else 0,
+            queue_maxsize=self.__maxsize,
+            queue_peak=self.__queue_peak,
+        )
+
+    def _start(self) -> None:
+        """Reset statistics and create input queue. Called in the event loop on pipeline start."""
+        self.__queue = asyncio.Queue(self.__maxsize)
+        self.__processed = self.__running = self.__queue_peak = 0
+        self.__started = time.monotonic()
+        self.__finished = None
+
+    def _finish(self) -> None:
+        """Stop throughput measurement, if not stopped yet."""
+        if self.__finished is None:
+            self.__finished = time.monotonic()
+
+    async def _put(self, item: typing.Any) -> None:
+        """Put item to the input queue, wait for free place.
+
+        :param item: stage input
+        :type item: typing.Any
+        """
+        queue: asyncio.Queue[typing.Any] = self.__queue  # type: ignore[assignment]
+        await queue.put(item)
+        self.__queue_peak = max(self.__queue_peak, queue.qsize())
+
+    async def _put_end(self) -> None:
+        """Put end of stream markers for all workers."""
+        queue: asyncio.Queue[typing.Any] = self.__queue  # type: ignore[assignment]
+        for _ in range(self.__concurrency):
+            await queue.put(_END)
+
+    async def _work(self, put: Callable[[typing.Any], typing.Awaitable[None]]) -> None:
+        """Stage worker: process items until end of stream.
+
+        :param put: put result to the next stage
+        :type put: Callable[[typing.Any], typing.Awaitable[None]]
+        """
+        queue: asyncio.Queue[typing.Any] = self.__queue  # type: ignore[assignment]
+        while (item := await queue.get()) is not _END:
+            self.__running += 1
+            try:
+                result: typing.Any = await _call(self.__func, item)
+            finally:
+                self.__running -= 1
+            await put(result)
+            self.__processed += 1
+
+    def __repr__(self) -> str:  # pragma: no cover
+        """For debug purposes.
+
+        :return: repr info
+        :rtype: str
+        """
+        return (
+            f"<{self.__class__.__name__}("
+            f"{self.func!r}, "
+            f"concurrency={self.concurrency!r}, "
+            f"maxsize={self.maxsize!r}, "
+            f"name={self.name!r}, "
+            f") at 0x{id(self):X}>"
+        )
+
+
+class Pipeline:
+    """Multi-stage pipeline: stages are linked by bounded queues, items are streamed through stages.
+
+    Results are yielded in order of completion. Exception in stage stops pipeline and is raised to consumer.
+    """
+
+    __slots__ = ("__running", "__stages")
+
+    def __init__(self) -> None:
+        """Multi-stage pipeline: add stages by `stage` and process items by `run`."""
+        self.__stages: list[PipelineStage] = []
+        self.__running: bool = False
+
+    @property
+    def stages(self) -> tuple[PipelineStage, ...]:
+        """Pipeline stages.
+
+        :rtype: tuple[PipelineStage, ...]
+        """
+        return tuple(self.__stages)
+
+    def stage(
+        self,
+        func: Callable[[typing.Any], typing.Any],
+        *,
+        concurrency: int = 1,
+        maxsize: int | None = None,
+        name: str | None = None,
+    ) -> Pipeline:
+        """Add stage to the end of pipeline.
+
+        :param func: Stage function: called with single item, result is passed to the next stage
+        :type func: Callable[[typing.Any], typing.Any]
+        :param concurrency: Maximum concurrent calls
+        :type concurrency: int
+        :param maxsize: Input queue size. If None: equal to concurrency.
+        :type maxsize: typing.Optional[int]
+        :param name: Stage name for statistics. If None: function name.
+        :type name: typing.Optional[str]
+        :return: pipeline itself for chaining
+        :rtype: Pipeline
+        :raises RuntimeError: pipeline is running
+        """
+        if self.__running:
+            raise RuntimeError("Pipeline is running")
+        self.__stages.append(PipelineStage(func, concurrency=concurrency, maxsize=maxsize, name=name))
+        return self
+
+    def stats(self) -> tuple[StageStats, ...]:
+        """Statistics of the stages for the current or last run.
+
+        :rtype: tuple[StageStats, ...]
+        """
+        return tuple(stage.stats for stage in self.__stages)
+
+    async def run(self, items: Iterable[typing.Any] | AsyncIterable[typing.Any]) -> AsyncIterator[typing.Any]:
+        """Process items through pipeline stages.
+
+        :param items: source items
+        :type items: typing.Union[Iterable[typing.Any], AsyncIterable[typing.Any]]
+        :return: async iterator over results in order of completion
+        :rtype: AsyncIterator[typing.Any]
+        :raises ValueError: pipeline has no stages
+        :raises RuntimeError: pipeline is already running
+        """
+        if not self.__stages:
+            raise ValueError("Pipeline has no stages")
+        if self.__running:
+            raise RuntimeError("Pipeline is already running")
+        self.__running = True
+
+        stages: list[PipelineStage] = list(self.__stages)
+        # pylint: disable=protected-access
+        # Results are waiting for consumer: backpressure from consumer to the last stage
+        output: asyncio.Queue[typing.Any] = asyncio.Queue(stages[-1].concurrency)
+        for stage in stages:
+            stage._start()
+
+        failure: list[BaseException] = []
+
+        def on_done(task: asyncio.Task[None]) -> None:
+            """Stop pipeline on the first failure."""
+            if task.cancelled() or task.exception() is None or failure:
+                return
+            failure.append(task.exception())  # type: ignore[arg-type]
+            for other in tasks:
+                other.cancel()
+            while not output.empty():
+                output.get_nowait()
+            output.put_nowait(_END)
+
+        async def feed() -> None:
+            """Put source items to the first stage."""
+            first: PipelineStage = stages[0]
+            if hasattr(items, "__aiter__"):
+                async for item in items:
+                    await first._put(item)
+            else:
+                for item in items:
+                    await first._put(item)
+            await first._put_end()
+
+        async def work(index: int) -> None:
+            """Run stage workers and close the next stage after the last one."""
+            stage: PipelineStage = stages[index]
+            following: PipelineStage | None = stages[index + 1] if index + 1 < len(stages) else None
+            put: Callable[[typing.Any], typing.Awaitable[None]] = following._put if following else output.put
+            workers: list[asyncio.Future[None]] = [
+                asyncio.ensure_future(stage._work(put)) for _ in range(stage.concurrency)
+            ]
+            try:
+                await asyncio.gather(*workers)
+            finally:  # Failed or cancelled: workers blocked on queues should not outlive the pipeline
+                for worker in workers:
+                    worker.cancel()
+                await asyncio.gather(*workers, return_exceptions=True)
+            stage._finish()
+            if following:
+                await following._put_end()
+            else:
+                await output.put(_END)
+
+        tasks: list[asyncio.Task[None]] = [asyncio.ensure_future(feed())]
+        tasks.extend(asyncio.ensure_future(work(index)) for index in range(len(stages)))
+        for task in tasks:
+            task.add_done_callback(on_done)
+
+        try:
+            while (result := await output.get()) is not _END:
+                yield result
+            if failure:
+                raise failure[0]
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            for stage in stages:
+                stage._finish()
+            self.__running = False
+
+    def __repr__(self) -> str:  # pragma: no cover
+        """For debug purposes.
+
+        :return: repr info
+        :rtype: str
+        """
+        return f"<{self.__class__.__name__}(stages={self.stages!r}) running={self.__running}>"
@@ -0,0 +1,617 @@
+#    Copyright 2017 - 2020 Alexey Stepanov aka penguinolog
+##
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+
+#         http://www.apache.org/licenses/LICENSE-2.0
+
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""ProcessPooled implementation.
+
+Asyncio is supported
+"""
+
+from __future__ import annotations
+
+# Standard Library
+import asyncio
+import concurrent.futures
+import functools
+import importlib
+import multiprocessing
+import os
+import sys
+import threading
+import typing
+from multiprocessing import resource_tracker
+
+# Local Implementation
+from . import _base_threaded
+from . import _shared_memory
+from . import class_decorator
+
+if typing.TYPE_CHECKING:
+    from asyncio import AbstractEventLoop
+    from asyncio import Task
+    from collections.abc import Awaitable
+    from collections.abc import Callable
+    from multiprocessing import shared_memory
+
+    from typing_extensions import ParamSpec
+
+    Spec = ParamSpec("Spec")
+
+    _Future = concurrent.futures.Future[typing.Any]
+else:
+    _Future = concurrent.futures.Future
+
+__all__ = ("SHARED_MEMORY_THRESHOLD", "ProcessPooled", "processpooled")
+
+SHARED_MEMORY_THRESHOLD = 1 << 20
+
+# Functions resolved in the worker process: target to callable, which awaits coroutines
+_targets: dict[typing.Any, Callable[..., typing.Any]] = {}
+
+
+@functools.lru_cache(maxsize=None)
+def get_target(func: Callable[..., typing.Any]) -> Callable[..., typing.Any] | tuple[str, str]:
+    """Get picklable reference to the function for the worker process or interpreter.
+
+    Decorated function is replaced by the decorator in the module, so it is referenced by module and name
+    and unwrapped in the worker process.
+
+    :param func: wrapped function
+    :type func: Callable[..., typing.Any]
+    :return: function (if picklable as is) or module and qualified name of the decorated function
+    :rtype: typing.Union[Callable[..., typing.Any], tuple[str, str]]
+    :raises TypeError: function is not accessible by module and qualified name
+    """
+    module: str = func.__module__
+    qualname: str = func.__qualname__
+    target: object = sys.modules.get(module)
+    for name in qualname.split("."):
+        target = getattr(target, name, None)
+    if target is func:
+        return func
+    if getattr(target, "__wrapped__", None) is func:
+        return module, qualname
+    raise TypeError(f"{module}.{qualname} is not accessible by name: module level function is required")
+
+
+def resolve_target(target: Callable[..., typing.Any] | tuple[str, str]) -> Callable[..., typing.Any]:
+    """Get function in the worker process or interpreter.
+
+    :param target: function or module and qualified name of the decorated function
+    :type target: typing.Union[Callable[..., typing.Any], tuple[str, str]]
+    :return: function, which awaits coroutine if returned
+    :rtype: Callable[..., typing.Any]
+    """
+    func: Callable[..., typing.Any] | None = _targets.get(target)
+    if func is None:
+        if isinstance(target, tuple):
+            module, qualname = target
+            decorated: typing.Any = importlib.import_module(module)
+            for name in qualname.split("."):
+                decorated = getattr(decorated, name)
+            func = decorated.__wrapped__
+        else:
+            func = target
+        func = _targets[target] = class_decorator.BaseDecorator._await_if_required(func, reuse_loop=True)
+    return func
+
+
+def _execute(
+    target: Callable[..., typing.Any] | tuple[str, str],
+    args: tuple[typing.Any, ...],
+    kwargs: dict[str, typing.Any],
+    threshold: int | None,
+) -> typing.Any:
+    """Call function in the worker process: arguments and result buffers are passed through shared memory.
+
+    :param target: function or module and qualified name of the decorated function
+    :type target: typing.Union[Callable[..., typing.Any], tuple[str, str]]
+    :param args: positional arguments, buffers are replaced by descriptors
+    :type args: tuple[typing.Any, ...]
+    :param kwargs: keyword arguments, buffers are replaced by descriptors
+    :type kwargs: dict[str, typing.Any]
+    :param threshold: minimal size of bytes and bytearray result to pass through shared memory
+    :type threshold: typing.Optional[int]
+    :return: result or its descriptor
+    :rtype: typing.Any
+    """
+    attached: list[tuple[typing.Any, shared_memory.SharedMemory]] = []
+
+    def attach(value: typing.Any) -> typing.Any:
+        """Get argument from the shared memory if required."""
+        value, segment = _shared_memory.attach(value)
+        if segment is not None:
+            attached.append((value, segment))
+        return value
+
+    try:
+        result = resolve_target(target)(
+            *[attach(value) for value in args],
+            **{name: attach(value) for name, value in kwargs.items()},
+        )
+    finally:
+        for value, segment in attached:
+            _shared_memory.release(value, segment)
+    shared, result_segment = _shared_memory.export(result, threshold)
+    if result_segment is not None:
+        result_segment.close()  # Unlinked by the parent process after copy
+    return shared
+
+
+class _ProcessFuture(_Future):
+    """Caller future of the call in the worker processes.
+
+    Result is received from the execution future on completion, while running state and cancellation follow it:
+    call passed to the worker processes can not be cancelled, as with the executor future.
+    """
+
+    __slots__ = ("__execution",)
+
+    def __init__(self, execution: concurrent.futures.Future[typing.Any]) -> None:
+        """Caller future of the call in the worker processes.
+
+        :param execution: future of the execution in the worker processes
+        :type execution: concurrent.futures.Future[typing.Any]
+        """
+        super().__init__()
+        self.__execution: concurrent.futures.Future[typing.Any] = execution
+
+    def cancel(self) -> bool:
+        """Cancel the call if it is not passed to the worker processes yet.
+
+        :return: call is cancelled
+        :rtype: bool
+        """
+        if self.__execution.cancel() or self.__execution.done():
+            return super().cancel()
+        return False
+
+    def running(self) -> bool:
+        """Call is executed in the worker processes.
+
+        :rtype: bool
+        """
+        return super().running() or (self.__execution.running() and not self.done())
+
+
+def _complete(
+    destination: concurrent.futures.Future[typing.Any],
+    segments: list[shared_memory.SharedMemory],
+    source: concurrent.futures.Future[typing.Any],
+) -> None:
+    """Unlink arguments segments and copy result to the caller future.
+
+    :param destination: future provided to the caller
+    :type destination: concurrent.futures.Future[typing.Any]
+    :param segments: shared memory segments of arguments
+    :type segments: list[shared_memory.SharedMemory]
+    :param source: future of the execution in the worker process
+    :type source: concurrent.futures.Future[typing.Any]
+    """
+    for segment in segments:
+        _shared_memory.unlink(segment)
+    if source.cancelled():
+        destination.cancel()
+        return
+    exception: BaseException | None = source.exception()
+    if not destination.set_running_or_notify_cancel():
+        if exception is None:  # Cancelled by caller while passed to the worker: result segment should be unlinked
+            _shared_memory.receive_result(source.result())
+        return
+    if exception is not None:
+        destination.set_exception(exception)
+        return
+    try:
+        result: typing.Any = _shared_memory.receive_result(source.result())
+    except BaseException as exc:  # noqa: BLE001
+        destination.set_exception(exc)
+    else:
+        destination.set_result(result)
+
+
+class ProcessPoolExecutor(concurrent.futures.ProcessPoolExecutor):
+    """Provide readers for protected attributes.
+
+    Resource tracker is started before workers, so shared memory segments are tracked by the single process.
+    """
+
+    __slots__ = ("__mp_context",)
+
+    def __init__(self, max_workers: int | None = None, *, mp_context: str | None = None) -> None:
+        """Override init.
+
+        :param max_workers: Maximum workers allowed. If none: cpu_count()
+        :type max_workers: typing.Optional[int]
+        :param mp_context: multiprocessing start method. If None: default.
+        :type mp_context: typing.Optional[str]
+        """
+        if os.name == "posix":
+            resource_tracker.ensure_running()
+        super().__init__(
+            max_workers=max_workers,
+            mp_context=None if mp_context is None else multiprocessing.get_context(mp_context),
+        )
+        self.__mp_context: str | None = mp_context
+
+    @property
+    def max_workers(self) -> int:
+        """MaxWorkers.
+
+        :rtype: int
+        """
+        return self._max_workers  # type: ignore[attr-defined,no-any-return]
+
+    @property
+    def mp_context(self) -> str | None:
+        """Multiprocessing start method. If None: default.
+
+        :rtype: typing.Optional[str]
+        """
+        return self.__mp_context
+
+    @property
+    def is_shutdown(self) -> bool:
+        """Executor shutdown state.
+
+        :rtype: bool
+        """
+        return self._shutdown_thread
+
+    @property
+    def is_broken(self) -> bool:
+        """Executor is not usable: worker process was terminated abruptly.
+
+        :rtype: bool
+        """
+        return bool(self._broken)
+
+
+class ProcessPooled(_base_threaded.APIPooled):
+    """Post function to ProcessPoolExecutor."""
+
+    __slots__ = ("__loop_getter", "__loop_getter_need_context", "__pool", "__shared_memory_threshold")
+
+    __executors: typing.ClassVar[dict[str, ProcessPoolExecutor]] = {}
+    __executors_lock: typing.ClassVar[threading.RLock] = threading.RLock()
+
+    @classmethod
+    def configure(
+        cls: type[ProcessPooled],
+        max_workers: int | None = None,
+        *,
+        pool: str = _base_threaded.DEFAULT_POOL,
+        mp_context: str | None = None,
+    ) -> None:
+        """Pool executor create and configure.
+
+        If pool is configured with other parameters, new executor is used for new calls,
+        while old one completes queued calls in background.
+
+        :param max_workers: Maximum workers
+        :type max_workers: typing.Optional[int]
+        :param pool: Pool name
+        :type pool: str
+        :param mp_context: multiprocessing start method. If None: default.
+        :type mp_context: typing.Optional[str]
+        """
+        with cls.__executors_lock:
+            executor: ProcessPoolExecutor | None = cls.__executors.get(pool)
+            if executor is not None and not executor.is_shutdown and not executor.is_broken:
+                if executor.mp_context == mp_context and executor.max_workers == (max_workers or os.cpu_count()):
+                    return
+                executor.shutdown(wait=False)
+
+            cls.__executors[pool] = ProcessPoolExecutor(max_workers=max_workers, mp_context=mp_context)
+
+    @classmethod
+    def shutdown(cls: type[ProcessPooled], pool: str | None = None) -> None:
+        """Shutdown executor.
+
+        :param pool: Pool name. If None: shutdown all pools.
+        :type pool: typing.Optional[str]
+        """
+        executors: tuple[ProcessPoolExecutor, ...] = ()
+        with cls.__executors_lock:
+            if pool is None:
+                executors = tuple(cls.__executors.values())
+            elif pool in cls.__executors:
+                executors = (cls.__executors[pool],)
+        # Wait outside of lock: running calls can get executor
+        for executor in executors:
+            executor.shutdown()
+
+    @classmethod
+    def pools(cls: type[ProcessPooled]) -> dict[str, ProcessPoolExecutor]:
+        """Configured pools.
+
+        :return: pool name to executor mapping (snapshot), including shut down executors
+        :rtype: dict[str, ProcessPoolExecutor]
+        """
+        return dict(cls.__executors)
+
+    @property
+    def executor(self) -> ProcessPoolExecutor:
+        """Executor instance. Shut down or broken executor is recreated.
+
+        :rtype: ProcessPoolExecutor
+        """
+        executor: ProcessPoolExecutor | None = self.__executors.get(self.__pool)
+        if executor is None or executor.is_shutdown or executor.is_broken:
+            with self.__executors_lock:  # Only one executor is created by concurrent calls
+                executor = self.__executors.get(self.__pool)
+                if executor is None or executor.is_shutdown or executor.is_broken:
+                    self.configure(pool=self.__pool)
+                    executor = self.__executors[self.__pool]
+        return executor
+
+    def __init__(
+        self,
+        func: Callable[..., Awaitable[typing.Any] | typing.Any] | None = None,
+        *,
+        loop_getter: None | (Callable[..., AbstractEventLoop] | AbstractEventLoop) = None,
+        loop_getter_need_context: bool = False,
+        pool: str = _base_threaded.DEFAULT_POOL,
+        shared_memory_threshold: int | None = SHARED_MEMORY_THRESHOLD,
+    ) -> None:
+        """Wrap function in future and return.
+
+        :param func: function to wrap
+        :type func: typing.Optional[Callable]
+        :param loop_getter: Method to get event loop, if wrap in asyncio task
+        :type loop_getter: typing.Union[
+                               None,
+                               Callable[..., AbstractEventLoop],
+                               AbstractEventLoop
+                           ]
+        :param loop_getter_need_context: Loop getter requires function context
+        :type loop_getter_need_context: bool
+        :param pool: Name of the pool to execute in
+        :type pool: str
+        :param shared_memory_threshold: Minimal size of bytes and bytearray arguments and result
+                                        to pass through shared memory. If None: pickle.
+        :type shared_memory_threshold: typing.Optional[int]
+        :raises ValueError: shared_memory_threshold is not positive
+        """
+        if shared_memory_threshold is not None and shared_memory_threshold < 1:
+            raise ValueError("shared_memory_threshold must be >= 1")
+        super().__init__(func=func)
+        self.__loop_getter: None | (Callable[..., AbstractEventLoop] | AbstractEventLoop) = loop_getter
+        self.__loop_getter_need_context: bool = loop_getter_need_context
+        self.__pool: str = pool
+        self.__shared_memory_threshold: int | None = shared_memory_threshold
+
+    @property
+    def loop_getter(
+        self,
+    ) -> Callable[..., AbstractEventLoop] | AbstractEventLoop | None:
+        """Loop getter.
+
+        :rtype: typing.Union[None, Callable[..., AbstractEventLoop], AbstractEventLoop]
+        """
+        return self.__loop_getter
+
+    @property
+    def loop_getter_need_context(self) -> bool:
+        """Loop getter need execution context.
+
+        :rtype: bool
+        """
+        return self.__loop_getter_need_context
+
+    @property
+    def pool(self) -> str:
+        """Name of the pool to execute in.
+
+        :rtype: str
+        """
+        return self.__pool
+
+    @property
+    def shared_memory_threshold(self) -> int | None:
+        """Minimal size of bytes and bytearray arguments and result to pass through shared memory.
+
+        :rtype: typing.Optional[int]
+        """
+        return self.__shared_memory_threshold
+
+    def _get_loop(self, *args: typing.Any, **kwargs: typing.Any) -> AbstractEventLoop | None:
+        """Get event loop in decorator class.
+
+        :return: event loop if available or getter available
+        :rtype: Optional[AbstractEventLoop]
+        """
+        if callable(self.loop_getter):
+            if self.loop_getter_need_context:
+                return self.loop_getter(*args, **kwargs)  # pylint: disable=not-callable
+            return self.loop_getter()  # pylint: disable=not-callable
+        return self.loop_getter
+
+    def _get_function_wrapper(
+        self, func: Callable[Spec, Awaitable[typing.Any] | typing.Any]
+    ) -> Callable[Spec, concurrent.futures.Future[typing.Any] | Awaitable[typing.Any]]:
+        """Here should be constructed and returned real decorator.
+
+        :param func: Wrapped function
+        :type func: Callable
+        :return: wrapped coroutine or function
+        :rtype: Callable[..., Union[Awaitable, concurrent.futures.Future]]
+        """
+
+        # noinspection PyMissingOrEmptyDocstring
+        @functools.wraps(func)
+        def wrapper(
+            *args: Spec.args, **kwargs: Spec.kwargs
+        ) -> concurrent.futures.Future[typing.Any] | Awaitable[typing.Any]:
+            """Main function wrapper.
+
+            :return: coroutine or function
+            :rtype: Union[Awaitable, concurrent.futures.Future]
+            """
+            loop: AbstractEventLoop | None = self._get_loop(*args, **kwargs)
+            future: concurrent.futures.Future[typing.Any] = self.__submit(func, args, kwargs)
+            if loop is None:
+                return future
+            return asyncio.wrap_future(future, loop=loop)
+
+        return wrapper
+
+    def __submit(
+        self,
+        func: Callable[..., typing.Any],
+        args: tuple[typing.Any, ...],
+        kwargs: dict[str, typing.Any],
+    ) -> concurrent.futures.Future[typing.Any]:
+        """Submit call to the executor, passing buffers through shared memory.
+
+        :return: future for the call result
+        :rtype: concurrent.futures.Future[Any]
+        """
+        threshold: int | None = self.shared_memory_threshold
+        segments: list[shared_memory.SharedMemory] = []
+
+        def export(value: typing.Any) -> typing.Any:
+            """Copy argument to the shared memory if applicable."""
+            value, segment = _shared_memory.export(value, threshold)
+            if segment is not None:
+                segments.append(segment)
+            return value
+
+        try:
+            source: concurrent.futures.Future[typing.Any] = self.executor.submit(
+                _execute,
+                get_target(func),
+                tuple(export(value) for value in args),
+                {name: export(value) for name, value in kwargs.items()},
+                threshold,
+            )
+        except BaseException:
+            for segment in segments:
+                _shared_memory.unlink(segment)
+            raise
+
+        future: _ProcessFuture = _ProcessFuture(source)
+        source.add_done_callback(functools.partial(_complete, future, segments))
+        return future
+
+    def __call__(
+        self,
+        *args: Callable[..., Awaitable[typing.Any] | typing.Any] | typing.Any,
+        **kwargs: typing.Any,
+    ) -> (
+        concurrent.futures.Future[typing.Any]
+        | Awaitable[typing.Any]
+        | Callable[..., concurrent.futures.Future[typing.Any] | Awaitable[typing.Any]]
+    ):
+        """Callable instance.
+
+        :return: Future, Awaitable or it's getter (depends of decoration way and asyncio.Loop provided)
+        :rtype: Union[concurrent.futures.Future[Any], Awaitable[Any] Callable[..., ...]]
+        """
+        return super().__call__(*args, **kwargs)  # type: ignore[no-any-return]
+
+    def __repr__(self) -> str:  # pragma: no cover
+        """For debug purposes.
+
+        :return: repr info
+        :rtype: str
+        """
+        return (
+            f"<{self.__class__.__name__}("
+            f"{self._func!r}, "
+            f"loop_getter={self.loop_getter!r}, "
+            f"loop_getter_need_context={self.loop_getter_need_context!r}, "
+            f"pool={self.pool!r}, "
+            f"shared_memory_threshold={self.shared_memory_threshold!r}, "
+            f") at 0x{id(self):X}>"
+        )
+
+
+@typing.overload
+def processpooled(
+    func: Callable[..., Awaitable[typing.Any] | typing.Any],
+    *,
+    loop_getter: None = None,
+    loop_getter_need_context: bool = False,
+    pool: str = _base_threaded.DEFAULT_POOL,
+    shared_memory_threshold: int | None = SHARED_MEMORY_THRESHOLD,
+) -> Callable[..., concurrent.futures.Future[typing.Any]]:
+    """Overload: function callable, no loop getter."""
+
+
+@typing.overload
+def processpooled(
+    func: Callable[..., Awaitable[typing.Any] | typing.Any],
+    *,
+    loop_getter: Callable[..., AbstractEventLoop] | AbstractEventLoop,
+    loop_getter_need_context: bool = False,
+    pool: str = _base_threaded.DEFAULT_POOL,
+    shared_memory_threshold: int | None = SHARED_MEMORY_THRESHOLD,
+) -> Callable[..., Task[typing.Any]]:
+    """Overload: function callable, loop getter available."""
+
+
+@typing.overload
+def processpooled(
+    func: None = None,
+    *,
+    loop_getter: None | Callable[..., AbstractEventLoop] | AbstractEventLoop = None,
+    loop_getter_need_context: bool = False,
+    pool: str = _base_threaded.DEFAULT_POOL,
+    shared_memory_threshold: int | None = SHARED_MEMORY_THRESHOLD,
+) -> ProcessPooled:
+    """Overload: No function."""
+
+
+def processpooled(
+    func: Callable[..., Awaitable[typing.Any] | typing.Any] | None = None,
+    *,
+    loop_getter: None | Callable[..., AbstractEventLoop] | AbstractEventLoop = None,
+    loop_getter_need_context: bool = False,
+    pool: str = _base_threaded.DEFAULT_POOL,
+    shared_memory_threshold: int | None = SHARED_MEMORY_THRESHOLD,
+) -> ProcessPooled | Callable[..., concurrent.futures.Future[typing.Any] | Awaitable[typing.Any]]:
+    """Post function to ProcessPoolExecutor.
+
+    :param func: function to wrap
+    :type func: typing.Optional[Callable[..., typing.Union[Awaitable, typing.Any]]]
+    :param loop_getter: Method to get event loop, if wrap in asyncio task
+    :type loop_getter: typing.Union[
+                           None,
+                           Callable[..., AbstractEventLoop],
+                           AbstractEventLoop
+                       ]
+    :param loop_getter_need_context: Loop getter requires function context
+    :type loop_getter_need_context: bool
+    :param pool: Name of the pool to execute in
+    :type pool: str
+    :param shared_memory_threshold: Minimal size of bytes and bytearray arguments and result
+                                    to pass through shared memory. If None: pickle.
+    :type shared_memory_threshold: typing.Optional[int]
+    :return: ProcessPooled instance, if called as function or argumented decorator, else callable wrapper
+    :rtype: typing.Union[ProcessPooled, Callable[..., typing.Union[concurrent.futures.Future, Awaitable]]]
+    """
+    if func is None:
+        return ProcessPooled(
+            func=func,
+            loop_getter=loop_getter,
+            loop_getter_need_context=loop_getter_need_context,
+            pool=pool,
+            shared_memory_threshold=shared_memory_threshold,
+        )
+    return ProcessPooled(  # type: ignore[return-value]
+        func=None,
+        loop_getter=loop_getter,
+        loop_getter_need_context=loop_getter_need_context,
+        pool=pool,
+        shared_memory_threshold=shared_memory_threshold,
+    )(func)
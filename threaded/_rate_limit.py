@@ -0,0 +1,162 @@
+#    Copyright 2017 - 2020 Alexey Stepanov aka penguinolog
+##
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+
+#         http://www.apache.org/licenses/LICENSE-2.0
+
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Rate limiting for decorators.
+
+Throttled calls are released by timer: they do not occupy workers or event loop tasks while waiting.
+"""
+
+from __future__ import annotations
+
+# Standard Library
+import threading
+import time
+import typing
+
+if typing.TYPE_CHECKING:
+    from collections.abc import Callable
+
+__all__ = ("RateLimiter",)
+
+
+class RateLimiter:
+    """Token bucket rate limiter: up to `calls` per `per_seconds`, bursts up to `calls`.
+
+    Permits are reserved in order of requests: throttled call gets delay after all previously throttled ones.
+    """
+
+    __slots__ = (
+        "__calls",
+        "__lock",
+        "__max_delay",
+        "__per_seconds",
+        "__throttled",
+        "__timer",
+        "__tokens",
+        "__total_delay",
+        "__updated",
+    )
+
+    def __init__(self, calls: int, per_seconds: float = 1.0, *, timer: Callable[[], float] = time.monotonic) -> None:
+        """Token bucket rate limiter.
+
+        :param calls: Calls allowed per time period, also maximum burst
+        :type calls: int
+        :param per_seconds: Time period in seconds
+        :type per_seconds: float
+        :param timer: Monotonic time source
+        :type timer: Callable[[], float]
+        :raises ValueError: calls or per_seconds is not positive
+        """
+        if calls < 1:
+            raise ValueError("calls must be >= 1")
+        if per_seconds <= 0:
+            raise ValueError("per_seconds must be greater than 0")
+        self.__calls: int = calls
+        self.__per_seconds: float = per_seconds
+        self.__timer: Callable[[], float] = timer
+        self.__lock: threading.Lock = threading.Lock()
+        self.__tokens: float = calls
+        self.__updated: float = timer()
+        self.__throttled: int = 0
+        self.__total_delay: float = 0.0
+        self.__max_delay: float = 0.0
+
+    @classmethod
+    def from_spec(cls: type[RateLimiter], spec: RateLimiter | tuple[int, float] | None) -> RateLimiter | None:
+        """Get rate limiter from decorator argument.
+
+        :param spec: rate limiter or (calls, per_seconds) tuple
+        :type spec: typing.Union[RateLimiter, tuple[int, float], None]
+        :return: rate limiter, if required
+        :rtype: typing.Optional[RateLimiter]
+        """
+        if spec is None or isinstance(spec, RateLimiter):
+            return spec
+        calls, per_seconds = spec
+        return cls(calls, per_seconds)
+
+    @property
+    def calls(self) -> int:
+        """Calls allowed per time period.
+
+        :rtype: int
+        """
+        return self.__calls
+
+    @property
+    def per_seconds(self) -> float:
+        """Time period in seconds.
+
+        :rtype: float
+        """
+        return self.__per_seconds
+
+    @property
+    def throttled(self) -> int:
+        """Amount of delayed calls.
+
+        :rtype: int
+        """
+        return self.__throttled
+
+    @property
+    def total_delay(self) -> float:
+        """Sum of delays of throttled calls in seconds.
+
+        :rtype: float
+        """
+        return self.__total_delay
+
+    @property
+    def max_delay(self) -> float:
+        """Maximum delay of throttled call in seconds.
+
+        :rtype: float
+        """
+        return self.__max_delay
+
+    def reserve(self, permits: int = 1) -> float:
+        """Reserve permits for the call.
+
+        :param permits: amount of permits (calls)
+        :type permits: int
+        :return: delay in seconds before call is allowed, 0 if allowed now
+        :rtype: float
+        """
+        rate: float = self.__calls / self.__per_seconds
+        with self.__lock:
+            now: float = self.__timer()
+            self.__tokens = min(float(self.__calls), self.__tokens + (now - self.__updated) * rate) - permits
+            self.__updated = now
+            if self.__tokens >= 0:
+                return 0.0
+            delay: float = -self.__tokens / rate
+            self.__throttled += 1
+            self.__total_delay += delay
+            self.__max_delay = max(self.__max_delay, delay)
+            return delay
+
+    def __repr__(self) -> str:
+        """For debug purposes.
+
+        :return: repr info
+        :rtype: str
+        """
+        return (
+            f"<{self.__class__.__name__}("
+            f"calls={self.calls!r}, "
+            f"per_seconds={self.per_seconds!r}, "
+            f") throttled={self.throttled}, total_delay={self.total_delay:.3f}>"
+        )
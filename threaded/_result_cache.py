@@ -0,0 +1,274 @@
+#    Copyright 2017 - 2020 Alexey Stepanov aka penguinolog
+##
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+
+#         http://www.apache.org/licenses/LICENSE-2.0
+
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Result cache for decorators.
+
+Cache hit is returned as already resolved future without executor or event loop scheduling.
+"""
+
+from __future__ import annotations
+
+# Standard Library
+import collections
+import concurrent.futures
+import threading
+import time
+import typing
+
+if typing.TYPE_CHECKING:
+    import asyncio
+    from collections.abc import Callable
+    from collections.abc import Hashable
+
+__all__ = ("ResultCache", "resolved_asyncio_future", "resolved_future")
+
+
+class ResultCache:
+    """Thread-safe LRU cache of call results with optional TTL."""
+
+    __slots__ = (
+        "__cache_exceptions",
+        "__entries",
+        "__hits",
+        "__key",
+        "__lock",
+        "__maxsize",
+        "__misses",
+        "__timer",
+        "__ttl",
+    )
+
+    def __init__(
+        self,
+        maxsize: int | None = 128,
+        ttl: float | None = None,
+        *,
+        cache_exceptions: bool = False,
+        key: Callable[..., Hashable] | None = None,
+        timer: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Thread-safe LRU cache of call results with optional TTL.
+
+        :param maxsize: Maximum amount of cached results. If None: unlimited.
+        :type maxsize: typing.Optional[int]
+        :param ttl: Time to live of cached result in seconds. If None: forever.
+        :type ttl: typing.Optional[float]
+        :param cache_exceptions: Cache raised exceptions as well (negative caching)
+        :type cache_exceptions: bool
+        :param key: Get cache key from call arguments. If None: arguments are used as key.
+        :type key: typing.Optional[Callable[..., Hashable]]
+        :param timer: Monotonic time source for TTL
+        :type timer: Callable[[], float]
+        :raises ValueError: maxsize or ttl is not positive
+        """
+        if maxsize is not None and maxsize <= 0:
+            raise ValueError("maxsize must be greater than 0")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl must be greater than 0")
+        self.__maxsize: int | None = maxsize
+        self.__ttl: float | None = ttl
+        self.__cache_exceptions: bool = cache_exceptions
+        self.__key: Callable[..., Hashable] | None = key
+        self.__timer: Callable[[], float] = timer
+        self.__entries: collections.OrderedDict[Hashable, tuple[float | None, typing.Any, BaseException | None]] = (
+            collections.OrderedDict()
+        )
+        self.__lock: threading.Lock = threading.Lock()
+        self.__hits: int = 0
+        self.__misses: int = 0
+
+    @property
+    def maxsize(self) -> int | None:
+        """Maximum amount of cached results. If None: unlimited.
+
+        :rtype: typing.Optional[int]
+        """
+        return self.__maxsize
+
+    @property
+    def ttl(self) -> float | None:
+        """Time to live of cached result in seconds. If None: forever.
+
+        :rtype: typing.Optional[float]
+        """
+        return self.__ttl
+
+    @property
+    def cache_exceptions(self) -> bool:
+        """Raised exceptions are cached as well.
+
+        :rtype: bool
+        """
+        return self.__cache_exceptions
+
+    @property
+    def hits(self) -> int:
+        """Amount of cache hits.
+
+        :rtype: int
+        """
+        return self.__hits
+
+    @property
+    def misses(self) -> int:
+        """Amount of cache misses.
+
+        :rtype: int
+        """
+        return self.__misses
+
+    def __len__(self) -> int:
+        """Amount of cached results, including expired and not evicted yet.
+
+        :rtype: int
+        """
+        return len(self.__entries)
+
+    def make_key(self, *args: typing.Any, **kwargs: typing.Any) -> Hashable:
+        """Get cache key for the call arguments.
+
+        :return: cache key
+        :rtype: Hashable
+        """
+        if self.__key is not None:
+            return self.__key(*args, **kwargs)
+        return args, tuple(sorted(kwargs.items()))
+
+    def get(self, key: Hashable) -> tuple[typing.Any, BaseException | None] | None:
+        """Get cached result and exception. Counts hit or miss.
+
+        Unhashable key is a miss.
+
+        :param key: cache key
+        :type key: Hashable
+        :return: result and exception if cached and not expired, else None
+        :rtype: typing.Optional[tuple[typing.Any, typing.Optional[BaseException]]]
+        """
+        with self.__lock:
+            try:
+                entry = self.__entries.get(key)
+            except TypeError:  # Unhashable
+                entry = None
+            if entry is not None:
+                expires, result, exception = entry
+                if expires is None or expires > self.__timer():
+                    self.__entries.move_to_end(key)
+                    self.__hits += 1
+                    return result, exception
+                del self.__entries[key]
+            self.__misses += 1
+            return None
+
+    def put(self, key: Hashable, result: typing.Any, exception: BaseException | None = None) -> None:
+        """Cache result or exception. Exception is not cached if cache_exceptions is not set.
+
+        Unhashable key is ignored.
+
+        :param key: cache key
+        :type key: Hashable
+        :param result: call result
+        :type result: typing.Any
+        :param exception: raised exception
+        :type exception: typing.Optional[BaseException]
+        """
+        if exception is not None and not self.__cache_exceptions:
+            return
+        expires: float | None = None if self.__ttl is None else self.__timer() + self.__ttl
+        with self.__lock:
+            try:
+                self.__entries[key] = (expires, result, exception)
+            except TypeError:  # Unhashable
+                return
+            self.__entries.move_to_end(key)
+            if self.__maxsize is not None and len(self.__entries) > self.__maxsize:
+                self.__entries.popitem(last=False)
+
+    def put_future(
+        self,
+        key: Hashable,
+        future: concurrent.futures.Future[typing.Any] | asyncio.Future[typing.Any],
+    ) -> None:
+        """Cache result of the done future. Cancelled future is ignored. Usable as done callback.
+
+        :param key: cache key
+        :type key: Hashable
+        :param future: done future
+        :type future: typing.Union[concurrent.futures.Future[typing.Any], asyncio.Future[typing.Any]]
+        """
+        if future.cancelled():
+            return
+        exception: BaseException | None = future.exception()
+        self.put(key, None if exception is not None else future.result(), exception)
+
+    def clear(self) -> None:
+        """Remove all cached results and reset counters."""
+        with self.__lock:
+            self.__entries.clear()
+            self.__hits = 0
+            self.__misses = 0
+
+    def __repr__(self) -> str:
+        """For debug purposes.
+
+        :return: repr info
+        :rtype: str
+        """
+        return (
+            f"<{self.__class__.__name__}("
+            f"maxsize={self.maxsize!r}, "
+            f"ttl={self.ttl!r}, "
+            f"cache_exceptions={self.cache_exceptions!r}, "
+            f") hits={self.hits}, misses={self.misses}, size={len(self)}>"
+        )
+
+
+def resolved_future(
+    cached: tuple[typing.Any, BaseException | None],
+) -> concurrent.futures.Future[typing.Any]:
+    """Make done concurrent.futures.Future from the cached result.
+
+    :param cached: cached result and exception
+    :type cached: tuple[typing.Any, typing.Optional[BaseException]]
+    :return: done future
+    :rtype: concurrent.futures.Future[typing.Any]
+    """
+    future: concurrent.futures.Future[typing.Any] = concurrent.futures.Future()
+    result, exception = cached
+    if exception is not None:
+        future.set_exception(exception)
+    else:
+        future.set_result(result)
+    return future
+
+
+def resolved_asyncio_future(
+    loop: asyncio.AbstractEventLoop,
+    cached: tuple[typing.Any, BaseException | None],
+) -> asyncio.Future[typing.Any]:
+    """Make done asyncio.Future from the cached result. Nothing is scheduled in the event loop.
+
+    :param loop: event loop of the future
+    :type loop: asyncio.AbstractEventLoop
+    :param cached: cached result and exception
+    :type cached: tuple[typing.Any, typing.Optional[BaseException]]
+    :return: done future
+    :rtype: asyncio.Future[typing.Any]
+    """
+    future: asyncio.Future[typing.Any] = loop.create_future()
+    result, exception = cached
+    if exception is not None:
+        future.set_exception(exception)
+    else:
+        future.set_result(result)
+    return future
@@ -0,0 +1,159 @@
+#    Copyright 2017 - 2020 Alexey Stepanov aka penguinolog
+##
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+
+#         http://www.apache.org/licenses/LICENSE-2.0
+
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Buffers transfer between processes through shared memory instead of pickle.
+
+Segment is created by the sender and unlinked by the parent process after the call is done.
+"""
+
+from __future__ import annotations
+
+# Standard Library
+import contextlib
+import logging
+import typing
+from multiprocessing import shared_memory
+
+__all__ = ("SharedBuffer", "attach", "export", "receive_result", "release", "unlink")
+
+LOGGER = logging.getLogger(__name__)
+
+# Segments with buffers still exported by the called function: closed on process exit
+_retained: list[shared_memory.SharedMemory] = []
+
+
+class SharedBuffer(typing.NamedTuple):
+    """Descriptor of the buffer in the shared memory segment. Pickled instead of the buffer."""
+
+    name: str
+    size: int
+    kind: str
+    format: str
+    shape: tuple[int, ...]
+
+
+def _view(segment: shared_memory.SharedMemory, size: int) -> memoryview:
+    """Get view of the segment data: segment can be larger than requested size.
+
+    :param segment: shared memory segment
+    :type segment: shared_memory.SharedMemory
+    :param size: data size
+    :type size: int
+    :return: view of the data
+    :rtype: memoryview
+    """
+    return segment.buf[:size]  # type: ignore[index]
+
+
+def export(value: typing.Any, threshold: int | None) -> tuple[typing.Any, shared_memory.SharedMemory | None]:
+    """Copy buffer to the new shared memory segment, if applicable.
+
+    bytes and bytearray are exported if not smaller than threshold.
+    memoryview is always exported (it is not picklable), if it is C-contiguous.
+
+    :param value: value to send
+    :type value: typing.Any
+    :param threshold: minimal size of bytes and bytearray to export. If None: only memoryview is exported.
+    :type threshold: typing.Optional[int]
+    :return: descriptor and segment if exported, else value and None
+    :rtype: tuple[typing.Any, typing.Optional[shared_memory.SharedMemory]]
+    """
+    if type(value) is memoryview:
+        if not value.c_contiguous or value.ndim == 0:
+            return value, None
+        data: memoryview = value.cast("B")
+        shared = SharedBuffer("", value.nbytes, "memoryview", value.format, value.shape or ())
+    elif type(value) in {bytes, bytearray} and threshold is not None and len(value) >= threshold:
+        data = memoryview(value)
+        shared = SharedBuffer("", len(value), type(value).__name__, "B", (len(value),))
+    else:
+        return value, None
+
+    segment = shared_memory.SharedMemory(create=True, size=max(shared.size, 1))
+    try:
+        _view(segment, shared.size)[:] = data
+    except BaseException:
+        unlink(segment)
+        raise
+    return shared._replace(name=segment.name), segment
+
+
+def attach(value: typing.Any) -> tuple[typing.Any, shared_memory.SharedMemory | None]:
+    """Get argument in the worker process.
+
+    bytes and bytearray are copied from the segment, memoryview is read-only view of the segment without copy.
+
+    :param value: argument or shared buffer descriptor
+    :type value: typing.Any
+    :return: argument and segment, which should be released after call
+    :rtype: tuple[typing.Any, typing.Optional[shared_memory.SharedMemory]]
+    """
+    if not isinstance(value, SharedBuffer):
+        return value, None
+    segment = shared_memory.SharedMemory(name=value.name)
+    if value.kind == "memoryview":
+        view = _view(segment, value.size).cast(value.format, value.shape)  # type: ignore[call-overload]
+        return view.toreadonly(), segment
+    data: bytes | bytearray = (bytes if value.kind == "bytes" else bytearray)(_view(segment, value.size))
+    segment.close()
+    return data, None
+
+
+def release(value: typing.Any, segment: shared_memory.SharedMemory) -> None:
+    """Release view and close segment in the worker process.
+
+    If called function keeps buffers exported from the view, segment is kept mapped until process exit.
+
+    :param value: view of the segment
+    :type value: typing.Any
+    :param segment: attached segment
+    :type segment: shared_memory.SharedMemory
+    """
+    try:
+        value.release()
+        segment.close()
+    except BufferError:
+        LOGGER.warning("Shared memory %s is still used after call, kept mapped", segment.name)
+        _retained.append(segment)
+
+
+def receive_result(value: typing.Any) -> typing.Any:
+    """Get call result in the parent process: copy from the segment and unlink it.
+
+    :param value: result or shared buffer descriptor
+    :type value: typing.Any
+    :return: result
+    :rtype: typing.Any
+    """
+    if not isinstance(value, SharedBuffer):
+        return value
+    segment = shared_memory.SharedMemory(name=value.name)
+    try:
+        data: bytes | bytearray = (bytes if value.kind == "bytes" else bytearray)(_view(segment, value.size))
+    finally:
+        unlink(segment)
+    if value.kind == "memoryview":
+        return memoryview(data).cast(value.format, value.shape)  # type: ignore[call-overload]
+    return data
+
+
+def unlink(segment: shared_memory.SharedMemory) -> None:
+    """Close and remove segment.
+
+    :param segment: shared memory segment
+    :type segment: shared_memory.SharedMemory
+    """
+    segment.close()
+    with contextlib.suppress(FileNotFoundError):
+        segment.unlink()
@@ -25,6 +25,7 @@ import threading
 import typing
 
 # Local Implementation
+from . import _instrumentation
 from . import class_decorator
 
 if typing.TYPE_CHECKING:
@@ -115,6 +116,8 @@ class Threaded(class_decorator.BaseDecorator):
         name: str | None = self.name
         if name is None:
             name = "Threaded: " + getattr(func, "__name__", str(hash(func)))
+        qualname: str = _instrumentation.qualified_name(func)
+        instrumentation: _instrumentation.Instrumentation = _instrumentation.instrumentation
 
         # noinspection PyMissingOrEmptyDocstring
         @functools.wraps(prepared)
@@ -124,7 +127,9 @@ class Threaded(class_decorator.BaseDecorator):
             :return: Thread object
             :rtype: threading.Thread
             """
-            thread = threading.Thread(target=prepared, name=name, args=args, kwargs=kwargs, daemon=self.daemon)
+            # Queue wait is counted from the call to the thread start
+            target = instrumentation.wrap(qualname, prepared) if instrumentation.enabled else prepared
+            thread = threading.Thread(target=target, name=name, args=args, kwargs=kwargs, daemon=self.daemon)
             if self.started:
                 thread.start()
             return thread
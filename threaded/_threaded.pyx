@@ -26,6 +26,8 @@ import typing
 
 from threaded cimport class_decorator
 
+from threaded import _instrumentation
+
 __all__ = ("Threaded", "threaded")
 
 
@@ -83,6 +85,8 @@ cdef class Threaded(class_decorator.BaseDecorator):
         cdef str name = self.name
         if name is None:
             name = "Threaded: " + getattr(func, "__name__", str(hash(func)))
+        cdef str qualname = _instrumentation.qualified_name(func)
+        instrumentation = _instrumentation.instrumentation
 
         # noinspection PyMissingOrEmptyDocstring
         @functools.wraps(prepared)
@@ -92,7 +96,9 @@ cdef class Threaded(class_decorator.BaseDecorator):
             :return: Thread object
             :rtype: threading.Thread
             """
-            thread = threading.Thread(target=prepared, name=name, args=args, kwargs=kwargs, daemon=self.daemon)
+            # Queue wait is counted from the call to the thread start
+            target = instrumentation.wrap(qualname, prepared) if instrumentation.enabled else prepared
+            thread = threading.Thread(target=target, name=name, args=args, kwargs=kwargs, daemon=self.daemon)
             if self.started:
                 thread.start()
             return thread
@@ -20,33 +20,511 @@ Asyncio is supported
 from __future__ import annotations
 
 # Standard Library
+import asyncio
+import collections
 import concurrent.futures
+import contextlib
+import contextvars
+import enum
 import functools
+import itertools
+import logging
+import os
+import queue
+import sys
+import threading
+import time
 import typing
+import weakref
+from concurrent.futures import _base
+from concurrent.futures import thread as _thread
 
 # Local Implementation
 from . import _base_threaded
+from . import _compact_future
+from . import _instrumentation
+from . import _loop_bridge
+from . import _rate_limit
+from . import _result_cache
+from . import _timer
+from . import _work_queue
 
 if typing.TYPE_CHECKING:
     from asyncio import AbstractEventLoop
     from asyncio import Task
+    from collections.abc import AsyncIterator
     from collections.abc import Awaitable
     from collections.abc import Callable
+    from collections.abc import Hashable
+    from collections.abc import Iterable
+    from collections.abc import Iterator
 
     from typing_extensions import ParamSpec
 
     Spec = ParamSpec("Spec")
+    Result = typing.TypeVar("Result")
+    _SerialCall = tuple[
+        concurrent.futures.Future[typing.Any],
+        Callable[..., typing.Any],
+        tuple[typing.Any, ...],
+        dict[str, typing.Any],
+    ]
 
-__all__ = ("ThreadPooled", "threadpooled")
+__all__ = ("QueuePolicy", "RejectedExecutionError", "ThreadPooled", "threadpooled")
+
+# Python 3.8 has no interpreter-wide lock for workers start: interpreter shutdown flag is checked without it
+_global_shutdown_lock: contextlib.AbstractContextManager[typing.Any] = getattr(
+    _thread, "_global_shutdown_lock", contextlib.nullcontext()
+)
+
+
+def _chunked(iterables: tuple[Iterable[typing.Any], ...], chunksize: int) -> Iterator[list[tuple[typing.Any, ...]]]:
+    """Split zipped iterables to the chunks of arguments.
+
+    :param iterables: iterables with arguments
+    :type iterables: tuple[Iterable[typing.Any], ...]
+    :param chunksize: maximum chunk size
+    :type chunksize: int
+    :return: chunks of positional arguments
+    :rtype: Iterator[list[tuple[typing.Any, ...]]]
+    """
+    arguments = zip(*iterables)
+    while chunk := list(itertools.islice(arguments, chunksize)):
+        yield chunk
+
+
+def _run_chunk(func: Callable[..., typing.Any], chunk: list[tuple[typing.Any, ...]]) -> list[typing.Any]:
+    """Call function for each arguments in chunk.
+
+    :param func: function to call
+    :type func: Callable[..., typing.Any]
+    :param chunk: positional arguments for calls
+    :type chunk: list[tuple[typing.Any, ...]]
+    :return: call results
+    :rtype: list[typing.Any]
+    """
+    return [func(*args) for args in chunk]
+
+
+def _call_single(
+    call: Callable[..., concurrent.futures.Future[typing.Any] | Awaitable[typing.Any]],
+    _: AbstractEventLoop | None,
+    chunk: list[tuple[typing.Any, ...]],
+) -> concurrent.futures.Future[typing.Any] | Awaitable[typing.Any]:
+    """Call decorated function for the single arguments chunk of map.
+
+    :param call: decorated function
+    :type call: Callable[..., Union[concurrent.futures.Future[Any], Awaitable[Any]]]
+    :param chunk: positional arguments for the single call
+    :type chunk: list[tuple[typing.Any, ...]]
+    :return: future or awaitable for the call result
+    :rtype: Union[concurrent.futures.Future[Any], Awaitable[Any]]
+    """
+    return call(*chunk[0])
+
+
+def _copy_state(
+    destination: concurrent.futures.Future[typing.Any], source: concurrent.futures.Future[typing.Any]
+) -> None:
+    """Copy done source future state to the destination future, if destination is not cancelled.
+
+    :param destination: future provided to the caller, can be already marked running
+    :type destination: concurrent.futures.Future[typing.Any]
+    :param source: done future of the execution
+    :type source: concurrent.futures.Future[typing.Any]
+    """
+    if source.cancelled():
+        destination.cancel()
+    elif destination.running() or destination.set_running_or_notify_cancel():
+        exception: BaseException | None = source.exception()
+        if exception is not None:
+            destination.set_exception(exception)
+        else:
+            destination.set_result(source.result())
+
+
+def _chain_future(
+    source: concurrent.futures.Future[typing.Any], destination: concurrent.futures.Future[typing.Any]
+) -> None:
+    """Copy source future state to the destination future on done, cancel source on destination cancel.
+
+    :param source: future of the execution
+    :type source: concurrent.futures.Future[typing.Any]
+    :param destination: future provided to the callers
+    :type destination: concurrent.futures.Future[typing.Any]
+    """
+
+    def cancel_source(future: concurrent.futures.Future[typing.Any]) -> None:
+        """Cancel source future if the destination is cancelled."""
+        if future.cancelled():
+            source.cancel()
+
+    destination.add_done_callback(cancel_source)
+    source.add_done_callback(functools.partial(_copy_state, destination))
+
+
+def _call_if_started(
+    start: Callable[[], bool], func: Callable[..., Result], *args: typing.Any, **kwargs: typing.Any
+) -> Result | None:
+    """Mark proxy future running in the worker and call function, if proxy future is not cancelled.
+
+    Proxy future can not be cancelled after start, as future of the direct submit.
+
+    :param start: mark proxy future running, False if it is cancelled
+    :type start: Callable[[], bool]
+    :param func: function to call
+    :type func: Callable[..., Result]
+    :return: function result, None if proxy future is cancelled
+    :rtype: typing.Optional[Result]
+    """
+    if not start():
+        return None
+    return func(*args, **kwargs)
+
+
+class _CoalescedCall:
+    """Execution shared by coalesced calls.
+
+    Each caller gets own future: cancel affects the caller only. Execution is cancelled if all callers are cancelled.
+    """
+
+    __slots__ = ("__abandoned", "__callers", "__execution", "__lock", "__started")
+
+    def __init__(self) -> None:
+        """Execution shared by coalesced calls."""
+        self.__execution: concurrent.futures.Future[typing.Any] = concurrent.futures.Future()
+        self.__callers: set[concurrent.futures.Future[typing.Any]] = set()  # Not cancelled callers before start
+        self.__lock: threading.Lock = threading.Lock()
+        self.__started: bool = False
+        self.__abandoned: bool = False  # All callers are cancelled before start
+
+    @property
+    def execution(self) -> concurrent.futures.Future[typing.Any]:
+        """Future of the shared execution.
+
+        :rtype: concurrent.futures.Future[typing.Any]
+        """
+        return self.__execution
+
+    def join(self) -> concurrent.futures.Future[typing.Any] | None:
+        """Get future for the new caller.
+
+        :return: caller future, None if execution is done or abandoned: new call is required
+        :rtype: typing.Optional[concurrent.futures.Future[typing.Any]]
+        """
+        future: concurrent.futures.Future[typing.Any] = concurrent.futures.Future()
+        with self.__lock:
+            if self.__abandoned or self.__execution.done():
+                return None
+            if self.__started:
+                future.set_running_or_notify_cancel()
+            else:
+                self.__callers.add(future)
+        future.add_done_callback(self.__leave)
+        self.__execution.add_done_callback(functools.partial(_copy_state, future))
+        return future
+
+    def start(self) -> bool:
+        """Mark execution and caller futures running. Called in the worker before the call.
+
+        :return: execution is not cancelled or abandoned: call is required
+        :rtype: bool
+        """
+        with self.__lock:
+            if self.__abandoned or not self.__execution.set_running_or_notify_cancel():
+                return False
+            self.__started = True
+            for future in self.__callers:
+                future.set_running_or_notify_cancel()  # Cancelled concurrently: False, leave is pending
+            self.__callers.clear()
+        return True
+
+    def __leave(self, future: concurrent.futures.Future[typing.Any]) -> None:
+        """Forget cancelled caller, cancel execution if it was the last one."""
+        if not future.cancelled():
+            return
+        with self.__lock:
+            self.__callers.discard(future)
+            if self.__callers or self.__started:
+                return
+            self.__abandoned = True
+        self.__execution.cancel()  # Outside of lock: done callbacks of the execution are called
+
+
+class _BoundMethod:
+    """Function decorated without braces, bound to the instance: map and imap_unordered are bound too."""
+
+    __slots__ = ("__func__", "__self__")
+
+    def __init__(self, func: Callable[..., typing.Any], instance: typing.Any) -> None:
+        """Function decorated without braces, bound to the instance.
+
+        :param func: wrapper of the decorated function
+        :type func: Callable[..., typing.Any]
+        :param instance: bound instance
+        :type instance: typing.Any
+        """
+        self.__func__: Callable[..., typing.Any] = func
+        self.__self__: typing.Any = instance
+
+    def __getattr__(self, name: str) -> typing.Any:
+        """Get attribute of the wrapper, as bound method does.
+
+        :rtype: Any
+        :raises AttributeError: attribute is not found
+        """
+        if name == "__func__":  # Not initialized
+            raise AttributeError(name)
+        return getattr(self.__func__, name)
+
+    def __call__(self, *args: typing.Any, **kwargs: typing.Any) -> typing.Any:
+        """Call with the bound instance as the first argument.
+
+        :return: future or awaitable
+        :rtype: Any
+        """
+        return self.__func__(self.__self__, *args, **kwargs)
+
+    def __bind(self, iterables: tuple[Iterable[typing.Any], ...]) -> tuple[Iterable[typing.Any], ...]:
+        """Prepend the bound instance to the positional arguments sources, if any.
+
+        :rtype: tuple[Iterable[Any], ...]
+        """
+        return (itertools.repeat(self.__self__), *iterables) if iterables else ()
+
+    def map(
+        self,
+        *iterables: Iterable[typing.Any],
+        chunksize: int = 1,
+        ordered: bool = True,
+    ) -> Iterator[typing.Any] | AsyncIterator[typing.Any]:
+        """Execute bound method for each arguments from iterables in the pool.
+
+        :return: results iterator. If loop_getter is set: async iterator in the running event loop.
+        :rtype: Union[Iterator[Any], AsyncIterator[Any]]
+        """
+        return self.__func__.map(  # type: ignore[attr-defined,no-any-return]
+            *self.__bind(iterables), chunksize=chunksize, ordered=ordered
+        )
+
+    def imap_unordered(
+        self,
+        *iterables: Iterable[typing.Any],
+        chunksize: int = 1,
+    ) -> Iterator[typing.Any] | AsyncIterator[typing.Any]:
+        """Execute bound method for each arguments from iterables in the pool, yield results as ready.
+
+        :return: results iterator. If loop_getter is set: async iterator in the running event loop.
+        :rtype: Union[Iterator[Any], AsyncIterator[Any]]
+        """
+        return self.__func__.imap_unordered(  # type: ignore[attr-defined,no-any-return]
+            *self.__bind(iterables), chunksize=chunksize
+        )
+
+    def __repr__(self) -> str:  # pragma: no cover
+        """For debug purposes.
+
+        :return: repr info
+        :rtype: str
+        """
+        return f"<bound method {self.__func__.__qualname__} of {self.__self__!r}>"
+
+
+_STARTED = 0
+_FINISHED = 1
+_CANCELLED = 2
+_FAILED = 3
+
+
+def _work_item_outcome(work_item: _thread._WorkItem[typing.Any] | _loop_bridge.LoopWorkItem) -> int:
+    """Get outcome of the run work item without future locks.
+
+    :param work_item: run work item
+    :type work_item: typing.Union[_thread._WorkItem, _loop_bridge.LoopWorkItem]
+    :return: counter index: _CANCELLED, _FAILED or _FINISHED for completed without exception
+    :rtype: int
+    """
+    future: concurrent.futures.Future[typing.Any] | _loop_bridge.LoopWorkItem = work_item.future
+    if isinstance(future, _loop_bridge.LoopWorkItem):
+        if future.cancelled():
+            return _CANCELLED
+        return _FINISHED if future.exception() is None else _FAILED
+    # pylint: disable=protected-access
+    if future._state != _base.FINISHED:
+        return _CANCELLED
+    return _FINISHED if future._exception is None else _FAILED
+
+
+def _worker(
+    executor_reference: weakref.ref[ThreadPoolExecutor],
+    work_queue: queue.SimpleQueue[typing.Any],
+    idle_timeout: float | None,
+    counters: list[int],
+) -> None:
+    """Pool worker, which retires after idle timeout or if pool is shrunk.
+
+    Follow concurrent.futures.thread._worker logic for work items and wake-up sentinels.
+
+    :param executor_reference: weak reference to the executor
+    :type executor_reference: weakref.ref[ThreadPoolExecutor]
+    :param work_queue: executor work queue
+    :type work_queue: queue.SimpleQueue
+    :param idle_timeout: time to wait for work before retirement. If None: wait forever.
+    :type idle_timeout: typing.Optional[float]
+    :param counters: started, finished, cancelled and failed work items, updated only by this worker without lock
+    :type counters: list[int]
+    """
+    try:
+        while True:
+            try:
+                work_item = work_queue.get(block=True, timeout=idle_timeout)
+            except queue.Empty:
+                executor = executor_reference()
+                if executor is None or executor._retire_idle_worker():  # pylint: disable=protected-access
+                    return
+                del executor
+                continue
+
+            if work_item is not None:
+                counters[_STARTED] += 1
+                work_item.run()
+                outcome: int = _work_item_outcome(work_item)
+                if outcome != _FINISHED:
+                    counters[outcome] += 1
+                counters[_FINISHED] += 1
+                # Delete references to object. See issue16284
+                del work_item
+
+                executor = executor_reference()
+                if executor is not None:
+                    if executor._retire_excess_worker(idle=False):  # pylint: disable=protected-access
+                        return
+                    executor._idle_semaphore.release()  # pylint: disable=protected-access
+                del executor
+                continue
+
+            executor = executor_reference()
+            if _thread._shutdown or executor is None or executor._shutdown:  # pylint: disable=protected-access
+                if executor is not None:
+                    executor._shutdown = True  # pylint: disable=protected-access
+                # Notice other workers
+                work_queue.put(None)
+                return
+            if executor._retire_excess_worker(idle=True):  # pylint: disable=protected-access
+                return
+            del executor
+    except BaseException:
+        logging.getLogger("concurrent.futures").critical("Exception in worker", exc_info=True)
+    finally:
+        executor = executor_reference()
+        if executor is not None:
+            executor._worker_exited(counters)  # pylint: disable=protected-access
+
+
+class QueuePolicy(str, enum.Enum):
+    """Policy for submit to the full work queue."""
+
+    BLOCK = "block"  # Block caller until place is free or queue timeout is expired
+    REJECT = "reject"  # Raise RejectedExecutionError
+    CALLER_RUNS = "caller_runs"  # Run in the caller thread
+    DROP_OLDEST = "drop_oldest"  # Cancel the oldest queued work item
+
+
+class RejectedExecutionError(RuntimeError):
+    """Work queue is full and submit is rejected."""
 
 
 class ThreadPoolExecutor(concurrent.futures.ThreadPoolExecutor):
     """Provide readers for protected attributes.
 
-    Simply extend concurrent.futures.ThreadPoolExecutor.
+    Extend concurrent.futures.ThreadPoolExecutor with work queue size limit, idle workers retirement and resize.
     """
 
-    __slots__ = ()
+    __slots__ = (
+        "__compact_futures",
+        "__counters_lock",
+        "__expired_count",
+        "__growth_threshold",
+        "__idle_timeout",
+        "__max_queue",
+        "__min_workers",
+        "__peak_worker_count",
+        "__prioritized",
+        "__queue_policy",
+        "__queue_timeout",
+        "__shards",
+        "__shards_lock",
+        "__submitted_count",
+        "__worker_counter",
+        "__worker_counters",
+        "__workers_counters",
+    )
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        *,
+        max_queue: int = 0,
+        queue_policy: QueuePolicy | str = QueuePolicy.BLOCK,
+        queue_timeout: float | None = None,
+        prioritized: bool = False,
+        min_workers: int = 0,
+        idle_timeout: float | None = None,
+        growth_threshold: int = 1,
+        compact_futures: bool = False,
+    ) -> None:
+        """Thread pool executor.
+
+        :param max_workers: Maximum workers
+        :type max_workers: typing.Optional[int]
+        :param max_queue: Maximum amount of queued work items. If 0: unlimited.
+        :type max_queue: int
+        :param queue_policy: Policy for submit to the full work queue
+        :type queue_policy: typing.Union[QueuePolicy, str]
+        :param queue_timeout: Time to wait for free place with QueuePolicy.BLOCK. If None: wait forever.
+        :type queue_timeout: typing.Optional[float]
+        :param prioritized: Execute queued work items in order of priority instead of FIFO
+        :type prioritized: bool
+        :param min_workers: Workers started on create and never retired
+        :type min_workers: int
+        :param idle_timeout: Time after which idle worker above min_workers is retired. If None: never.
+        :type idle_timeout: typing.Optional[float]
+        :param growth_threshold: Queued work items required to start new worker if there is no idle one
+        :type growth_threshold: int
+        :param compact_futures: Return CompactFuture from submit: lazy condition, waiters and callbacks
+        :type compact_futures: bool
+        :raises ValueError: min_workers is not in range 0..max_workers or growth_threshold is less than 1
+        """
+        super().__init__(max_workers=max_workers)
+        if not 0 <= min_workers <= self._max_workers:
+            raise ValueError("min_workers must be in range from 0 to max_workers")
+        if growth_threshold < 1:
+            raise ValueError("growth_threshold must be >= 1")
+        self.__min_workers: int = min_workers
+        self.__idle_timeout: float | None = idle_timeout
+        self.__growth_threshold: int = growth_threshold
+        self.__compact_futures: bool = compact_futures
+        self.__peak_worker_count: int = 0
+        self.__worker_counter: Callable[[], int] = itertools.count().__next__
+        self.__expired_count: int = 0
+        self.__submitted_count: int = 0
+        self.__counters_lock: threading.Lock = threading.Lock()
+        self.__worker_counters: dict[threading.Thread, list[int]] = {}  # Counters of running workers
+        self.__workers_counters: list[int] = [0, 0, 0, 0]  # Total of exited workers
+        self.__max_queue: int = max_queue
+        self.__queue_policy: QueuePolicy = QueuePolicy(queue_policy)
+        self.__queue_timeout: float | None = queue_timeout
+        self.__prioritized: bool = prioritized
+        self.__shards: dict[Hashable, collections.deque[_SerialCall]] = {}
+        self.__shards_lock: threading.Lock = threading.Lock()
+        if prioritized:
+            self._work_queue = _work_queue.PriorityWorkQueue(max_queue)  # type: ignore[assignment]
+        elif max_queue:
+            self._work_queue = _work_queue.WorkQueue(max_queue)  # type: ignore[assignment]
+
+        with self._shutdown_lock, _global_shutdown_lock:
+            for _ in range(min_workers):
+                self.__start_worker()
 
     @property
     def max_workers(self) -> int:
@@ -64,43 +542,674 @@ class ThreadPoolExecutor(concurrent.futures.ThreadPoolExecutor):
         """
         return self._shutdown
 
+    @property
+    def max_queue(self) -> int:
+        """Maximum amount of queued work items. If 0: unlimited.
+
+        :rtype: int
+        """
+        return self.__max_queue
+
+    @property
+    def queue_policy(self) -> QueuePolicy:
+        """Policy for submit to the full work queue.
+
+        :rtype: QueuePolicy
+        """
+        return self.__queue_policy
+
+    @property
+    def queue_timeout(self) -> float | None:
+        """Time to wait for free place with QueuePolicy.BLOCK.
+
+        :rtype: typing.Optional[float]
+        """
+        return self.__queue_timeout
+
+    @property
+    def prioritized(self) -> bool:
+        """Queued work items are executed in order of priority.
+
+        :rtype: bool
+        """
+        return self.__prioritized
+
+    @property
+    def min_workers(self) -> int:
+        """Workers started on create and never retired.
+
+        :rtype: int
+        """
+        return self.__min_workers
+
+    @property
+    def idle_timeout(self) -> float | None:
+        """Time after which idle worker above min_workers is retired. If None: never.
+
+        :rtype: typing.Optional[float]
+        """
+        return self.__idle_timeout
+
+    @property
+    def growth_threshold(self) -> int:
+        """Queued work items required to start new worker if there is no idle one.
+
+        :rtype: int
+        """
+        return self.__growth_threshold
+
+    @property
+    def compact_futures(self) -> bool:
+        """Submit returns CompactFuture.
+
+        :rtype: bool
+        """
+        return self.__compact_futures
+
+    @property
+    def worker_count(self) -> int:
+        """Amount of running workers.
+
+        :rtype: int
+        """
+        return sum(1 for thread in tuple(self._threads) if thread.is_alive())
+
+    @property
+    def peak_worker_count(self) -> int:
+        """Maximum amount of workers at the same time.
+
+        :rtype: int
+        """
+        return self.__peak_worker_count
+
+    def __count_work_items(self) -> list[int]:
+        """Sum counters of exited and running workers.
+
+        :return: started, finished, cancelled and failed work items
+        :rtype: list[int]
+        """
+        with self.__counters_lock:
+            return [sum(values) for values in zip(self.__workers_counters, *self.__worker_counters.values())]
+
+    @property
+    def active_count(self) -> int:
+        """Amount of workers executing work items.
+
+        :rtype: int
+        """
+        counters: list[int] = self.__count_work_items()
+        return counters[_STARTED] - counters[_FINISHED]
+
+    @property
+    def submitted_count(self) -> int:
+        """Amount of work items put in the work queue.
+
+        :rtype: int
+        """
+        return self.__submitted_count
+
+    @property
+    def completed_count(self) -> int:
+        """Amount of executed work items, including failed. Cancelled work items are not counted.
+
+        :rtype: int
+        """
+        counters: list[int] = self.__count_work_items()
+        return counters[_FINISHED] - counters[_CANCELLED]
+
+    @property
+    def failed_count(self) -> int:
+        """Amount of work items completed by exception.
+
+        :rtype: int
+        """
+        return self.__count_work_items()[_FAILED]
+
+    def busy_workers(self) -> dict[threading.Thread, int]:
+        """Workers executing work items.
+
+        :return: worker thread to sequence number of the executed work item (started by this worker)
+        :rtype: dict[threading.Thread, int]
+        """
+        with self.__counters_lock:
+            return {
+                thread: counters[_STARTED]
+                for thread, counters in self.__worker_counters.items()
+                if counters[_STARTED] != counters[_FINISHED]
+            }
+
+    def _worker_exited(self, counters: list[int]) -> None:
+        """Add counters of exited worker to the total. Called by exiting worker.
+
+        :param counters: worker counters
+        :type counters: list[int]
+        """
+        with self.__counters_lock:
+            del self.__worker_counters[threading.current_thread()]
+            self.__workers_counters = [sum(values) for values in zip(self.__workers_counters, counters)]
+
+    def __start_worker(self) -> None:
+        """Start new worker. Should be called under shutdown lock."""
+
+        # When the executor gets lost, the weakref callback will wake up the worker threads.
+        def weakref_cb(_: typing.Any, q: typing.Any = self._work_queue) -> None:
+            q.put(None)
+
+        counters: list[int] = [0, 0, 0, 0]
+        thread = threading.Thread(
+            name=f"{self._thread_name_prefix}_{self.__worker_counter()}",
+            target=_worker,
+            args=(weakref.ref(self, weakref_cb), self._work_queue, self.__idle_timeout, counters),
+            # Python 3.8 joins executor workers from atexit hook, called only after non-daemon threads exit
+            daemon=sys.version_info < (3, 9),
+        )
+        with self.__counters_lock:
+            self.__worker_counters[thread] = counters
+        try:
+            thread.start()
+        except BaseException:
+            with self.__counters_lock:
+                del self.__worker_counters[thread]
+            raise
+        self._threads.add(thread)  # type: ignore[attr-defined]
+        _thread._threads_queues[thread] = self._work_queue  # type: ignore[index]  # pylint: disable=protected-access
+
+    def _adjust_thread_count(self) -> None:
+        """Start new worker if required. Called from submit under shutdown lock."""
+        self.__submitted_count += 1
+        if not self._idle_semaphore.acquire(timeout=0):
+            num_threads: int = len(self._threads)
+            if num_threads < self._max_workers and (
+                not num_threads or self._work_queue.qsize() >= self.__growth_threshold
+            ):
+                self.__start_worker()
+        self.__peak_worker_count = max(self.__peak_worker_count, len(self._threads))
+
+    def _retire_idle_worker(self) -> bool:
+        """Retire current worker after idle timeout, if it is allowed.
+
+        :return: worker should exit
+        :rtype: bool
+        """
+        with self._shutdown_lock:
+            if self._shutdown or len(self._threads) <= self.__min_workers:
+                return False
+            # Idle worker released semaphore: take it back, else some submit already relies on this worker
+            if not self._idle_semaphore.acquire(timeout=0):
+                return False
+            self._threads.discard(threading.current_thread())  # type: ignore[attr-defined]
+            return True
+
+    def _retire_excess_worker(self, idle: bool) -> bool:
+        """Retire current worker, if there are more workers than allowed after resize.
+
+        :param idle: worker is idle and released idle semaphore before
+        :type idle: bool
+        :return: worker should exit
+        :rtype: bool
+        """
+        if len(self._threads) <= self._max_workers:  # Fast path without lock
+            return False
+        with self._shutdown_lock:
+            if len(self._threads) <= self._max_workers:
+                return False
+            if idle:
+                self._idle_semaphore.acquire(timeout=0)
+            self._threads.discard(threading.current_thread())  # type: ignore[attr-defined]
+            return True
+
+    def resize(self, max_workers: int | None = None) -> None:
+        """Change maximum workers in place without waiting for running and queued work items.
+
+        On grow workers are started for queued work items, on shrink excess workers exit after current work item.
+
+        :param max_workers: Maximum workers. If None: default for concurrent.futures.ThreadPoolExecutor.
+        :type max_workers: typing.Optional[int]
+        :raises ValueError: max_workers is less than 1 or less than min_workers
+        :raises RuntimeError: executor is shut down
+        """
+        if max_workers is None:
+            max_workers = min(32, (os.cpu_count() or 1) + 4)
+        if max_workers <= 0:
+            raise ValueError("max_workers must be greater than 0")
+        if max_workers < self.__min_workers:
+            raise ValueError("max_workers must not be less than min_workers")
+
+        with self._shutdown_lock:
+            if self._shutdown:
+                raise RuntimeError("cannot resize executor after shutdown")
+            self._max_workers = max_workers
+            num_threads: int = len(self._threads)
+            if num_threads < max_workers:
+                with _global_shutdown_lock:
+                    for _ in range(min(self._work_queue.qsize(), max_workers - num_threads)):
+                        self.__start_worker()
+                self.__peak_worker_count = max(self.__peak_worker_count, len(self._threads))
+            else:
+                # Wake up idle workers: excess ones exit
+                for _ in range(num_threads - max_workers):
+                    self._work_queue.put(None)  # type: ignore[arg-type]
+
+    @property
+    def queue_size(self) -> int:
+        """Amount of queued work items, not picked by workers yet.
+
+        :rtype: int
+        """
+        return self._work_queue.qsize()
+
+    def __reserve(self) -> bool:
+        """Reserve place in the limited work queue according to the queue policy.
+
+        :return: place is reserved
+        :rtype: bool
+        """
+        work_queue: _work_queue.WorkQueue = self._work_queue  # type: ignore[assignment]
+        if self.__queue_policy == QueuePolicy.BLOCK:
+            return work_queue.reserve(timeout=self.__queue_timeout)
+        if self.__queue_policy == QueuePolicy.DROP_OLDEST:
+            reserved, dropped = work_queue.reserve_replace()
+            if dropped is not None:
+                dropped.future.cancel()
+            return reserved
+        return work_queue.reserve(timeout=0)
+
+    @property
+    def expired_count(self) -> int:
+        """Amount of work items cancelled by deadline before start.
+
+        :rtype: int
+        """
+        return self.__expired_count
+
+    def __expire(self, ref: weakref.ref[concurrent.futures.Future[typing.Any] | _loop_bridge.LoopWorkItem]) -> None:
+        """Cancel not started work item on deadline: it is not counted in queue size and not handed to worker."""
+        future: concurrent.futures.Future[typing.Any] | _loop_bridge.LoopWorkItem | None = ref()
+        if future is not None and future.cancel():
+            if isinstance(self._work_queue, _work_queue.WorkQueue):  # Unlimited queue is SimpleQueue
+                self._work_queue.discard(future)
+            with self._shutdown_lock:
+                self.__expired_count += 1
+
+    def __expire_on_deadline(self, future: concurrent.futures.Future[typing.Any] | _loop_bridge.LoopWorkItem) -> None:
+        """Schedule work item cancellation on deadline from call_timeout context, if set.
+
+        Timer holds weak reference: queued work item is referenced by the work queue,
+        done one with its result is not kept until deadline.
+        """
+        deadline: float | None = _work_queue.get_call_deadline()
+        if deadline is not None and not future.done():
+            _timer.get_timer_queue().call_later(deadline - time.monotonic(), self.__expire, weakref.ref(future))
+
+    def submit(
+        self,
+        fn: Callable[Spec, Result],
+        /,
+        *args: Spec.args,
+        **kwargs: Spec.kwargs,
+    ) -> concurrent.futures.Future[Result]:
+        """Submit callable to be executed with the given arguments.
+
+        If deadline is set by call_timeout, work item not started before deadline is cancelled.
+
+        :return: future for the call result
+        :rtype: concurrent.futures.Future
+        :raises RejectedExecutionError: work queue is full
+        """
+        future: concurrent.futures.Future[Result] = self.__submit(fn, args, kwargs)
+        self.__expire_on_deadline(future)
+        return future
+
+    def __submit(
+        self,
+        fn: Callable[..., Result],
+        args: tuple[typing.Any, ...],
+        kwargs: dict[str, typing.Any],
+    ) -> concurrent.futures.Future[Result]:
+        """Submit callable according to the queue policy.
+
+        :return: future for the call result
+        :rtype: concurrent.futures.Future
+        :raises RejectedExecutionError: work queue is full
+        """
+        if not self.__max_queue:
+            return self.__enqueue(fn, args, kwargs)
+
+        if not self.__reserve():
+            self.__check_caller_runs()
+            future: concurrent.futures.Future[Result] = (
+                _compact_future.CompactFuture() if self.__compact_futures else concurrent.futures.Future()
+            )
+            future.set_running_or_notify_cancel()
+            try:
+                future.set_result(fn(*args, **kwargs))
+            except BaseException as exc:  # noqa: BLE001
+                future.set_exception(exc)
+            return future
+
+        try:
+            return self.__enqueue(fn, args, kwargs)
+        except BaseException:
+            self._work_queue.release()  # type: ignore[attr-defined]
+            raise
+
+    def __enqueue(
+        self,
+        fn: Callable[..., Result],
+        args: tuple[typing.Any, ...],
+        kwargs: dict[str, typing.Any],
+    ) -> concurrent.futures.Future[Result]:
+        """Put work item in the work queue, with CompactFuture if enabled.
+
+        :return: future for the call result
+        :rtype: concurrent.futures.Future
+        """
+        if not self.__compact_futures:
+            return super().submit(fn, *args, **kwargs)
+        future: concurrent.futures.Future[Result] = _compact_future.CompactFuture()
+        self.__put_work_item(_thread._WorkItem(future, fn, args, kwargs))  # pylint: disable=protected-access
+        return future
+
+    def __check_caller_runs(self) -> None:
+        """Check, that work item can be executed in the caller thread, if the limited queue is full.
+
+        :raises RejectedExecutionError: queue policy is not QueuePolicy.CALLER_RUNS
+        :raises RuntimeError: executor is shut down
+        """
+        if self.__queue_policy != QueuePolicy.CALLER_RUNS:
+            raise RejectedExecutionError(f"Work queue is full: {self.__max_queue} items queued")
+        if self._shutdown:
+            raise RuntimeError("cannot schedule new futures after shutdown")
+
+    def submit_to_loop(
+        self,
+        loop: AbstractEventLoop,
+        fn: Callable[Spec, Result],
+        /,
+        *args: Spec.args,
+        **kwargs: Spec.kwargs,
+    ) -> asyncio.Future[Result]:
+        """Submit callable to be executed with the given arguments, result is delivered to the event loop.
+
+        Equivalent of ``loop.run_in_executor(executor, functools.partial(fn, *args, **kwargs))``,
+        but worker completes asyncio.Future directly: no concurrent.futures.Future and chaining callbacks,
+        completed calls are delivered to the event loop in batches.
+        Queue policy and deadline set by call_timeout are applied as for submit.
+
+        :param loop: event loop of the returned future
+        :type loop: AbstractEventLoop
+        :return: future for the call result
+        :rtype: asyncio.Future
+        :raises RejectedExecutionError: work queue is full
+        """
+        work_item = _loop_bridge.LoopWorkItem(
+            _loop_bridge.get_completions(loop), loop.create_future(), fn, args, kwargs
+        )
+        self.__submit_work_item(work_item)
+        self.__expire_on_deadline(work_item)
+        return work_item.loop_future
+
+    def __submit_work_item(self, work_item: _loop_bridge.LoopWorkItem) -> None:
+        """Put work item according to the queue policy.
+
+        :raises RejectedExecutionError: work queue is full
+        """
+        if self.__max_queue and not self.__reserve():
+            self.__check_caller_runs()
+            work_item.run()
+            return
+
+        try:
+            self.__put_work_item(work_item)
+        except BaseException:
+            if self.__max_queue:
+                self._work_queue.release()  # type: ignore[attr-defined]
+            raise
+
+    def __put_work_item(self, work_item: _thread._WorkItem[typing.Any] | _loop_bridge.LoopWorkItem) -> None:
+        """Put work item in the work queue and start worker if required. Follow ThreadPoolExecutor.submit logic.
+
+        :raises BrokenThreadPool: worker failed to initialize
+        :raises RuntimeError: executor or interpreter is shut down
+        """
+        with self._shutdown_lock, _global_shutdown_lock:
+            if self._broken:
+                raise _thread.BrokenThreadPool(self._broken)
+            if self._shutdown:
+                raise RuntimeError("cannot schedule new futures after shutdown")
+            if _thread._shutdown:  # pylint: disable=protected-access
+                raise RuntimeError("cannot schedule new futures after interpreter shutdown")
+            self._work_queue.put(work_item)  # type: ignore[arg-type]
+            self._adjust_thread_count()
+
+    def submit_serial(
+        self,
+        key: Hashable,
+        fn: Callable[Spec, Result],
+        /,
+        *args: Spec.args,
+        **kwargs: Spec.kwargs,
+    ) -> concurrent.futures.Future[Result]:
+        """Submit callable to be executed after all previously submitted calls with the same key.
+
+        Calls with different keys are executed concurrently.
+        Calls for the busy key are appended to its backlog, which is executed by a single work item:
+        workers never wait for the key and backlog is not limited by max_queue.
+
+        :param key: serialization key
+        :type key: Hashable
+        :return: future for the call result
+        :rtype: concurrent.futures.Future
+        :raises RejectedExecutionError: work queue is full
+        :raises RuntimeError: executor is shut down
+        """
+        future: concurrent.futures.Future[Result] = concurrent.futures.Future()
+        self.__expire_on_deadline(future)
+        call: _SerialCall = (future, fn, args, kwargs)
+        with self.__shards_lock:
+            backlog: collections.deque[_SerialCall] | None = self.__shards.get(key)
+            if backlog is not None:
+                if self._shutdown:
+                    raise RuntimeError("cannot schedule new futures after shutdown")
+                backlog.append(call)
+                return future
+            self.__shards[key] = collections.deque((call,))
+
+        try:
+            self.__submit_shard(key)
+        except BaseException:
+            if self.__pop_shard_head(key):
+                self.__resume_shard(key)
+            raise
+        return future
+
+    def __pop_shard_head(self, key: Hashable) -> bool:
+        """Remove the first call from the key backlog, forget key if backlog is empty.
+
+        :return: backlog has more calls
+        :rtype: bool
+        """
+        with self.__shards_lock:
+            backlog: collections.deque[_SerialCall] = self.__shards[key]
+            backlog.popleft()
+            if backlog:
+                return True
+            del self.__shards[key]
+            return False
+
+    def __submit_shard(self, key: Hashable) -> None:
+        """Submit work item for the key backlog. Deadlines are applied to the calls, not to the work item."""
+        with _work_queue.call_timeout(None):
+            work_item_future = self.submit(self.__run_shard, key)
+        work_item_future.add_done_callback(functools.partial(self.__shard_done, key))
+
+    def __resume_shard(self, key: Hashable) -> None:
+        """Submit work item for the rest of the key backlog, fail its calls if submit is not possible."""
+        try:
+            self.__submit_shard(key)
+        except BaseException as exc:  # noqa: BLE001
+            with self.__shards_lock:
+                backlog: collections.deque[_SerialCall] = self.__shards.pop(key)
+            for future, *_ in backlog:
+                if future.set_running_or_notify_cancel():
+                    future.set_exception(exc)
+
+    def __run_shard(self, key: Hashable) -> None:
+        """Execute the key backlog until it is empty."""
+        backlog: collections.deque[_SerialCall] = self.__shards[key]
+        while True:
+            future, fn, args, kwargs = backlog[0]
+            if future.set_running_or_notify_cancel():
+                try:
+                    result = fn(*args, **kwargs)
+                except BaseException as exc:  # noqa: BLE001
+                    future.set_exception(exc)
+                else:
+                    future.set_result(result)
+            del future, fn, args, kwargs
+            if not self.__pop_shard_head(key):
+                return
+
+    def __shard_done(self, key: Hashable, work_item_future: concurrent.futures.Future[None]) -> None:
+        """Cancel the first call and resume the key backlog if its work item is cancelled in the queue."""
+        if not work_item_future.cancelled():
+            return
+        with self.__shards_lock:
+            future: concurrent.futures.Future[typing.Any] = self.__shards[key][0][0]
+        future.cancel()
+        if self.__pop_shard_head(key):
+            self.__resume_shard(key)
+
 
 class ThreadPooled(_base_threaded.APIPooled):
     """Post function to ThreadPoolExecutor."""
 
-    __slots__ = ("__loop_getter", "__loop_getter_need_context")
+    __slots__ = (
+        "__cache",
+        "__coalesce",
+        "__coalesce_key",
+        "__in_flight",
+        "__in_flight_lock",
+        "__loop_getter",
+        "__loop_getter_need_context",
+        "__pool",
+        "__priority",
+        "__rate_limit",
+        "__reuse_loop",
+        "__shard_key",
+        "__timeout",
+    )
 
-    __executor: ThreadPoolExecutor | None = None
+    __executors: typing.ClassVar[dict[str, ThreadPoolExecutor]] = {}
+    __executors_lock: typing.ClassVar[threading.RLock] = threading.RLock()
+    # Arguments of the last configure call per pool: shut down executor is recreated with them
+    __settings: typing.ClassVar[dict[str, dict[str, typing.Any]]] = {}
 
     @classmethod
-    def configure(cls: type[ThreadPooled], max_workers: int | None = None) -> None:
+    def configure(
+        cls: type[ThreadPooled],
+        max_workers: int | None = None,
+        *,
+        pool: str = _base_threaded.DEFAULT_POOL,
+        max_queue: int = 0,
+        queue_policy: QueuePolicy | str = QueuePolicy.BLOCK,
+        queue_timeout: float | None = None,
+        prioritized: bool = False,
+        min_workers: int = 0,
+        idle_timeout: float | None = None,
+        growth_threshold: int = 1,
+        compact_futures: bool = False,
+    ) -> None:
         """Pool executor create and configure.
 
+        If only max_workers is changed, existing executor is resized in place.
+        On other changes new executor replaces existing one, which completes queued work items in background.
+        Caller is not blocked in both cases. Executor shut down by shutdown() is recreated with the same settings.
+
         :param max_workers: Maximum workers
         :type max_workers: typing.Optional[int]
+        :param pool: Pool name
+        :type pool: str
+        :param max_queue: Maximum amount of queued work items. If 0: unlimited.
+        :type max_queue: int
+        :param queue_policy: Policy for submit to the full work queue
+        :type queue_policy: typing.Union[QueuePolicy, str]
+        :param queue_timeout: Time to wait for free place with QueuePolicy.BLOCK. If None: wait forever.
+        :type queue_timeout: typing.Optional[float]
+        :param prioritized: Execute queued work items in order of priority instead of FIFO
+        :type prioritized: bool
+        :param min_workers: Workers started on create and never retired
+        :type min_workers: int
+        :param idle_timeout: Time after which idle worker above min_workers is retired. If None: never.
+        :type idle_timeout: typing.Optional[float]
+        :param growth_threshold: Queued work items required to start new worker if there is no idle one
+        :type growth_threshold: int
+        :param compact_futures: Return CompactFuture from submit: lazy condition, waiters and callbacks
+        :type compact_futures: bool
         """
-        if isinstance(cls.__executor, ThreadPoolExecutor):
-            if cls.__executor.max_workers == max_workers:
-                return
-            cls.__executor.shutdown()
+        settings: dict[str, typing.Any] = {
+            "max_queue": max_queue,
+            "queue_policy": queue_policy,
+            "queue_timeout": queue_timeout,
+            "prioritized": prioritized,
+            "min_workers": min_workers,
+            "idle_timeout": idle_timeout,
+            "growth_threshold": growth_threshold,
+            "compact_futures": compact_futures,
+        }
+        with cls.__executors_lock:
+            cls.__settings[pool] = {"max_workers": max_workers, **settings}
+            executor: ThreadPoolExecutor | None = cls.__executors.get(pool)
+            if executor is not None and not executor.is_shutdown:
+                if all(getattr(executor, name) == value for name, value in settings.items()):
+                    if executor.max_workers != max_workers:
+                        executor.resize(max_workers)
+                    return
+                # Swap: new calls go to the new executor, old one completes queued work in background
+                executor.shutdown(wait=False)
 
-        cls.__executor = ThreadPoolExecutor(max_workers=max_workers)
+            cls.__executors[pool] = ThreadPoolExecutor(max_workers=max_workers, **settings)
 
     @classmethod
-    def shutdown(cls: type[ThreadPooled]) -> None:
-        """Shutdown executor."""
-        if cls.__executor is not None:
-            cls.__executor.shutdown()
+    def shutdown(cls: type[ThreadPooled], pool: str | None = None) -> None:
+        """Shutdown executor.
+
+        :param pool: Pool name. If None: shutdown all pools.
+        :type pool: typing.Optional[str]
+        """
+        executors: tuple[ThreadPoolExecutor, ...] = ()
+        with cls.__executors_lock:
+            if pool is None:
+                executors = tuple(cls.__executors.values())
+            elif pool in cls.__executors:
+                executors = (cls.__executors[pool],)
+        # Wait outside of lock: running calls can get executor
+        for executor in executors:
+            executor.shutdown()
+
+    @classmethod
+    def pools(cls: type[ThreadPooled]) -> dict[str, ThreadPoolExecutor]:
+        """Configured pools.
+
+        :return: pool name to executor mapping (snapshot), including shut down executors
+        :rtype: dict[str, ThreadPoolExecutor]
+        """
+        return dict(cls.__executors)
 
     @property
     def executor(self) -> ThreadPoolExecutor:
-        """Executor instance.
+        """Executor instance. Shut down executor is recreated with settings of the last configure call.
 
         :rtype: ThreadPoolExecutor
         """
-        if not isinstance(self.__executor, ThreadPoolExecutor) or self.__executor.is_shutdown:
-            self.configure()
-        return self.__executor  # type: ignore[return-value]
+        executor: ThreadPoolExecutor | None = self.__executors.get(self.__pool)
+        if executor is None or executor.is_shutdown:
+            with self.__executors_lock:  # Only one executor is created by concurrent calls
+                executor = self.__executors.get(self.__pool)
+                if executor is None or executor.is_shutdown:
+                    self.configure(pool=self.__pool, **self.__settings.get(self.__pool, {}))
+                    executor = self.__executors[self.__pool]
+        return executor
 
     def __init__(
         self,
@@ -108,6 +1217,15 @@ class ThreadPooled(_base_threaded.APIPooled):
         *,
         loop_getter: None | (Callable[..., AbstractEventLoop] | AbstractEventLoop) = None,
         loop_getter_need_context: bool = False,
+        reuse_loop: bool = False,
+        pool: str = _base_threaded.DEFAULT_POOL,
+        priority: int | None = None,
+        shard_key: Callable[..., Hashable] | None = None,
+        coalesce: bool = False,
+        coalesce_key: Callable[..., Hashable] | None = None,
+        cache: _result_cache.ResultCache | None = None,
+        rate_limit: _rate_limit.RateLimiter | tuple[int, float] | None = None,
+        timeout: float | None = None,
     ) -> None:
         """Wrap function in future and return.
 
@@ -121,10 +1239,44 @@ class ThreadPooled(_base_threaded.APIPooled):
                            ]
         :param loop_getter_need_context: Loop getter requires function context
         :type loop_getter_need_context: bool
+        :param reuse_loop: Run coroutine functions in event loop persistent for the worker thread
+        :type reuse_loop: bool
+        :param pool: Name of the pool to execute in
+        :type pool: str
+        :param priority: Priority in the prioritized pool, if not set by call_priority. Lower value is executed first.
+        :type priority: typing.Optional[int]
+        :param shard_key: Get key from call arguments: calls with the same key are executed one by one in call order.
+        :type shard_key: typing.Optional[Callable[..., Hashable]]
+        :param coalesce: Calls with the same key share the execution in flight instead of submit
+        :type coalesce: bool
+        :param coalesce_key: Get key for coalesce from call arguments. If None: arguments are used as key.
+        :type coalesce_key: typing.Optional[Callable[..., Hashable]]
+        :param cache: Cache for call results. Cache hit returns done future without submit.
+        :type cache: typing.Optional[ResultCache]
+        :param rate_limit: Calls limit: (calls, per_seconds) or RateLimiter. Throttled calls are submitted by timer.
+        :type rate_limit: typing.Union[RateLimiter, tuple[int, float], None]
+        :param timeout: Time in seconds to start execution: call not started in time is cancelled.
+        :type timeout: typing.Optional[float]
+        :raises ValueError: coalesce_key is set without coalesce or timeout is not positive
         """
+        if coalesce_key is not None and not coalesce:
+            raise ValueError("coalesce_key requires coalesce=True")
+        if timeout is not None and timeout <= 0:
+            raise ValueError("timeout must be greater than 0")
         super().__init__(func=func)
         self.__loop_getter: None | (Callable[..., AbstractEventLoop] | AbstractEventLoop) = loop_getter
         self.__loop_getter_need_context: bool = loop_getter_need_context
+        self.__reuse_loop: bool = reuse_loop
+        self.__pool: str = pool
+        self.__priority: int | None = priority
+        self.__shard_key: Callable[..., Hashable] | None = shard_key
+        self.__coalesce: bool = coalesce
+        self.__coalesce_key: Callable[..., Hashable] | None = coalesce_key
+        self.__in_flight: dict[Hashable, _CoalescedCall] = {}
+        self.__in_flight_lock: threading.Lock = threading.Lock()
+        self.__cache: _result_cache.ResultCache | None = cache
+        self.__rate_limit: _rate_limit.RateLimiter | None = _rate_limit.RateLimiter.from_spec(rate_limit)
+        self.__timeout: float | None = timeout
 
     @property
     def loop_getter(
@@ -144,6 +1296,91 @@ class ThreadPooled(_base_threaded.APIPooled):
         """
         return self.__loop_getter_need_context
 
+    @property
+    def reuse_loop(self) -> bool:
+        """Coroutine functions use event loop persistent for the worker thread.
+
+        :rtype: bool
+        """
+        return self.__reuse_loop
+
+    @property
+    def pool(self) -> str:
+        """Name of the pool to execute in.
+
+        :rtype: str
+        """
+        return self.__pool
+
+    @property
+    def priority(self) -> int | None:
+        """Priority in the prioritized pool, if not set by call_priority.
+
+        :rtype: typing.Optional[int]
+        """
+        return self.__priority
+
+    @property
+    def shard_key(self) -> Callable[..., Hashable] | None:
+        """Get key from call arguments: calls with the same key are executed one by one in call order.
+
+        :rtype: typing.Optional[Callable[..., Hashable]]
+        """
+        return self.__shard_key
+
+    @property
+    def coalesce(self) -> bool:
+        """Calls with the same key share the execution in flight instead of submit.
+
+        :rtype: bool
+        """
+        return self.__coalesce
+
+    @property
+    def coalesce_key(self) -> Callable[..., Hashable] | None:
+        """Get key for coalesce from call arguments. If None: arguments are used as key.
+
+        :rtype: typing.Optional[Callable[..., Hashable]]
+        """
+        return self.__coalesce_key
+
+    @property
+    def cache(self) -> _result_cache.ResultCache | None:
+        """Cache for call results.
+
+        :rtype: typing.Optional[ResultCache]
+        """
+        return self.__cache
+
+    @property
+    def rate_limit(self) -> _rate_limit.RateLimiter | None:
+        """Rate limiter for calls.
+
+        :rtype: typing.Optional[RateLimiter]
+        """
+        return self.__rate_limit
+
+    @property
+    def timeout(self) -> float | None:
+        """Time in seconds to start execution: call not started in time is cancelled.
+
+        :rtype: typing.Optional[float]
+        """
+        return self.__timeout
+
+    def __submit_context(self) -> contextlib.ExitStack:
+        """Get context with decorator priority (if not set by call_priority) and timeout for submit.
+
+        :return: context for submit
+        :rtype: contextlib.ExitStack
+        """
+        stack = contextlib.ExitStack()
+        if self.priority is not None and _work_queue.get_call_priority() is None:
+            stack.enter_context(_work_queue.call_priority(self.priority))
+        if self.timeout is not None:
+            stack.enter_context(_work_queue.call_timeout(self.timeout))
+        return stack
+
     def _get_loop(self, *args: typing.Any, **kwargs: typing.Any) -> AbstractEventLoop | None:
         """Get event loop in decorator class.
 
@@ -166,7 +1403,62 @@ class ThreadPooled(_base_threaded.APIPooled):
         :return: wrapped coroutine or function
         :rtype: Callable[..., Union[Awaitable, concurrent.futures.Future]]
         """
-        prepared = self._await_if_required(func)
+        prepared = self._await_if_required(func, reuse_loop=self.reuse_loop)
+        qualname: str = _instrumentation.qualified_name(func)
+        instrumentation: _instrumentation.Instrumentation = _instrumentation.instrumentation
+
+        def submit(
+            loop: AbstractEventLoop | None,
+            target: Callable[..., typing.Any],
+            /,
+            *args: Spec.args,
+            **kwargs: Spec.kwargs,
+        ) -> concurrent.futures.Future[typing.Any] | Awaitable[typing.Any]:
+            """Submit to the executor.
+
+            :return: future or awaitable
+            :rtype: Union[Awaitable, concurrent.futures.Future]
+            """
+            if self.coalesce:
+                future = self.__submit_coalesced(target, args, kwargs)
+            elif self.shard_key is not None or self.rate_limit is not None:
+                future = self.__submit_future(target, args, kwargs)
+            elif loop is None:
+                return self.executor.submit(target, *args, **kwargs)
+            else:
+                return self.executor.submit_to_loop(loop, target, *args, **kwargs)
+
+            if loop is None:
+                return future
+            return asyncio.wrap_future(future, loop=loop)
+
+        def submit_cached(
+            loop: AbstractEventLoop | None,
+            target: Callable[..., typing.Any],
+            /,
+            *args: Spec.args,
+            **kwargs: Spec.kwargs,
+        ) -> concurrent.futures.Future[typing.Any] | Awaitable[typing.Any]:
+            """Get done future from the cache or submit to the executor and cache result.
+
+            :return: future or awaitable
+            :rtype: Union[Awaitable, concurrent.futures.Future]
+            """
+            cache: _result_cache.ResultCache = self.cache  # type: ignore[assignment]
+            key: Hashable = (qualname, cache.make_key(*args, **kwargs))  # Cache can be shared between functions
+            cached = cache.get(key)
+            if cached is not None:
+                if loop is None:
+                    return _result_cache.resolved_future(cached)
+                return _result_cache.resolved_asyncio_future(loop, cached)
+            future = submit(loop, target, *args, **kwargs)
+            future.add_done_callback(functools.partial(cache.put_future, key))  # type: ignore[union-attr]
+            return future
+
+        call = submit if self.cache is None else submit_cached
+        loop_getter = self.loop_getter
+        resolve_loop: bool = callable(loop_getter)
+        static_loop: AbstractEventLoop | None = None if callable(loop_getter) else loop_getter
 
         # noinspection PyMissingOrEmptyDocstring
         @functools.wraps(prepared)
@@ -178,14 +1470,424 @@ class ThreadPooled(_base_threaded.APIPooled):
             :return: coroutine or function
             :rtype: Union[Awaitable, concurrent.futures.Future]
             """
-            loop: AbstractEventLoop | None = self._get_loop(*args, **kwargs)
+            loop: AbstractEventLoop | None = self._get_loop(*args, **kwargs) if resolve_loop else static_loop
+            # Queue wait is counted from the call: includes rate limit delay and shard serialization
+            target = instrumentation.wrap(qualname, prepared) if instrumentation.enabled else prepared
+
+            if self.priority is None and self.timeout is None:
+                return call(loop, target, *args, **kwargs)
+            with self.__submit_context():
+                return call(loop, target, *args, **kwargs)
+
+        wrapper.map = functools.partial(self._map, func, wrapper)  # type: ignore[attr-defined]
+        wrapper.imap_unordered = functools.partial(  # type: ignore[attr-defined]
+            self._map, func, wrapper, ordered=False
+        )
+        return wrapper
+
+    def __submit_future(
+        self,
+        func: Callable[..., typing.Any],
+        args: tuple[typing.Any, ...],
+        kwargs: dict[str, typing.Any],
+    ) -> concurrent.futures.Future[typing.Any]:
+        """Submit call to the executor, serialized by shard key and delayed by rate limit if set.
+
+        :return: future for the call result
+        :rtype: concurrent.futures.Future[Any]
+        """
+        return self.__submit_limited(func, functools.partial(self.__submit_now, args=args, kwargs=kwargs))
+
+    def __submit_now(
+        self,
+        func: Callable[..., typing.Any],
+        args: tuple[typing.Any, ...],
+        kwargs: dict[str, typing.Any],
+    ) -> concurrent.futures.Future[typing.Any]:
+        """Submit call to the executor, serialized by shard key if set.
+
+        :return: future for the call result
+        :rtype: concurrent.futures.Future[Any]
+        """
+        if self.shard_key is not None:
+            return self.executor.submit_serial(self.shard_key(*args, **kwargs), func, *args, **kwargs)
+        return self.executor.submit(func, *args, **kwargs)
+
+    def __submit_limited(
+        self,
+        func: Callable[..., Result],
+        submit: Callable[[Callable[..., Result | None]], concurrent.futures.Future[Result]],
+        permits: int = 1,
+    ) -> concurrent.futures.Future[Result]:
+        """Submit now or, if rate limit is exceeded, release to the executor by timer.
+
+        Throttled call does not occupy worker until released. Returned future is marked running on call start.
+        If the executor queue is limited with QueuePolicy.BLOCK, throttled call is submitted from the separate thread:
+        waiting for free place in the queue does not delay other timers (rate limits and deadlines of all pools).
+
+        :return: future for the call result
+        :rtype: concurrent.futures.Future[Any]
+        """
+        delay: float = 0.0 if self.rate_limit is None else self.rate_limit.reserve(permits)
+        if delay <= 0:
+            return submit(func)
+
+        future: concurrent.futures.Future[Result] = concurrent.futures.Future()
+
+        def release() -> None:
+            """Submit throttled call to the executor."""
+            if future.cancelled():
+                return
+            try:
+                _chain_future(
+                    submit(functools.partial(_call_if_started, future.set_running_or_notify_cancel, func)), future
+                )
+            except BaseException as exc:  # noqa: BLE001
+                if future.set_running_or_notify_cancel():
+                    future.set_exception(exc)
+
+        def release_from_timer() -> None:
+            """Submit throttled call without blocking the timer thread."""
+            executor: ThreadPoolExecutor = self.executor
+            if future.cancelled() or not executor.max_queue or executor.queue_policy != QueuePolicy.BLOCK:
+                release()
+                return
+            try:
+                threading.Thread(
+                    target=contextvars.copy_context().run,
+                    args=(release,),
+                    name=f"{executor._thread_name_prefix}_release",  # pylint: disable=protected-access
+                    daemon=True,
+                ).start()
+            except BaseException as exc:  # noqa: BLE001
+                if future.set_running_or_notify_cancel():
+                    future.set_exception(exc)
+
+        # Call priority is kept for submit from the timer thread
+        _timer.get_timer_queue().call_later(delay, contextvars.copy_context().run, release_from_timer)
+        return future
 
+    def __submit_coalesced(
+        self,
+        func: Callable[..., typing.Any],
+        args: tuple[typing.Any, ...],
+        kwargs: dict[str, typing.Any],
+    ) -> concurrent.futures.Future[typing.Any]:
+        """Join the call in flight with the same key or submit new call.
+
+        Calls with unhashable arguments are not coalesced, if coalesce_key is not set.
+
+        :return: own future of the caller for the shared call result
+        :rtype: concurrent.futures.Future[Any]
+        """
+        key: Hashable = (
+            self.coalesce_key(*args, **kwargs)
+            if self.coalesce_key is not None
+            else (args, tuple(sorted(kwargs.items())))
+        )
+        try:
+            with self.__in_flight_lock:
+                call: _CoalescedCall | None = self.__in_flight.get(key)
+                future: concurrent.futures.Future[typing.Any] | None = call.join() if call is not None else None
+                if future is not None:
+                    return future
+                call = _CoalescedCall()
+                future = call.join()
+                self.__in_flight[key] = call
+        except TypeError:  # Unhashable arguments
+            if self.coalesce_key is not None:
+                raise
+            return self.__submit_future(func, args, kwargs)
+
+        # Submit outside of lock: submit can block or run the call in the caller thread
+        try:
+            _chain_future(
+                self.__submit_future(functools.partial(_call_if_started, call.start, func), args, kwargs),
+                call.execution,
+            )
+        except BaseException as exc:
+            with self.__in_flight_lock:
+                if self.__in_flight.get(key) is call:
+                    del self.__in_flight[key]
+            if call.execution.set_running_or_notify_cancel():
+                call.execution.set_exception(exc)  # Calls coalesced while submit get the same error
+            raise
+        call.execution.add_done_callback(functools.partial(self.__forget_in_flight, key, call))
+        return future  # type: ignore[return-value]
+
+    def __forget_in_flight(self, key: Hashable, call: _CoalescedCall, _: concurrent.futures.Future[typing.Any]) -> None:
+        """Remove done call from the calls in flight."""
+        with self.__in_flight_lock:
+            if self.__in_flight.get(key) is call:
+                del self.__in_flight[key]
+
+    def __submit_chunk(
+        self,
+        executor: ThreadPoolExecutor,
+        qualname: str,
+        prepared: Callable[..., typing.Any],
+        loop: AbstractEventLoop | None,
+        chunk: list[tuple[typing.Any, ...]],
+    ) -> concurrent.futures.Future[list[typing.Any]] | asyncio.Future[list[typing.Any]]:
+        """Submit chunk of calls to the executor with decorator priority and timeout.
+
+        :return: future for the chunk results
+        :rtype: Union[concurrent.futures.Future[list[Any]], asyncio.Future[list[Any]]]
+        """
+        instrumentation: _instrumentation.Instrumentation = _instrumentation.instrumentation
+        # Queue wait of each call is counted from the chunk submit
+        run_chunk = functools.partial(
+            _run_chunk, instrumentation.wrap(qualname, prepared) if instrumentation.enabled else prepared
+        )
+        if self.priority is not None or self.timeout is not None:
+            with self.__submit_context():
+                return self.__submit_chunk_in_context(loop, executor, run_chunk, chunk)
+        return self.__submit_chunk_in_context(loop, executor, run_chunk, chunk)
+
+    def __submit_chunk_in_context(
+        self,
+        loop: AbstractEventLoop | None,
+        executor: ThreadPoolExecutor,
+        run_chunk: Callable[[list[tuple[typing.Any, ...]]], list[typing.Any]],
+        chunk: list[tuple[typing.Any, ...]],
+    ) -> concurrent.futures.Future[list[typing.Any]] | asyncio.Future[list[typing.Any]]:
+        """Submit chunk of calls to the executor in the current context.
+
+        :return: future for the chunk results
+        :rtype: Union[concurrent.futures.Future[list[Any]], asyncio.Future[list[Any]]]
+        """
+        if self.shard_key is not None or self.rate_limit is not None:
+            future = self.__submit_limited(
+                run_chunk,
+                functools.partial(self.__submit_chunk_now, executor, chunk=chunk),
+                permits=len(chunk),
+            )
             if loop is None:
-                return self.executor.submit(prepared, *args, **kwargs)
+                return future
+            return asyncio.wrap_future(future, loop=loop)
+        if loop is None:
+            return executor.submit(run_chunk, chunk)
+        return loop.run_in_executor(executor, run_chunk, chunk)
 
-            return loop.run_in_executor(self.executor, functools.partial(prepared, *args, **kwargs))
+    def __submit_chunk_now(
+        self,
+        executor: ThreadPoolExecutor,
+        run_chunk: Callable[[list[tuple[typing.Any, ...]]], list[typing.Any]],
+        chunk: list[tuple[typing.Any, ...]],
+    ) -> concurrent.futures.Future[list[typing.Any]]:
+        """Submit chunk of calls to the executor, serialized by shard key if set.
 
-        return wrapper
+        :return: future for the chunk results
+        :rtype: concurrent.futures.Future[list[Any]]
+        """
+        if self.shard_key is not None:
+            return executor.submit_serial(self.shard_key(*chunk[0]), run_chunk, chunk)
+        return executor.submit(run_chunk, chunk)
+
+    def __iter_results(
+        self,
+        submit: Callable[[None, list[tuple[typing.Any, ...]]], concurrent.futures.Future[typing.Any]],
+        chunks: Iterator[list[tuple[typing.Any, ...]]],
+        ordered: bool,
+        single: bool,
+    ) -> Iterator[typing.Any]:
+        """Submit chunks with limited prefetch and yield results.
+
+        :return: results iterator
+        :rtype: Iterator[Any]
+        """
+        prefetch: int = self.executor.max_workers * 2
+        pending: collections.deque[concurrent.futures.Future[typing.Any]] = collections.deque()
+        try:
+            for chunk in chunks:
+                pending.append(submit(None, chunk))
+                if len(pending) >= prefetch:
+                    yield from self.__pop_results(pending, ordered, single)
+            while pending:
+                yield from self.__pop_results(pending, ordered, single)
+        finally:
+            for future in pending:
+                future.cancel()
+
+    @staticmethod
+    def __pop_results(
+        pending: collections.deque[concurrent.futures.Future[typing.Any]],
+        ordered: bool,
+        single: bool,
+    ) -> Iterator[typing.Any]:
+        """Wait for the oldest chunk (ordered) or the first completed chunks and yield results.
+
+        :return: results iterator
+        :rtype: Iterator[Any]
+        """
+        if ordered:
+            result: typing.Any = pending.popleft().result()
+            if single:
+                yield result
+            else:
+                yield from result
+            return
+        done, not_done = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+        pending.clear()
+        pending.extend(not_done)
+        for future in done:
+            if single:
+                yield future.result()
+            else:
+                yield from future.result()
+
+    async def __aiter_results(
+        self,
+        submit: Callable[[AbstractEventLoop, list[tuple[typing.Any, ...]]], Awaitable[typing.Any]],
+        chunks: Iterator[list[tuple[typing.Any, ...]]],
+        ordered: bool,
+        single: bool,
+    ) -> AsyncIterator[typing.Any]:
+        """Submit chunks with limited prefetch from the running event loop and yield results.
+
+        :return: results async iterator
+        :rtype: AsyncIterator[Any]
+        """
+        loop: AbstractEventLoop = asyncio.get_running_loop()
+        prefetch: int = self.executor.max_workers * 2
+        pending: collections.deque[asyncio.Future[typing.Any]] = collections.deque()
+        try:
+            for chunk in chunks:
+                pending.append(asyncio.ensure_future(submit(loop, chunk)))
+                if len(pending) >= prefetch:
+                    for result in await self.__apop_results(pending, ordered, single):
+                        yield result
+            while pending:
+                for result in await self.__apop_results(pending, ordered, single):
+                    yield result
+        finally:
+            for future in pending:
+                future.cancel()
+
+    @staticmethod
+    async def __apop_results(
+        pending: collections.deque[asyncio.Future[typing.Any]],
+        ordered: bool,
+        single: bool,
+    ) -> list[typing.Any]:
+        """Wait for the oldest chunk (ordered) or the first completed chunks.
+
+        :return: results
+        :rtype: list[Any]
+        """
+        if ordered:
+            result: typing.Any = await pending.popleft()
+            return [result] if single else result
+        done, not_done = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        pending.clear()
+        pending.extend(not_done)
+        if single:
+            return [future.result() for future in done]
+        return [result for future in done for result in future.result()]
+
+    def _map(
+        self,
+        func: Callable[..., Awaitable[typing.Any] | typing.Any],
+        call: Callable[..., concurrent.futures.Future[typing.Any] | Awaitable[typing.Any]],
+        /,
+        *iterables: Iterable[typing.Any],
+        chunksize: int = 1,
+        ordered: bool = True,
+    ) -> Iterator[typing.Any] | AsyncIterator[typing.Any]:
+        """Execute function for each arguments from iterables in the pool.
+
+        Chunks are submitted with decorator priority, timeout, shard key and rate limit, calls are instrumented.
+        With cache or coalesce each call is made by the decorated function: chunks are not supported.
+
+        :param func: function to execute (coroutine functions are awaited in the worker)
+        :type func: Callable[..., Union[Awaitable[Any], Any]]
+        :param call: decorated function
+        :type call: Callable[..., Union[concurrent.futures.Future[Any], Awaitable[Any]]]
+        :param iterables: positional arguments sources, zipped like in builtin map
+        :type iterables: Iterable[Any]
+        :param chunksize: amount of calls submitted as single work item
+        :type chunksize: int
+        :param ordered: yield results in order of arguments, else as soon as chunk is done
+        :type ordered: bool
+        :return: results iterator. If loop_getter is set: async iterator in the running event loop.
+        :rtype: Union[Iterator[Any], AsyncIterator[Any]]
+        :raises ValueError: chunksize is less than 1 or chunksize is not 1 with shard_key, coalesce or cache
+        """
+        if chunksize < 1:
+            raise ValueError("chunksize must be >= 1")
+        single: bool = self.coalesce or self.cache is not None
+        if chunksize != 1 and (single or self.shard_key is not None):
+            raise ValueError("chunksize must be 1 with shard_key, coalesce or cache")
+        if single:
+            submit: Callable[..., typing.Any] = functools.partial(_call_single, call)
+        else:
+            submit = functools.partial(
+                self.__submit_chunk,
+                self.executor,
+                _instrumentation.qualified_name(func),
+                self._await_if_required(func, reuse_loop=self.reuse_loop),
+            )
+        chunks = _chunked(iterables, chunksize)
+        if self.loop_getter is None:
+            return self.__iter_results(submit, chunks, ordered, single)
+        return self.__aiter_results(submit, chunks, ordered, single)
+
+    def map(
+        self,
+        *iterables: Iterable[typing.Any],
+        chunksize: int = 1,
+        ordered: bool = True,
+    ) -> Iterator[typing.Any] | AsyncIterator[typing.Any]:
+        """Execute decorated function for each arguments from iterables in the pool.
+
+        Calls are submitted lazily by chunks with prefetch limited to the doubled pool size.
+        If any call is failed, exception is raised on its chunk results and not started chunks are cancelled.
+        Decorator options are applied as for direct calls, with cache or coalesce only chunksize=1 is supported.
+
+        :param iterables: positional arguments sources, zipped like in builtin map
+        :type iterables: Iterable[Any]
+        :param chunksize: amount of calls submitted as single work item
+        :type chunksize: int
+        :param ordered: yield results in order of arguments, else as soon as chunk is done
+        :type ordered: bool
+        :return: results iterator. If loop_getter is set: async iterator in the running event loop.
+        :rtype: Union[Iterator[Any], AsyncIterator[Any]]
+        :raises TypeError: decorator is not bound to the function
+        :raises ValueError: chunksize is less than 1 or chunksize is not 1 with shard_key, coalesce or cache
+        """
+        if self._func is None:
+            raise TypeError("Function is not set: use map of decorated function")
+        return self._map(  # Decorator with function is called as wrapper
+            self._func, self, *iterables, chunksize=chunksize, ordered=ordered  # type: ignore[arg-type]
+        )
+
+    def imap_unordered(
+        self,
+        *iterables: Iterable[typing.Any],
+        chunksize: int = 1,
+    ) -> Iterator[typing.Any] | AsyncIterator[typing.Any]:
+        """Execute decorated function for each arguments from iterables in the pool, yield results as ready.
+
+        :param iterables: positional arguments sources, zipped like in builtin map
+        :type iterables: Iterable[Any]
+        :param chunksize: amount of calls submitted as single work item
+        :type chunksize: int
+        :return: results iterator. If loop_getter is set: async iterator in the running event loop.
+        :rtype: Union[Iterator[Any], AsyncIterator[Any]]
+        """
+        return self.map(*iterables, chunksize=chunksize, ordered=False)
+
+    def _bind_wrapper(self, wrapper: Callable[..., typing.Any], instance: typing.Any) -> _BoundMethod:
+        """Bind built wrapper to the instance: map and imap_unordered of the bound method get the instance too.
+
+        :param wrapper: wrapper built by _get_function_wrapper
+        :type wrapper: Callable[..., typing.Any]
+        :param instance: instance to bind
+        :type instance: typing.Any
+        :return: bound method
+        :rtype: _BoundMethod
+        """
+        return _BoundMethod(wrapper, instance)
 
     def __call__(
         self,
@@ -214,6 +1916,15 @@ class ThreadPooled(_base_threaded.APIPooled):
             f"{self._func!r}, "
             f"loop_getter={self.loop_getter!r}, "
             f"loop_getter_need_context={self.loop_getter_need_context!r}, "
+            f"reuse_loop={self.reuse_loop!r}, "
+            f"pool={self.pool!r}, "
+            f"priority={self.priority!r}, "
+            f"shard_key={self.shard_key!r}, "
+            f"coalesce={self.coalesce!r}, "
+            f"coalesce_key={self.coalesce_key!r}, "
+            f"cache={self.cache!r}, "
+            f"rate_limit={self.rate_limit!r}, "
+            f"timeout={self.timeout!r}, "
             f") at 0x{id(self):X}>"
         )
 
@@ -224,6 +1935,15 @@ def threadpooled(
     *,
     loop_getter: None = None,
     loop_getter_need_context: bool = False,
+    reuse_loop: bool = False,
+    pool: str = _base_threaded.DEFAULT_POOL,
+    priority: int | None = None,
+    shard_key: Callable[..., Hashable] | None = None,
+    coalesce: bool = False,
+    coalesce_key: Callable[..., Hashable] | None = None,
+    cache: _result_cache.ResultCache | None = None,
+    rate_limit: _rate_limit.RateLimiter | tuple[int, float] | None = None,
+    timeout: float | None = None,
 ) -> Callable[..., concurrent.futures.Future[typing.Any]]:
     """Overload: function callable, no loop getter."""
 
@@ -234,6 +1954,15 @@ def threadpooled(
     *,
     loop_getter: Callable[..., AbstractEventLoop] | AbstractEventLoop,
     loop_getter_need_context: bool = False,
+    reuse_loop: bool = False,
+    pool: str = _base_threaded.DEFAULT_POOL,
+    priority: int | None = None,
+    shard_key: Callable[..., Hashable] | None = None,
+    coalesce: bool = False,
+    coalesce_key: Callable[..., Hashable] | None = None,
+    cache: _result_cache.ResultCache | None = None,
+    rate_limit: _rate_limit.RateLimiter | tuple[int, float] | None = None,
+    timeout: float | None = None,
 ) -> Callable[..., Task[typing.Any]]:
     """Overload: function callable, loop getter available."""
 
@@ -244,6 +1973,15 @@ def threadpooled(
     *,
     loop_getter: None | Callable[..., AbstractEventLoop] | AbstractEventLoop = None,
     loop_getter_need_context: bool = False,
+    reuse_loop: bool = False,
+    pool: str = _base_threaded.DEFAULT_POOL,
+    priority: int | None = None,
+    shard_key: Callable[..., Hashable] | None = None,
+    coalesce: bool = False,
+    coalesce_key: Callable[..., Hashable] | None = None,
+    cache: _result_cache.ResultCache | None = None,
+    rate_limit: _rate_limit.RateLimiter | tuple[int, float] | None = None,
+    timeout: float | None = None,
 ) -> ThreadPooled:
     """Overload: No function."""
 
@@ -253,6 +1991,15 @@ def threadpooled(
     *,
     loop_getter: None | Callable[..., AbstractEventLoop] | AbstractEventLoop = None,
     loop_getter_need_context: bool = False,
+    reuse_loop: bool = False,
+    pool: str = _base_threaded.DEFAULT_POOL,
+    priority: int | None = None,
+    shard_key: Callable[..., Hashable] | None = None,
+    coalesce: bool = False,
+    coalesce_key: Callable[..., Hashable] | None = None,
+    cache: _result_cache.ResultCache | None = None,
+    rate_limit: _rate_limit.RateLimiter | tuple[int, float] | None = None,
+    timeout: float | None = None,
 ) -> ThreadPooled | Callable[..., concurrent.futures.Future[typing.Any] | Awaitable[typing.Any]]:
     """Post function to ThreadPoolExecutor.
 
@@ -266,6 +2013,24 @@ def threadpooled(
                        ]
     :param loop_getter_need_context: Loop getter requires function context
     :type loop_getter_need_context: bool
+    :param reuse_loop: Run coroutine functions in event loop persistent for the worker thread
+    :type reuse_loop: bool
+    :param pool: Name of the pool to execute in
+    :type pool: str
+    :param priority: Priority in the prioritized pool, if not set by call_priority. Lower value is executed first.
+    :type priority: typing.Optional[int]
+    :param shard_key: Get key from call arguments: calls with the same key are executed one by one in call order.
+    :type shard_key: typing.Optional[Callable[..., Hashable]]
+    :param coalesce: Calls with the same key share the execution in flight instead of submit
+    :type coalesce: bool
+    :param coalesce_key: Get key for coalesce from call arguments. If None: arguments are used as key.
+    :type coalesce_key: typing.Optional[Callable[..., Hashable]]
+    :param cache: Cache for call results. Cache hit returns done future without submit.
+    :type cache: typing.Optional[ResultCache]
+    :param rate_limit: Calls limit: (calls, per_seconds) or RateLimiter. Throttled calls are submitted by timer.
+    :type rate_limit: typing.Union[RateLimiter, tuple[int, float], None]
+    :param timeout: Time in seconds to start execution: call not started in time is cancelled.
+    :type timeout: typing.Optional[float]
     :return: ThreadPooled instance, if called as function or argumented decorator, else callable wrapper
     :rtype: typing.Union[ThreadPooled, Callable[..., typing.Union[concurrent.futures.Future, Awaitable]]]
     """
@@ -274,9 +2039,27 @@ def threadpooled(
             func=func,
             loop_getter=loop_getter,
             loop_getter_need_context=loop_getter_need_context,
+            reuse_loop=reuse_loop,
+            pool=pool,
+            priority=priority,
+            shard_key=shard_key,
+            coalesce=coalesce,
+            coalesce_key=coalesce_key,
+            cache=cache,
+            rate_limit=rate_limit,
+            timeout=timeout,
         )
     return ThreadPooled(  # type: ignore[return-value]
         func=None,
         loop_getter=loop_getter,
         loop_getter_need_context=loop_getter_need_context,
+        reuse_loop=reuse_loop,
+        pool=pool,
+        priority=priority,
+        shard_key=shard_key,
+        coalesce=coalesce,
+        coalesce_key=coalesce_key,
+        cache=cache,
+        rate_limit=rate_limit,
+        timeout=timeout,
     )(func)
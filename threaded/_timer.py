@@ -0,0 +1,113 @@
+#    Copyright 2017 - 2020 Alexey Stepanov aka penguinolog
+##
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+
+#         http://www.apache.org/licenses/LICENSE-2.0
+
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Timer queue: delayed callbacks executed in the single daemon thread."""
+
+from __future__ import annotations
+
+# Standard Library
+import heapq
+import itertools
+import logging
+import threading
+import time
+import typing
+
+if typing.TYPE_CHECKING:
+    from collections.abc import Callable
+    from collections.abc import Iterator
+
+__all__ = ("TimerQueue", "get_timer_queue")
+
+LOGGER = logging.getLogger(__name__)
+
+
+class TimerQueue:
+    """Execute callbacks after delay in the single daemon thread. Thread exits when queue is idle."""
+
+    __slots__ = ("__condition", "__counter", "__heap", "__idle_timeout", "__thread")
+
+    def __init__(self, idle_timeout: float = 10.0) -> None:
+        """Execute callbacks after delay in the single daemon thread.
+
+        :param idle_timeout: Time to wait for new callbacks before thread exit
+        :type idle_timeout: float
+        """
+        self.__idle_timeout: float = idle_timeout
+        self.__condition: threading.Condition = threading.Condition()
+        self.__heap: list[tuple[float, int, Callable[..., typing.Any], tuple[typing.Any, ...]]] = []
+        self.__counter: Iterator[int] = itertools.count()
+        self.__thread: threading.Thread | None = None
+
+    def __len__(self) -> int:
+        """Amount of pending callbacks.
+
+        :rtype: int
+        """
+        return len(self.__heap)
+
+    def call_later(self, delay: float, callback: Callable[..., typing.Any], *args: typing.Any) -> None:
+        """Schedule callback execution after delay. Callbacks with the same due time are executed in order.
+
+        :param delay: delay in seconds
+        :type delay: float
+        :param callback: callback to execute
+        :type callback: Callable[..., typing.Any]
+        """
+        with self.__condition:
+            heapq.heappush(self.__heap, (time.monotonic() + delay, next(self.__counter), callback, args))
+            if self.__thread is None:
+                self.__thread = threading.Thread(target=self.__run, name="threaded-timer", daemon=True)
+                self.__thread.start()
+            self.__condition.notify()
+
+    def __next_callback(self) -> tuple[Callable[..., typing.Any], tuple[typing.Any, ...]] | None:
+        """Wait for the due callback.
+
+        :return: callback and arguments, None if idle timeout is expired
+        :rtype: typing.Optional[tuple[Callable[..., typing.Any], tuple[typing.Any, ...]]]
+        """
+        with self.__condition:
+            while True:
+                if not self.__heap:
+                    if not self.__condition.wait(self.__idle_timeout) and not self.__heap:
+                        self.__thread = None
+                        return None
+                    continue
+                timeout: float = self.__heap[0][0] - time.monotonic()
+                if timeout <= 0:
+                    _, _, callback, args = heapq.heappop(self.__heap)
+                    return callback, args
+                self.__condition.wait(timeout)
+
+    def __run(self) -> None:
+        """Timer thread main loop."""
+        while (due := self.__next_callback()) is not None:
+            callback, args = due
+            try:
+                callback(*args)
+            except BaseException:
+                LOGGER.exception("Exception in timer callback %r", callback)
+            del due, callback, args
+
+
+_timer_queue: TimerQueue = TimerQueue()
+
+
+def get_timer_queue() -> TimerQueue:
+    """Get timer queue shared by decorators.
+
+    :rtype: TimerQueue
+    """
+    return _timer_queue
@@ -0,0 +1,260 @@
+#    Copyright 2017 - 2020 Alexey Stepanov aka penguinolog
+##
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+
+#         http://www.apache.org/licenses/LICENSE-2.0
+
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Stall detector for ThreadPooled workers.
+
+Watchdog thread samples busy workers of the pools: work item is identified by worker and its sequence number,
+so workers do not record start time. Work item running longer than threshold is reported once with worker stack.
+"""
+
+from __future__ import annotations
+
+# Standard Library
+import logging
+import sys
+import threading
+import time
+import traceback
+import typing
+
+# Package Implementation
+from . import _threaded
+from . import _threadpooled
+
+if typing.TYPE_CHECKING:
+    from collections.abc import Callable
+
+__all__ = ("PoolStalls", "StalledTask", "Watchdog", "format_stack")
+
+LOGGER = logging.getLogger("threaded")
+
+
+class StalledTask(typing.NamedTuple):
+    """Work item running longer than watchdog threshold."""
+
+    pool: str
+    thread: threading.Thread
+    started: float  # time.monotonic() of the first observation: not later than real start + watchdog interval
+    duration: float  # Seconds since the first observation at the moment of the last check
+    stack: str  # Worker stack at the moment of detection
+
+
+class PoolStalls(typing.NamedTuple):
+    """Pool capacity lost to the stalled work items."""
+
+    pool: str
+    max_workers: int
+    busy: int  # Workers executing work items
+    stalled: int  # Workers executing stalled work items
+    lost: float  # Part of max_workers occupied by stalled work items
+
+
+def format_stack(ident: int | None) -> str:
+    """Get formatted stack of the thread.
+
+    :param ident: thread identifier
+    :type ident: typing.Optional[int]
+    :return: formatted stack, empty if thread is not running
+    :rtype: str
+    """
+    frame = sys._current_frames().get(ident)  # type: ignore[arg-type]  # pylint: disable=protected-access
+    if frame is None:
+        return ""
+    return "".join(traceback.format_stack(frame))
+
+
+def _log_stalled(task: StalledTask) -> None:
+    """Log stalled work item with worker stack.
+
+    :param task: stalled work item
+    :type task: StalledTask
+    """
+    LOGGER.warning(
+        "Work item in pool %r is running for %.1f s in worker %s:\n%s",
+        task.pool,
+        task.duration,
+        task.thread.name,
+        task.stack,
+    )
+
+
+class Watchdog:
+    """Detect ThreadPooled work items running longer than threshold in the background daemon thread."""
+
+    __slots__ = ("__callback", "__interval", "__lock", "__observed", "__stalled", "__stop", "__thread", "__threshold")
+
+    def __init__(
+        self,
+        threshold: float,
+        *,
+        interval: float | None = None,
+        callback: Callable[[StalledTask], typing.Any] | None = None,
+    ) -> None:
+        """Detect ThreadPooled work items running longer than threshold.
+
+        :param threshold: Running time after which work item is reported as stalled, seconds
+        :type threshold: float
+        :param interval: Interval between checks. If None: quarter of threshold.
+        :type interval: typing.Optional[float]
+        :param callback: Called once for each stalled work item in the watchdog thread. If None: log warning.
+        :type callback: typing.Optional[Callable[[StalledTask], typing.Any]]
+        :raises ValueError: threshold or interval is not positive
+        """
+        if threshold <= 0:
+            raise ValueError("threshold must be > 0")
+        if interval is None:
+            interval = threshold / 4
+        if interval <= 0:
+            raise ValueError("interval must be > 0")
+        self.__threshold: float = threshold
+        self.__interval: float = interval
+        self.__callback: Callable[[StalledTask], typing.Any] = callback if callback is not None else _log_stalled
+        self.__lock: threading.Lock = threading.Lock()
+        # Work item (pool, worker, sequence number) to the first observation time
+        self.__observed: dict[tuple[str, threading.Thread, int], float] = {}
+        self.__stalled: dict[tuple[str, threading.Thread, int], StalledTask] = {}
+        self.__stop: threading.Event = threading.Event()
+        self.__thread: threading.Thread | None = None
+
+    @property
+    def threshold(self) -> float:
+        """Running time after which work item is reported as stalled.
+
+        :rtype: float
+        """
+        return self.__threshold
+
+    @property
+    def interval(self) -> float:
+        """Interval between checks.
+
+        :rtype: float
+        """
+        return self.__interval
+
+    @property
+    def running(self) -> bool:
+        """Watchdog thread is running.
+
+        :rtype: bool
+        """
+        return self.__thread is not None and self.__thread.is_alive()
+
+    def start(self) -> Watchdog:
+        """Start watchdog thread, if not started.
+
+        :return: watchdog itself
+        :rtype: Watchdog
+        """
+        with self.__lock:
+            if not self.running:
+                self.__stop.clear()
+                self.__thread = _threaded.threaded(self.__run, daemon=True, started=True)()
+        return self
+
+    def stop(self) -> None:
+        """Stop watchdog thread and wait for it."""
+        with self.__lock:
+            thread, self.__thread = self.__thread, None
+        self.__stop.set()
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+
+    def __run(self) -> None:
+        """Check pools until stop."""
+        while not self.__stop.wait(self.__interval):
+            try:
+                self.check()
+            except Exception:  # noqa: PERF203
+                LOGGER.exception("Watchdog check failed")
+
+    def check(self) -> tuple[StalledTask, ...]:
+        """Check busy workers of the pools and report new stalled work items.
+
+        Called by watchdog thread, can be called directly without start.
+
+        :return: work items stalled at the moment, including reported before
+        :rtype: tuple[StalledTask, ...]
+        """
+        reported: list[StalledTask] = []
+        with self.__lock:
+            now: float = time.monotonic()
+            observed: dict[tuple[str, threading.Thread, int], float] = {}
+            for pool, executor in _threadpooled.ThreadPooled.pools().items():
+                for thread, sequence in executor.busy_workers().items():
+                    key = (pool, thread, sequence)
+                    observed[key] = self.__observed.get(key, now)
+
+            stalled: dict[tuple[str, threading.Thread, int], StalledTask] = {}
+            for key, started in observed.items():
+                if now - started < self.__threshold:
+                    continue
+                task: StalledTask | None = self.__stalled.get(key)
+                if task is None:
+                    task = StalledTask(key[0], key[1], started, now - started, format_stack(key[1].ident))
+                    reported.append(task)
+                else:
+                    task = task._replace(duration=now - started)
+                stalled[key] = task
+
+            self.__observed = observed
+            self.__stalled = stalled
+        for task in reported:
+            try:
+                self.__callback(task)
+            except Exception:  # noqa: PERF203
+                LOGGER.exception("Watchdog callback failed")
+        return tuple(stalled.values())
+
+    def stalled(self) -> tuple[StalledTask, ...]:
+        """Work items stalled at the moment of the last check.
+
+        :rtype: tuple[StalledTask, ...]
+        """
+        return tuple(self.__stalled.values())
+
+    def summary(self) -> tuple[PoolStalls, ...]:
+        """Pools capacity lost to the stalled work items at the moment of the last check.
+
+        :rtype: tuple[PoolStalls, ...]
+        """
+        stalled: dict[str, int] = {}
+        for task in self.__stalled.values():
+            stalled[task.pool] = stalled.get(task.pool, 0) + 1
+        busy: dict[str, int] = {}
+        for pool, _, _ in self.__observed:
+            busy[pool] = busy.get(pool, 0) + 1
+        return tuple(
+            PoolStalls(
+                pool=pool,
+                max_workers=executor.max_workers,
+                busy=busy.get(pool, 0),
+                stalled=stalled.get(pool, 0),
+                lost=stalled.get(pool, 0) / executor.max_workers,
+            )
+            for pool, executor in sorted(_threadpooled.ThreadPooled.pools().items())
+        )
+
+    def __repr__(self) -> str:  # pragma: no cover
+        """For debug purposes.
+
+        :return: repr info
+        :rtype: str
+        """
+        return (
+            f"<{self.__class__.__name__}("
+            f"threshold={self.threshold!r}, "
+            f"interval={self.interval!r}, "
+            f") running={self.running}, stalled={len(self.__stalled)}>"
+        )
@@ -0,0 +1,356 @@
+#    Copyright 2017 - 2020 Alexey Stepanov aka penguinolog
+##
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+
+#         http://www.apache.org/licenses/LICENSE-2.0
+
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Work queues for ThreadPoolExecutor.
+
+Queue API is compatible with queue.SimpleQueue usage in concurrent.futures.thread.
+"""
+
+from __future__ import annotations
+
+# Standard Library
+import collections
+import contextlib
+import contextvars
+import heapq
+import itertools
+import queue
+import threading
+import time
+import typing
+
+if typing.TYPE_CHECKING:
+    from collections.abc import Iterator
+    from concurrent.futures.thread import _WorkItem
+
+__all__ = (
+    "PriorityWorkQueue",
+    "WorkQueue",
+    "call_priority",
+    "call_timeout",
+    "get_call_deadline",
+    "get_call_priority",
+)
+
+_call_priority: contextvars.ContextVar[int | None] = contextvars.ContextVar("call_priority", default=None)
+_call_deadline: contextvars.ContextVar[float | None] = contextvars.ContextVar("call_deadline", default=None)
+
+
+def get_call_priority() -> int | None:
+    """Get priority for submit in the current context.
+
+    :return: priority set by call_priority or None if not set
+    :rtype: typing.Optional[int]
+    """
+    return _call_priority.get()
+
+
+@contextlib.contextmanager
+def call_priority(priority: int) -> Iterator[None]:
+    """Set priority for pool submissions in the context. Lower value is executed first.
+
+    :param priority: priority for work items submitted to the prioritized pools
+    :type priority: int
+    """
+    token = _call_priority.set(priority)
+    try:
+        yield
+    finally:
+        _call_priority.reset(token)
+
+
+def get_call_deadline() -> float | None:
+    """Get deadline (time.monotonic based) for submit in the current context.
+
+    :return: deadline set by call_timeout or None if not set
+    :rtype: typing.Optional[float]
+    """
+    return _call_deadline.get()
+
+
+@contextlib.contextmanager
+def call_timeout(timeout: float | None) -> Iterator[None]:
+    """Set timeout for pool submissions in the context: work item not started before deadline is cancelled.
+
+    Nested contexts keep the earliest deadline.
+
+    :param timeout: time in seconds from now to start execution. If None: deadline is removed in the context.
+    :type timeout: typing.Optional[float]
+    """
+    deadline: float | None = None
+    if timeout is not None:
+        deadline = time.monotonic() + timeout
+        current: float | None = _call_deadline.get()
+        if current is not None:
+            deadline = min(deadline, current)
+    token = _call_deadline.set(deadline)
+    try:
+        yield
+    finally:
+        _call_deadline.reset(token)
+
+
+class WorkQueue:
+    """FIFO work queue with optional size limit.
+
+    Places for work items are reserved before put, so waiting for free place never holds executor locks.
+    Wake-up sentinels (None) are not limited and returned only if no work items left.
+    Cancelled work items are discarded by get, expired ones (reported by discard) are not counted in qsize.
+    """
+
+    __slots__ = (
+        "__expired",
+        "__expiring",
+        "__maxsize",
+        "__not_empty",
+        "__not_full",
+        "__reserved",
+        "__wakeups",
+        "_items",
+    )
+
+    def __init__(self, maxsize: int = 0) -> None:
+        """FIFO work queue with optional size limit.
+
+        :param maxsize: Maximum amount of queued work items. If 0: unlimited.
+        :type maxsize: int
+        :raises ValueError: maxsize is negative
+        """
+        if maxsize < 0:
+            raise ValueError("maxsize must not be negative")
+        self.__maxsize: int = maxsize
+        self.__wakeups: int = 0
+        self.__reserved: int = 0
+        # Futures of queued work items submitted with deadline and of expired ones, not removed from storage yet
+        self.__expiring: set[typing.Any] = set()
+        self.__expired: set[typing.Any] = set()
+        lock = threading.Lock()
+        self.__not_empty: threading.Condition = threading.Condition(lock)
+        self.__not_full: threading.Condition = threading.Condition(lock)
+        self._init()
+
+    # Storage: override in subclasses. Called under lock.
+    def _init(self) -> None:
+        """Initialize storage."""
+        self._items: typing.Any = collections.deque()
+
+    def _put(self, item: _WorkItem[typing.Any]) -> None:
+        """Put work item in storage."""
+        self._items.append(item)
+
+    def _get(self) -> _WorkItem[typing.Any]:
+        """Get next work item from storage."""
+        return self._items.popleft()  # type: ignore[no-any-return]
+
+    def _drop(self) -> _WorkItem[typing.Any]:
+        """Remove oldest work item from storage."""
+        return self._items.popleft()  # type: ignore[no-any-return]
+
+    def _purge(self) -> int:
+        """Remove work items with cancelled futures from storage.
+
+        :return: amount of removed work items
+        :rtype: int
+        """
+        size: int = len(self._items)
+        self._items = collections.deque(item for item in self._items if not item.future.cancelled())
+        return size - len(self._items)
+
+    @property
+    def maxsize(self) -> int:
+        """Maximum amount of queued work items. If 0: unlimited.
+
+        :rtype: int
+        """
+        return self.__maxsize
+
+    def qsize(self) -> int:
+        """Amount of queued work items, except expired ones.
+
+        :rtype: int
+        """
+        return len(self._items) - len(self.__expired)
+
+    def __forget(self, item: _WorkItem[typing.Any]) -> None:
+        """Stop tracking deadline of work item removed from storage. Should be called under lock."""
+        if self.__expiring or self.__expired:
+            self.__expiring.discard(item.future)
+            self.__expired.discard(item.future)
+
+    def __has_place(self) -> bool:
+        """Check for free place, dropping cancelled work items if full. Should be called under lock."""
+        if len(self._items) + self.__reserved < self.__maxsize:
+            return True
+        if not self._purge():
+            return False
+        # All cancelled work items are removed from storage
+        self.__expired.clear()
+        self.__expiring = {future for future in self.__expiring if not future.cancelled()}
+        return len(self._items) + self.__reserved < self.__maxsize
+
+    def reserve(self, timeout: float | None = 0) -> bool:
+        """Reserve place for the next work item in the limited queue.
+
+        :param timeout: Time to wait for free place. If None: wait forever.
+        :type timeout: typing.Optional[float]
+        :return: place is reserved
+        :rtype: bool
+        """
+        with self.__not_full:
+            if not self.__not_full.wait_for(self.__has_place, timeout):
+                return False
+            self.__reserved += 1
+            return True
+
+    def reserve_replace(self) -> tuple[bool, _WorkItem[typing.Any] | None]:
+        """Reserve place for the next work item in the limited queue, removing oldest item if queue is full.
+
+        :return: place is reserved and removed work item
+        :rtype: tuple[bool, typing.Optional[_WorkItem[typing.Any]]]
+        """
+        with self.__not_full:
+            if self.__has_place():
+                self.__reserved += 1
+                return True, None
+            if not self._items:  # All places are reserved by submitting threads
+                return False, None
+            self.__reserved += 1
+            dropped: _WorkItem[typing.Any] = self._drop()
+            self.__forget(dropped)
+            return True, dropped
+
+    def release(self) -> None:
+        """Release reserved place, if work item was not put."""
+        with self.__not_full:
+            self.__reserved -= 1
+            self.__not_full.notify()
+
+    def put(self, item: _WorkItem[typing.Any] | None, block: bool = True, timeout: float | None = None) -> None:
+        """Put work item (in reserved place for the limited queue) or wake-up sentinel.
+
+        :param item: work item or wake-up sentinel
+        :type item: typing.Optional[_WorkItem[typing.Any]]
+        :param block: not used, signature compatibility only
+        :type block: bool
+        :param timeout: not used, signature compatibility only
+        :type timeout: typing.Optional[float]
+        """
+        with self.__not_empty:
+            if item is None:
+                self.__wakeups += 1
+            else:
+                if self.__maxsize:
+                    self.__reserved -= 1
+                if _call_deadline.get() is not None:
+                    self.__expiring.add(item.future)
+                self._put(item)
+            self.__not_empty.notify()
+
+    def discard(self, future: typing.Any) -> None:
+        """Stop counting work item cancelled by deadline, it is removed from storage by get or on full queue.
+
+        :param future: cancelled future of the work item
+        :type future: typing.Any
+        """
+        with self.__not_full:
+            if future in self.__expiring:
+                self.__expiring.remove(future)
+                self.__expired.add(future)
+                self.__not_full.notify()
+
+    def __has_items(self) -> bool:
+        """Check for not expired work items or wake-up sentinels. Should be called under lock."""
+        return len(self._items) > len(self.__expired) or bool(self.__wakeups)
+
+    def get(self, block: bool = True, timeout: float | None = None) -> _WorkItem[typing.Any] | None:
+        """Get work item or wake-up sentinel.
+
+        :param block: wait for item
+        :type block: bool
+        :param timeout: time to wait. If None: wait forever
+        :type timeout: typing.Optional[float]
+        :return: work item or wake-up sentinel
+        :rtype: typing.Optional[_WorkItem[typing.Any]]
+        :raises queue.Empty: no items
+        """
+        discarded: list[_WorkItem[typing.Any]] = []
+        try:
+            with self.__not_empty:
+                while True:
+                    if not self.__not_empty.wait_for(self.__has_items, timeout if block else 0):
+                        raise queue.Empty
+                    while self._items:
+                        item: _WorkItem[typing.Any] = self._get()
+                        self.__forget(item)
+                        self.__not_full.notify()
+                        if not item.future.cancelled():
+                            return item
+                        discarded.append(item)
+                    if self.__wakeups:
+                        self.__wakeups -= 1
+                        return None
+        finally:
+            for item in discarded:
+                item.run()  # Cancelled work item only notifies waiters of its future
+
+    def get_nowait(self) -> _WorkItem[typing.Any] | None:
+        """Get work item or wake-up sentinel without wait.
+
+        :return: work item or wake-up sentinel
+        :rtype: typing.Optional[_WorkItem[typing.Any]]
+        """
+        return self.get(block=False)
+
+
+class PriorityWorkQueue(WorkQueue):
+    """Priority work queue with optional size limit.
+
+    Work item priority is taken from call_priority context on put. Lower value is executed first.
+    Work items with the same priority are executed in submission order.
+    """
+
+    __slots__ = ("__counter",)
+
+    def _init(self) -> None:
+        """Initialize storage."""
+        self._items: list[tuple[int, int, _WorkItem[typing.Any]]] = []
+        self.__counter: Iterator[int] = itertools.count()
+
+    def _put(self, item: _WorkItem[typing.Any]) -> None:
+        """Put work item in storage."""
+        heapq.heappush(self._items, (get_call_priority() or 0, next(self.__counter), item))
+
+    def _get(self) -> _WorkItem[typing.Any]:
+        """Get next work item from storage."""
+        return heapq.heappop(self._items)[2]
+
+    def _drop(self) -> _WorkItem[typing.Any]:
+        """Remove oldest work item with the lowest priority from storage."""
+        index = max(range(len(self._items)), key=lambda idx: (self._items[idx][0], -self._items[idx][1]))
+        entry = self._items[index]
+        self._items[index] = self._items[-1]
+        self._items.pop()
+        heapq.heapify(self._items)
+        return entry[2]
+
+    def _purge(self) -> int:
+        """Remove work items with cancelled futures from storage.
+
+        :return: amount of removed work items
+        :rtype: int
+        """
+        size: int = len(self._items)
+        self._items = [entry for entry in self._items if not entry[2].future.cancelled()]
+        heapq.heapify(self._items)
+        return size - len(self._items)
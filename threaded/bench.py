@@ -0,0 +1,435 @@
+#    Copyright 2017 - 2020 Alexey Stepanov aka penguinolog
+##
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+
+#         http://www.apache.org/licenses/LICENSE-2.0
+
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Benchmark suite for ThreadPooled, Threaded and AsyncIOTask with JSON output and baseline comparison.
+
+Measures per-call overhead, throughput by pool size, coroutine in thread cost, AsyncIOTask creation cost
+and memory of outstanding futures. Save results of one build and compare another build against them:
+
+    python -m threaded.bench --json baseline.json
+    python -m threaded.bench --baseline baseline.json --tolerance 0.2
+
+Exit code is 1 if any result is worse than baseline by more than tolerance.
+"""
+
+from __future__ import annotations
+
+# Standard Library
+import argparse
+import asyncio
+import concurrent.futures
+import json
+import pathlib
+import platform
+import sys
+import threading
+import time
+import tracemalloc
+import typing
+
+# Package Implementation
+from . import _asynciotask
+from . import _threaded
+from . import _threadpooled
+
+if typing.TYPE_CHECKING:
+    from collections.abc import Callable
+    from collections.abc import Iterable
+    from collections.abc import Sequence
+
+__all__ = ("BENCHMARKS", "Comparison", "Measurement", "compare", "environment", "main", "run")
+
+_POOL = "threaded.bench"
+POOL_SIZES: tuple[int, ...] = (1, 4, 16)
+
+
+class Measurement(typing.NamedTuple):
+    """Single benchmark result."""
+
+    name: str
+    value: float
+    unit: str
+    higher_is_better: bool = False
+
+
+class Comparison(typing.NamedTuple):
+    """Benchmark result compared with baseline."""
+
+    name: str
+    unit: str
+    baseline: float
+    current: float
+    change: float  # Relative change of the value: (current - baseline) / baseline
+    regression: bool  # Result is worse than baseline by more than tolerance
+
+
+def _noop(value: int) -> int:
+    """Call without work: decorator overhead only.
+
+    :param value: value to return
+    :type value: int
+    :return: value
+    :rtype: int
+    """
+    return value
+
+
+async def _async_noop(value: int) -> int:
+    """Coroutine without work: decorator overhead only.
+
+    :param value: value to return
+    :type value: int
+    :return: value
+    :rtype: int
+    """
+    return value
+
+
+def _elapsed_ns(start: int, calls: int) -> float:
+    """Nanoseconds per call since start.
+
+    :param start: time.perf_counter_ns() at start
+    :type start: int
+    :param calls: amount of calls
+    :type calls: int
+    :return: nanoseconds per call
+    :rtype: float
+    """
+    return (time.perf_counter_ns() - start) / calls
+
+
+def bench_threadpooled_overhead(calls: int) -> list[Measurement]:
+    """Measure ThreadPooled submit cost and sequential call round trip with single worker.
+
+    :param calls: amount of calls
+    :type calls: int
+    :return: measurements
+    :rtype: list[Measurement]
+    """
+    _threadpooled.ThreadPooled.configure(max_workers=1, pool=_POOL)
+    func = _threadpooled.threadpooled(_noop, pool=_POOL)
+    try:
+        start = time.perf_counter_ns()
+        futures = [func(value) for value in range(calls)]
+        submit = _elapsed_ns(start, calls)
+        concurrent.futures.wait(futures)
+
+        start = time.perf_counter_ns()
+        for value in range(calls):
+            func(value).result()
+        round_trip = _elapsed_ns(start, calls)
+    finally:
+        _threadpooled.ThreadPooled.shutdown(pool=_POOL)
+    return [
+        Measurement("threadpooled.submit", submit, "ns/call"),
+        Measurement("threadpooled.round_trip", round_trip, "ns/call"),
+    ]
+
+
+def bench_threadpooled_throughput(calls: int) -> list[Measurement]:
+    """Measure ThreadPooled throughput of the burst of calls for each pool size.
+
+    :param calls: amount of calls
+    :type calls: int
+    :return: measurements
+    :rtype: list[Measurement]
+    """
+    result: list[Measurement] = []
+    for workers in POOL_SIZES:
+        _threadpooled.ThreadPooled.configure(max_workers=workers, pool=_POOL)
+        func = _threadpooled.threadpooled(_noop, pool=_POOL)
+        try:
+            start = time.perf_counter()
+            concurrent.futures.wait([func(value) for value in range(calls)])
+            elapsed = time.perf_counter() - start
+        finally:
+            _threadpooled.ThreadPooled.shutdown(pool=_POOL)
+        result.append(Measurement(f"threadpooled.throughput[workers={workers}]", calls / elapsed, "calls/s", True))
+    return result
+
+
+def bench_threadpooled_coroutine(calls: int) -> list[Measurement]:
+    """Measure coroutine function executed in the pool: new event loop per call and persistent for the worker.
+
+    :param calls: amount of calls
+    :type calls: int
+    :return: measurements
+    :rtype: list[Measurement]
+    """
+    result: list[Measurement] = []
+    for reuse_loop in (False, True):
+        _threadpooled.ThreadPooled.configure(max_workers=1, pool=_POOL)
+        func = _threadpooled.threadpooled(_async_noop, pool=_POOL, reuse_loop=reuse_loop)
+        try:
+            start = time.perf_counter_ns()
+            concurrent.futures.wait([func(value) for value in range(calls)])
+            elapsed = _elapsed_ns(start, calls)
+        finally:
+            _threadpooled.ThreadPooled.shutdown(pool=_POOL)
+        name = "threadpooled.coroutine[reuse_loop]" if reuse_loop else "threadpooled.coroutine"
+        result.append(Measurement(name, elapsed, "ns/call"))
+    return result
+
+
+def bench_threaded(calls: int) -> list[Measurement]:
+    """Measure Threaded thread creation, start and join. Thread per call is expensive: calls are reduced.
+
+    :param calls: amount of calls
+    :type calls: int
+    :return: measurements
+    :rtype: list[Measurement]
+    """
+    calls = max(calls // 20, 1)
+    func = _threaded.threaded(_noop, started=True)
+    start = time.perf_counter_ns()
+    for value in range(calls):
+        func(value).join()
+    return [Measurement("threaded.start_join", _elapsed_ns(start, calls), "ns/call")]
+
+
+def bench_asynciotask(calls: int) -> list[Measurement]:
+    """Measure AsyncIOTask task creation and creation with completion in the running event loop.
+
+    :param calls: amount of calls
+    :type calls: int
+    :return: measurements
+    :rtype: list[Measurement]
+    """
+    loop = asyncio.new_event_loop()
+    func = _asynciotask.asynciotask(_async_noop, loop_getter=loop)
+
+    async def run() -> tuple[float, float]:
+        """Create tasks and wait for completion.
+
+        :return: nanoseconds per task creation and per task creation with completion
+        :rtype: tuple[float, float]
+        """
+        start = time.perf_counter_ns()
+        tasks = [func(value) for value in range(calls)]
+        create = _elapsed_ns(start, calls)
+        await asyncio.gather(*tasks)
+        return create, _elapsed_ns(start, calls)
+
+    try:
+        create, complete = loop.run_until_complete(run())
+    finally:
+        loop.close()
+    return [
+        Measurement("asynciotask.create", create, "ns/call"),
+        Measurement("asynciotask.complete", complete, "ns/call"),
+    ]
+
+
+def bench_memory(calls: int) -> list[Measurement]:
+    """Measure peak memory per outstanding future: worker is blocked, so all submitted calls stay queued.
+
+    :param calls: amount of outstanding futures
+    :type calls: int
+    :return: measurements
+    :rtype: list[Measurement]
+    """
+    result: list[Measurement] = []
+    for compact_futures in (False, True):
+        gate = threading.Event()
+        _threadpooled.ThreadPooled.configure(max_workers=1, pool=_POOL, compact_futures=compact_futures)
+        func = _threadpooled.threadpooled(_noop, pool=_POOL)
+        blocker = _threadpooled.threadpooled(gate.wait, pool=_POOL)()
+        try:
+            tracemalloc.start()
+            try:
+                futures = [func(value) for value in range(calls)]
+                _, peak = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+            gate.set()
+            concurrent.futures.wait([blocker, *futures])
+        finally:
+            gate.set()
+            _threadpooled.ThreadPooled.shutdown(pool=_POOL)
+        name = "threadpooled.memory[compact_futures]" if compact_futures else "threadpooled.memory"
+        result.append(Measurement(name, peak / calls, "bytes/future"))
+    return result
+
+
+BENCHMARKS: dict[str, Callable[[int], list[Measurement]]] = {
+    "threadpooled.overhead": bench_threadpooled_overhead,
+    "threadpooled.throughput": bench_threadpooled_throughput,
+    "threadpooled.coroutine": bench_threadpooled_coroutine,
+    "threaded": bench_threaded,
+    "asynciotask": bench_asynciotask,
+    "memory": bench_memory,
+}
+
+
+def environment() -> dict[str, typing.Any]:
+    """Describe interpreter and build: results of different builds are not comparable as is.
+
+    :return: environment description
+    :rtype: dict[str, typing.Any]
+    """
+    compiled: bool = not _threadpooled.__file__.endswith(".py")
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "build": "cython" if compiled else "python",
+        "threaded": getattr(sys.modules[__package__], "__version__", None),  # Missing in source checkout
+    }
+
+
+def run(
+    calls: int,
+    repeat: int = 3,
+    names: Iterable[str] | None = None,
+) -> dict[str, Measurement]:
+    """Run benchmarks and keep the best result of each measurement.
+
+    :param calls: amount of calls per measurement
+    :type calls: int
+    :param repeat: runs of each benchmark
+    :type repeat: int
+    :param names: benchmarks to run. If None: all.
+    :type names: typing.Optional[Iterable[str]]
+    :return: measurement name to the best measurement
+    :rtype: dict[str, Measurement]
+    :raises KeyError: unknown benchmark name
+    """
+    selected = tuple(BENCHMARKS) if names is None else tuple(names)
+    best: dict[str, Measurement] = {}
+    for name in selected:
+        benchmark = BENCHMARKS[name]
+        for _ in range(repeat):
+            for measurement in benchmark(calls):
+                known: Measurement | None = best.get(measurement.name)
+                if (
+                    known is None
+                    or (measurement.higher_is_better and measurement.value > known.value)
+                    or (not measurement.higher_is_better and measurement.value < known.value)
+                ):
+                    best[measurement.name] = measurement
+    return best
+
+
+def compare(
+    current: dict[str, Measurement],
+    baseline: dict[str, Measurement],
+    tolerance: float,
+) -> list[Comparison]:
+    """Compare measurements present in both results.
+
+    :param current: measurements to check
+    :type current: dict[str, Measurement]
+    :param baseline: reference measurements
+    :type baseline: dict[str, Measurement]
+    :param tolerance: allowed relative degradation, 0.2 for 20%
+    :type tolerance: float
+    :return: comparisons in order of current measurements
+    :rtype: list[Comparison]
+    """
+    result: list[Comparison] = []
+    for name, measurement in current.items():
+        reference: Measurement | None = baseline.get(name)
+        if reference is None or reference.value == 0:
+            continue
+        change: float = (measurement.value - reference.value) / reference.value
+        worse: float = -change if measurement.higher_is_better else change
+        result.append(Comparison(name, measurement.unit, reference.value, measurement.value, change, worse > tolerance))
+    return result
+
+
+def _dump(measurements: dict[str, Measurement], calls: int, repeat: int) -> dict[str, typing.Any]:
+    """Convert results to JSON compatible document.
+
+    :param measurements: results
+    :type measurements: dict[str, Measurement]
+    :param calls: amount of calls per measurement
+    :type calls: int
+    :param repeat: runs of each benchmark
+    :type repeat: int
+    :return: JSON compatible document
+    :rtype: dict[str, typing.Any]
+    """
+    return {
+        "environment": environment(),
+        "calls": calls,
+        "repeat": repeat,
+        "results": {
+            name: {"value": item.value, "unit": item.unit, "higher_is_better": item.higher_is_better}
+            for name, item in measurements.items()
+        },
+    }
+
+
+def _load(document: dict[str, typing.Any]) -> dict[str, Measurement]:
+    """Read results from JSON document.
+
+    :param document: document produced by `--json`
+    :type document: dict[str, typing.Any]
+    :return: results
+    :rtype: dict[str, Measurement]
+    """
+    return {
+        name: Measurement(name, float(item["value"]), item["unit"], bool(item["higher_is_better"]))
+        for name, item in document["results"].items()
+    }
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run benchmarks, print results and compare with baseline.
+
+    :param argv: command line arguments. If None: sys.argv.
+    :type argv: typing.Optional[Sequence[str]]
+    :return: exit code: 1 if regression found, else 0
+    :rtype: int
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m threaded.bench",
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("--calls", type=int, default=20000, help="calls per measurement")
+    parser.add_argument("--repeat", type=int, default=3, help="runs of each benchmark, best is reported")
+    parser.add_argument("--only", action="append", choices=tuple(BENCHMARKS), help="benchmark to run (repeatable)")
+    parser.add_argument("--json", metavar="PATH", help="write results as JSON, '-' for stdout")
+    parser.add_argument("--baseline", metavar="PATH", help="JSON results to compare with")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed relative degradation")
+    args = parser.parse_args(argv)
+
+    measurements = run(args.calls, args.repeat, args.only)
+    document = _dump(measurements, args.calls, args.repeat)
+    report = sys.stderr if args.json == "-" else sys.stdout
+    text: str = json.dumps(document, indent=2) + "\n"
+    if args.json == "-":
+        sys.stdout.write(text)
+    elif args.json:
+        pathlib.Path(args.json).write_text(text, encoding="utf-8")
+
+    print(", ".join(f"{key}: {value}" for key, value in document["environment"].items()), file=report)
+    if not args.baseline:
+        for item in measurements.values():
+            print(f"{item.name:<40}{item.value:>16.1f} {item.unit}", file=report)
+        return 0
+
+    baseline_document = json.loads(pathlib.Path(args.baseline).read_text(encoding="utf-8"))
+    baseline_build = baseline_document.get("environment", {}).get("build")
+    print(f"baseline: {args.baseline} ({baseline_build} build), tolerance: {args.tolerance:.0%}", file=report)
+    comparisons = compare(measurements, _load(baseline_document), args.tolerance)
+    for name, unit, reference, value, change, regression in comparisons:
+        mark = "REGRESSION" if regression else ""
+        print(f"{name:<40}{reference:>16.1f}{value:>16.1f} {unit:<14}{change:>+8.1%} {mark}", file=report)
+    return 1 if any(comparison.regression for comparison in comparisons) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -18,4 +18,5 @@
 cdef class BaseDecorator:
     cdef:
         readonly object _func
+        object _wrapper
         dict __dict__
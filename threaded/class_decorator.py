@@ -20,7 +20,10 @@ from __future__ import annotations
 import abc
 import asyncio
 import functools
+import threading
+import types
 import typing
+import weakref
 
 if typing.TYPE_CHECKING:
     from collections.abc import Awaitable
@@ -33,14 +36,44 @@ if typing.TYPE_CHECKING:
 __all__ = ("BaseDecorator",)
 
 
+class _ThreadLoop:
+    """Event loop owned by the thread.
+
+    Loop is closed, when thread local storage is cleaned up (on thread exit).
+    """
+
+    __slots__ = ("__weakref__", "loop")
+
+    def __init__(self) -> None:
+        """Create event loop and register close on cleanup."""
+        self.loop: asyncio.AbstractEventLoop = asyncio.new_event_loop()
+        # Loop may be running in daemon thread during interpreter exit
+        weakref.finalize(self, self.loop.close).atexit = False
+
+
+_thread_loops = threading.local()
+
+
+def _get_thread_loop() -> asyncio.AbstractEventLoop:
+    """Get event loop bound to the current thread, create if not exists.
+
+    :return: event loop for coroutines execution in the current thread
+    :rtype: asyncio.AbstractEventLoop
+    """
+    thread_loop: _ThreadLoop | None = getattr(_thread_loops, "thread_loop", None)
+    if thread_loop is None or thread_loop.loop.is_closed():
+        thread_loop = _thread_loops.thread_loop = _ThreadLoop()
+    return thread_loop.loop
+
+
 class BaseDecorator(abc.ABC):
     """Base class for decorators.
 
     Implements wrapping and __call__, wrapper getter is abstract.
 
     Note:
-        wrapper getter is called only on function call,
-        if decorator used without braces.
+        wrapper getter is called only on first function call,
+        if decorator used without braces. Built wrapper is cached for next calls.
 
     Usage example:
 
@@ -59,6 +92,8 @@ class BaseDecorator(abc.ABC):
     >>> func_no_init()
     Wrapping: func_no_init
     call_function: func_no_init
+    >>> func_no_init()
+    call_function: func_no_init
     >>> isinstance(func_no_init, TestDecorator)
     True
     >>> func_no_init._func is func_no_init.__wrapped__
@@ -73,6 +108,22 @@ class BaseDecorator(abc.ABC):
     >>> isinstance(func_init, TestDecorator)
     False
 
+    Decorator used without braces is bound to the instance as regular method:
+
+    >>> class Target:
+    ...     @TestDecorator
+    ...     def method(self):
+    ...         return self
+    >>> target = Target()
+    >>> target.method() is target
+    Wrapping: method
+    call_function: method
+    True
+    >>> isinstance(Target.method, TestDecorator)
+    True
+
+    Bound wrapper is created on access, as regular bound method: it is not cached in the instance,
+    because cached bound wrapper is shared by the instance copies and breaks instance pickling.
     """
 
     def __init__(
@@ -87,6 +138,7 @@ class BaseDecorator(abc.ABC):
         # noinspection PyArgumentList
         super().__init__()
         self.__func: None | (Callable[..., Awaitable[typing.Any] | typing.Any]) = func
+        self.__wrapper: Callable[..., typing.Any] | None = None
         if self.__func is not None:
             functools.update_wrapper(self, self.__func)
 
@@ -120,22 +172,51 @@ class BaseDecorator(abc.ABC):
         :return: result of decorated function or result getter
         :rtype: Any
         """
-        l_args: list[typing.Any] = list(args)
+        if self.__func is None:
+            # Decorator with braces: the only positional argument is the function to wrap
+            return self._get_function_wrapper(args[0])
 
-        if self._func:
-            wrapped: Callable[..., Awaitable[typing.Any] | typing.Any] = self._func
-        else:
-            wrapped = l_args.pop(0)
+        wrapper: Callable[..., typing.Any] | None = self.__wrapper
+        if wrapper is None:
+            wrapper = self.__wrapper = self._get_function_wrapper(self.__func)
+        return wrapper(*args, **kwargs)
 
-        wrapper: Callable[..., typing.Any] = self._get_function_wrapper(wrapped)
-        if self.__func:
-            return wrapper(*l_args, **kwargs)
-        return wrapper
+    def __get__(self, instance: typing.Any, owner: type[typing.Any] | None = None) -> typing.Any:
+        """Bind wrapper to the instance if used as method decorator without braces.
+
+        :return: bound wrapper or decorator itself if accessed from class or function is not set
+        :rtype: Any
+        """
+        if instance is None or self.__func is None:
+            return self
+        wrapper: Callable[..., typing.Any] | None = self.__wrapper
+        if wrapper is None:
+            wrapper = self.__wrapper = self._get_function_wrapper(self.__func)
+        return self._bind_wrapper(wrapper, instance)
+
+    def _bind_wrapper(self, wrapper: Callable[..., typing.Any], instance: typing.Any) -> typing.Any:
+        """Bind built wrapper to the instance.
+
+        :param wrapper: wrapper built by _get_function_wrapper
+        :type wrapper: Callable[..., typing.Any]
+        :param instance: instance to bind
+        :type instance: typing.Any
+        :return: bound method
+        :rtype: Any
+        """
+        return types.MethodType(wrapper, instance)
 
     @staticmethod
-    def _await_if_required(target: Callable[Spec, Awaitable[typing.Any] | typing.Any]) -> Callable[Spec, typing.Any]:
+    def _await_if_required(
+        target: Callable[Spec, Awaitable[typing.Any] | typing.Any],
+        reuse_loop: bool = False,
+    ) -> Callable[Spec, typing.Any]:
         """Await result if coroutine was returned.
 
+        :param target: function to call
+        :type target: Callable[Spec, Awaitable[typing.Any] | typing.Any]
+        :param reuse_loop: Await in event loop persistent for the thread instead of new loop per call
+        :type reuse_loop: bool
         :return: function, which will await for result if it's required
         :rtype: Callable[..., Any]
         """
@@ -149,6 +230,8 @@ class BaseDecorator(abc.ABC):
             """
             result = target(*args, **kwargs)
             if asyncio.iscoroutine(result):
+                if reuse_loop:
+                    return _get_thread_loop().run_until_complete(result)
                 loop = asyncio.new_event_loop()
                 result = loop.run_until_complete(result)
                 loop.close()
@@ -17,17 +17,52 @@
 # Standard Library
 import asyncio
 import functools
+import threading
+import types
 import typing
+import weakref
 
 __all__ = ("BaseDecorator",)
 
 
+class _ThreadLoop:
+    """Event loop owned by the thread.
+
+    Loop is closed, when thread local storage is cleaned up (on thread exit).
+    """
+
+    __slots__ = ("__weakref__", "loop")
+
+    def __init__(self) -> None:
+        """Create event loop and register close on cleanup."""
+        self.loop = asyncio.new_event_loop()
+        # Loop may be running in daemon thread during interpreter exit
+        weakref.finalize(self, self.loop.close).atexit = False
+
+
+_thread_loops = threading.local()
+
+
+def _get_thread_loop():  # type: () -> asyncio.AbstractEventLoop
+    """Get event loop bound to the current thread, create if not exists.
+
+    :return: event loop for coroutines execution in the current thread
+    :rtype: asyncio.AbstractEventLoop
+    """
+    thread_loop = getattr(_thread_loops, "thread_loop", None)
+    if thread_loop is None or thread_loop.loop.is_closed():
+        thread_loop = _thread_loops.thread_loop = _ThreadLoop()
+    return thread_loop.loop
+
+
 cdef class BaseDecorator:
     """Base class for decorators.
 
     Implements wrapping and __call__, wrapper getter is abstract.
 
-    .. note:: wrapper getter is called only on function call, if decorator used without braces.
+    .. note:: wrapper getter is called only on first function call, if decorator used without braces.
+              Built wrapper is cached for next calls.
+              Bound wrapper is created on access, as regular bound method: it is not cached in the instance.
     """
 
     def __init__(self, func: typing.Optional[typing.Callable] = None) -> None:
@@ -40,6 +75,7 @@ cdef class BaseDecorator:
         super().__init__()
         # pylint: disable=assigning-non-slot
         self._func = func  # type: typing.Optional[typing.Callable]
+        self._wrapper = None  # type: typing.Optional[typing.Callable]
         if self._func is not None:
             functools.update_wrapper(self, self._func)
         # pylint: enable=assigning-non-slot
@@ -59,17 +95,37 @@ cdef class BaseDecorator:
         :return: result of decorated function or result getter
         :rtype: Any
         """
-        cdef list l_args = list(args)
+        if self._func is None:
+            # Decorator with braces: the only positional argument is the function to wrap
+            return self._get_function_wrapper(args[0])
 
-        if self._func:
-            wrapped = self._func  # type: typing.Callable
-        else:
-            wrapped = l_args.pop(0)
+        if self._wrapper is None:
+            self._wrapper = self._get_function_wrapper(self._func)
+        return self._wrapper(*args, **kwargs)
 
-        wrapper = self._get_function_wrapper(wrapped)
-        if self._func:
-            return wrapper(*l_args, **kwargs)
-        return wrapper
+    def __get__(self, instance: typing.Any, owner: typing.Optional[type]) -> typing.Any:
+        """Bind wrapper to the instance if used as method decorator without braces.
+
+        :return: bound wrapper or decorator itself if accessed from class or function is not set
+        :rtype: Any
+        """
+        if instance is None or self._func is None:
+            return self
+        if self._wrapper is None:
+            self._wrapper = self._get_function_wrapper(self._func)
+        return self._bind_wrapper(self._wrapper, instance)
+
+    def _bind_wrapper(self, wrapper: typing.Callable, instance: typing.Any) -> typing.Any:
+        """Bind built wrapper to the instance.
+
+        :param wrapper: wrapper built by _get_function_wrapper
+        :type wrapper: typing.Callable
+        :param instance: instance to bind
+        :type instance: typing.Any
+        :return: bound method
+        :rtype: Any
+        """
+        return types.MethodType(wrapper, instance)
 
     def __repr__(self) -> str:
         """For debug purposes.
@@ -81,10 +137,15 @@ cdef class BaseDecorator:
 
     @staticmethod
     def _await_if_required(
-        target: typing.Callable[..., typing.Union["typing.Awaitable", typing.Any]]
+        target: typing.Callable[..., typing.Union["typing.Awaitable", typing.Any]],
+        bint reuse_loop=False,
     ) -> typing.Callable[..., typing.Any]:
         """Await result if coroutine was returned.
 
+        :param target: function to call
+        :type target: typing.Callable[..., typing.Union[typing.Awaitable, typing.Any]]
+        :param reuse_loop: Await in event loop persistent for the thread instead of new loop per call
+        :type reuse_loop: bool
         :return: function, which will await for result if it's required
         :rtype: Callable[..., Any]
         """
@@ -98,6 +159,8 @@ cdef class BaseDecorator:
             """
             result = target(*args, **kwargs)
             if asyncio.iscoroutine(result):
+                if reuse_loop:
+                    return _get_thread_loop().run_until_complete(result)
                 loop = asyncio.new_event_loop()
                 result = loop.run_until_complete(result)
                 loop.close()
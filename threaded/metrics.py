@@ -0,0 +1,173 @@
+#    Copyright 2017 - 2020 Alexey Stepanov aka penguinolog
+##
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+
+#         http://www.apache.org/licenses/LICENSE-2.0
+
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Prometheus text exposition format exporter for ThreadPooled pools and instrumented functions.
+
+Pool metrics are labelled by pool name, function metrics (collected if instrumentation is enabled)
+by qualified function name. Optional HTTP endpoint is served by the background daemon thread.
+"""
+
+from __future__ import annotations
+
+# Standard Library
+import http.server
+import typing
+
+# Package Implementation
+from . import _instrumentation
+from . import _threaded
+from . import _threadpooled
+
+if typing.TYPE_CHECKING:
+    from collections.abc import Iterator
+
+__all__ = ("CONTENT_TYPE", "render", "start_http_server")
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Histogram bucket bounds: powers of 4 nanoseconds from ~1 microsecond to ~69 seconds.
+# Bounds match the instrumentation histogram buckets bounds, so exported counts are exact.
+HISTOGRAM_BOUNDS: tuple[float, ...] = tuple((1 << power) / 1e9 for power in range(10, 37, 2))
+
+_POOL_METRICS: tuple[tuple[str, str, str, str], ...] = (
+    ("threaded_pool_max_workers", "gauge", "Maximum workers of the pool.", "max_workers"),
+    ("threaded_pool_workers", "gauge", "Running workers of the pool.", "worker_count"),
+    ("threaded_pool_active_workers", "gauge", "Workers executing work items.", "active_count"),
+    ("threaded_pool_queue_size", "gauge", "Work items queued and not picked by workers yet.", "queue_size"),
+    ("threaded_pool_submitted_total", "counter", "Work items put in the work queue.", "submitted_count"),
+    ("threaded_pool_completed_total", "counter", "Executed work items, including failed.", "completed_count"),
+    ("threaded_pool_failed_total", "counter", "Work items completed by exception.", "failed_count"),
+    ("threaded_pool_expired_total", "counter", "Work items cancelled by deadline before start.", "expired_count"),
+)
+
+_FUNCTION_METRICS: tuple[tuple[str, str, str, str], ...] = (
+    ("threaded_function_calls_total", "counter", "Completed calls of the function.", "calls"),
+    ("threaded_function_exceptions_total", "counter", "Calls completed by exception.", "exceptions"),
+    ("threaded_function_in_flight", "gauge", "Started and not completed calls.", "in_flight"),
+)
+
+_FUNCTION_HISTOGRAMS: tuple[tuple[str, str, str], ...] = (
+    ("threaded_function_queue_wait_seconds", "Time between call and start of execution.", "queue_wait"),
+    ("threaded_function_run_time_seconds", "Execution time.", "run_time"),
+)
+
+
+def _escape(value: str) -> str:
+    """Escape label value.
+
+    :param value: label value
+    :type value: str
+    :return: escaped value
+    :rtype: str
+    """
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _render_histogram(name: str, labels: str, histogram: _instrumentation.Histogram) -> Iterator[str]:
+    """Render histogram samples with cumulative buckets.
+
+    :param name: metric name
+    :type name: str
+    :param labels: rendered labels without braces
+    :type labels: str
+    :param histogram: instrumentation histogram
+    :type histogram: Histogram
+    :return: sample lines
+    :rtype: Iterator[str]
+    """
+    buckets: tuple[tuple[float, int], ...] = histogram.buckets()
+    total: float = histogram.total
+    cumulative: int = 0
+    index: int = 0
+    for bound in HISTOGRAM_BOUNDS:
+        while index < len(buckets) and buckets[index][0] <= bound:
+            cumulative += buckets[index][1]
+            index += 1
+        yield f'{name}_bucket{{{labels},le="{bound!r}"}} {cumulative}'
+    count: int = sum(bucket_count for _, bucket_count in buckets)  # Consistent with the buckets snapshot
+    yield f'{name}_bucket{{{labels},le="+Inf"}} {count}'
+    yield f"{name}_sum{{{labels}}} {total!r}"
+    yield f"{name}_count{{{labels}}} {count}"
+
+
+def _render_lines() -> Iterator[str]:
+    """Render metrics lines.
+
+    :return: metrics lines
+    :rtype: Iterator[str]
+    """
+    pools: dict[str, _threadpooled.ThreadPoolExecutor] = _threadpooled.ThreadPooled.pools()
+    for name, kind, help_text, attribute in _POOL_METRICS:
+        yield f"# HELP {name} {help_text}"
+        yield f"# TYPE {name} {kind}"
+        for pool, executor in sorted(pools.items()):
+            yield f'{name}{{pool="{_escape(pool)}"}} {getattr(executor, attribute)}'
+
+    functions: dict[str, _instrumentation.FunctionStats] = _instrumentation.instrumentation.stats()
+    for name, kind, help_text, attribute in _FUNCTION_METRICS:
+        yield f"# HELP {name} {help_text}"
+        yield f"# TYPE {name} {kind}"
+        for function, stats in sorted(functions.items()):
+            yield f'{name}{{function="{_escape(function)}"}} {getattr(stats, attribute)}'
+    for name, help_text, attribute in _FUNCTION_HISTOGRAMS:
+        yield f"# HELP {name} {help_text}"
+        yield f"# TYPE {name} histogram"
+        for function, stats in sorted(functions.items()):
+            yield from _render_histogram(name, f'function="{_escape(function)}"', getattr(stats, attribute))
+
+
+def render() -> str:
+    """Render metrics of ThreadPooled pools and instrumented functions in Prometheus text exposition format.
+
+    :return: metrics text
+    :rtype: str
+    """
+    return "\n".join(_render_lines()) + "\n"
+
+
+class _MetricsHandler(http.server.BaseHTTPRequestHandler):
+    """Serve metrics on GET request."""
+
+    def do_GET(self) -> None:  # pylint: disable=invalid-name
+        """Send metrics for `/metrics` and `/` paths."""
+        if self.path.split("?", 1)[0] not in {"/", "/metrics"}:
+            self.send_error(404)
+            return
+        body: bytes = render().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: typing.Any) -> None:  # noqa: A002  # pylint: disable=redefined-builtin
+        """Do not log requests."""
+
+
+def start_http_server(port: int = 0, addr: str = "127.0.0.1") -> http.server.ThreadingHTTPServer:
+    """Start HTTP endpoint for metrics in the background daemon thread.
+
+    Stop by `server.shutdown()` and `server.server_close()`.
+
+    :param port: port to listen. If 0: any free port, available from `server.server_address`.
+    :type port: int
+    :param addr: address to listen
+    :type addr: str
+    :return: running HTTP server
+    :rtype: http.server.ThreadingHTTPServer
+    """
+    server = http.server.ThreadingHTTPServer((addr, port), _MetricsHandler)
+    server.daemon_threads = True
+    _threaded.threaded(server.serve_forever, daemon=True, started=True)()
+    return server